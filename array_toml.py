@@ -7,6 +7,8 @@ class Array:
     Contains a list of Values
     Example: Array: [Value('integer', 1), Value('integer', 2), Value('string', "hello")]
     """
+    __slots__ = ('value_list',)
+
     def __init__(self, value_list: [Value]):
         self.value_list = value_list
 
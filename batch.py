@@ -0,0 +1,95 @@
+import glob
+import os
+import time
+from concurrent.futures import ProcessPoolExecutor
+from functools import partial
+from parser_toml import Parser
+from worker import init_worker, worker_parser
+
+
+def expand_paths(patterns):
+    """
+    Expands files, directories (searched recursively for .toml files) and glob patterns
+    :param patterns: list of paths or glob patterns
+    :return: sorted list of file paths without duplicates
+    """
+    paths = set()
+    for pattern in patterns:
+        if os.path.isdir(pattern):
+            paths.update(glob.glob(os.path.join(pattern, '**', '*.toml'), recursive=True))
+        elif glob.has_magic(pattern):
+            paths.update(path for path in glob.glob(pattern, recursive=True) if os.path.isfile(path))
+        else:
+            paths.add(pattern)
+    return sorted(paths)
+
+
+def output_path(path, language, output_dir=None, root=None):
+    """
+    Returns the path of the translation of a file
+    :param path: path of the TOML file
+    :param language: output language, used as extension
+    :param output_dir: directory of the output tree, None to write next to the input
+    :param root: directory the input paths are relative to inside the output tree
+    """
+    base = os.path.splitext(path)[0] + '.' + language.lower()
+    if output_dir is None:
+        return base
+    return os.path.join(output_dir, os.path.relpath(base, root))
+
+
+def convert_file(paths):
+    """
+    Translates one file with the worker parser
+    :param paths: (source, target) tuple
+    :return: (source, None) on success or (source, error message) on failure
+    """
+    source, target = paths
+    parser = worker_parser()
+    try:
+        with open(source, 'r', encoding='utf-8') as f:
+            toml = f.read()
+        parser.translate(toml)
+
+        directory = os.path.dirname(target)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        if parser.translation_unit.binary:
+            with open(target, 'wb') as f:
+                parser.translation_unit.write_result(f)
+        else:
+            with open(target, 'w', encoding='utf-8') as f:
+                parser.translation_unit.write_result(f)
+    except Exception as e:
+        return source, f'{type(e).__name__}: {e}'
+    return source, None
+
+
+def convert_batch(patterns, language, output_dir=None, workers=None):
+    """
+    Translates many files in a pool of processes, each with its own warmed parser
+    A file that fails is reported without stopping the others
+    :param patterns: list of files, directories or glob patterns
+    :param language: output language
+    :param output_dir: directory of the output tree, None to write next to the inputs
+    :param workers: number of processes, defaults to the number of CPUs
+    :return: (number of converted files, list of (path, error message), seconds)
+    """
+    start = time.perf_counter()
+    sources = expand_paths(patterns)
+    if not sources:
+        return 0, [], time.perf_counter() - start
+
+    root = os.path.commonpath([os.path.dirname(os.path.abspath(source)) for source in sources])
+    jobs = [(source, output_path(os.path.abspath(source), language, output_dir, root)) for source in sources]
+
+    failures = []
+    workers = workers or os.cpu_count() or 1
+    with ProcessPoolExecutor(workers, initializer=init_worker,
+                             initargs=(partial(Parser, language, builder=True),)) as executor:
+        chunksize = max(1, min(64, len(jobs) // (workers * 4)))
+        for source, error in executor.map(convert_file, jobs, chunksize=chunksize):
+            if error is not None:
+                failures.append((source, error))
+
+    return len(jobs) - len(failures), failures, time.perf_counter() - start
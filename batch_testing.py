@@ -0,0 +1,59 @@
+import json
+import os
+import tempfile
+import unittest
+from batch import convert_batch, expand_paths
+
+# Test data
+toml_valid = '''name = "Orange"
+[physical]
+color = "orange"'''
+dict_valid_expected = {'name': 'Orange', 'physical': {'color': 'orange'}}
+toml_invalid = 'key = = "value"'
+
+
+class BatchTestCase(unittest.TestCase):
+
+    def setUp(self):
+        self.directory = tempfile.TemporaryDirectory()
+        self.root = self.directory.name
+        self.files = {
+            'a.toml': toml_valid,
+            os.path.join('nested', 'b.toml'): toml_valid,
+            os.path.join('nested', 'bad.toml'): toml_invalid,
+        }
+        for name, content in self.files.items():
+            path = os.path.join(self.root, name)
+            os.makedirs(os.path.dirname(path), exist_ok=True)
+            with open(path, 'w') as f:
+                f.write(content)
+
+    def tearDown(self):
+        self.directory.cleanup()
+
+    def test_expand_paths(self):
+        expected = sorted(os.path.join(self.root, name) for name in self.files)
+        self.assertEqual(expected, expand_paths([self.root]))
+        self.assertEqual(expected, expand_paths([os.path.join(self.root, '**', '*.toml'), expected[0]]))
+
+    def test_convert_next_to_inputs(self):
+        converted, failures, _ = convert_batch([self.root], 'json', workers=2)
+        self.assertEqual(2, converted)
+        self.assertEqual([os.path.join(self.root, 'nested', 'bad.toml')], [path for path, _ in failures])
+        for name in ('a.json', os.path.join('nested', 'b.json')):
+            with open(os.path.join(self.root, name)) as f:
+                self.assertEqual(dict_valid_expected, json.load(f))
+
+    def test_convert_into_output_tree(self):
+        output_dir = os.path.join(self.root, 'out')
+        converted, failures, _ = convert_batch([os.path.join(self.root, 'a.toml'),
+                                                os.path.join(self.root, 'nested', 'b.toml')],
+                                               'json', output_dir=output_dir, workers=1)
+        self.assertEqual((2, []), (converted, failures))
+        with open(os.path.join(output_dir, 'nested', 'b.json')) as f:
+            self.assertEqual(dict_valid_expected, json.load(f))
+        self.assertTrue(os.path.exists(os.path.join(output_dir, 'a.json')))
+
+
+if __name__ == '__main__':
+    unittest.main()
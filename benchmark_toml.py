@@ -0,0 +1,722 @@
+import copy
+import datetime
+import io
+import json
+import os
+import subprocess
+import sys
+import tempfile
+import time
+import tracemalloc
+import parser_cache
+from batch import convert_batch
+from events import iter_events
+from incremental import IncrementalParser
+from interning import InternPool
+from parallel import parse_parallel
+from layers import load_layers, merge
+from lazy import LazyDocument
+from lexer_bytes import BytesLexer
+from lexer_fast import FastLexer
+from lexer_toml import Lexer
+from numeric import to_columns
+from parser_toml import Parser
+from query import evaluate, query
+from result_cache import ResultCache
+from snapshot import Snapshot
+from toml_loader import load, loads, to_json_lines
+from translator_json import JSONTranslator, get_dict, to_datetime, to_offset_date_time
+from translator_msgpack import unpackb
+from value import Value, INTEGER
+
+
+def measure(function, repeat=1):
+    """
+    Returns the average wall time of calling function repeat times
+    :param function: function without arguments
+    :param repeat: number of calls
+    :return: seconds per call
+    """
+    start = time.perf_counter()
+    for _ in range(repeat):
+        function()
+    return (time.perf_counter() - start) / repeat
+
+
+def report(name, seconds):
+    print(f'{name:<40} {seconds * 1e6:>14.1f} us')
+
+
+def bench_startup():
+    """
+    Parser construction time
+    Compares full table generation, loading the tables from the disk cache
+    and cloning the tables already built in this process
+    """
+    with tempfile.TemporaryDirectory() as directory:
+        os.environ[parser_cache.CACHE_DIR_ENV] = directory
+        report('uncached Parser(cache=False)', measure(lambda: Parser(cache=False), 5))
+
+        parser_cache.clear()
+        report('cold cache (build and store tables)', measure(lambda: Parser()))
+
+        def from_disk():
+            parser_cache.clear()
+            Parser()
+        report('disk cache (load tables)', measure(from_disk, 20))
+
+        report('warm cache (clone tables)', measure(lambda: Parser(), 10000))
+        del os.environ[parser_cache.CACHE_DIR_ENV]
+        parser_cache.clear()
+
+
+def sample_document(tables=10, keys=10):
+    """
+    Returns a small TOML document with the given number of tables and keys per table
+    """
+    lines = ['title = "sample"']
+    for table in range(tables):
+        lines.append(f'[table-{table}]')
+        for key in range(keys):
+            lines.append(f'key-{key} = {key}')
+        lines.append(f'values = [1, 2.5, "three", {{ x = 1 }}]')
+    return '\n'.join(lines)
+
+
+def bench_reuse():
+    """
+    Documents per second for a reused Parser versus a new Parser per document
+    """
+    document = sample_document()
+    parser = Parser()
+    for name, function, repeat in (
+            ('reused Parser', lambda: parser.parse(document), 2000),
+            ('new Parser per document', lambda: Parser().parse(document), 2000),
+            ('new Parser(cache=False) per document', lambda: Parser(cache=False).parse(document), 50)):
+        seconds = measure(function, repeat)
+        print(f'{name:<40} {1 / seconds:>14.0f} docs/s')
+
+
+def bench_scaling():
+    """
+    Parse time per item for growing numbers of top-level keys, array elements and inline table entries
+    """
+    parser = Parser()
+    for size in (1000, 10000, 100000, 1000000):
+        documents = (
+            ('top-level keys', '\n'.join(f'key{i} = {i}' for i in range(size))),
+            ('array elements', 'array = [' + ', '.join(str(i) for i in range(size)) + ']'),
+            ('inline table entries', 'inline = { ' + ', '.join(f'key{i} = {i}' for i in range(size)) + ' }'),
+        )
+        for name, document in documents:
+            report(f'{size:>8} {name} (per item)', measure(lambda: parser.parse(document)) / size)
+
+
+def large_document(records=10000):
+    """
+    Returns a large TOML document mixing tables, table arrays, arrays and inline tables
+    """
+    lines = ['[server]', 'host = "localhost"', 'ports = [8000, 8001, 8002]']
+    for record in range(records):
+        lines.append('[[records]]')
+        lines.append(f'id = {record}')
+        lines.append(f'name = "record {record}"')
+        lines.append(f'tags = ["a", "b", "c"]')
+        lines.append(f'point = {{ x = {record}, y = {record * 2}.5 }}')
+    return '\n'.join(lines)
+
+
+def traced(function):
+    """
+    Returns the wall time of calling function once and the tracemalloc peak in bytes of a second call
+    (measured separately because tracing slows the call down)
+    """
+    seconds = measure(function)
+    tracemalloc.start()
+    function()
+    peak = tracemalloc.get_traced_memory()[1]
+    tracemalloc.stop()
+    return seconds, peak
+
+
+def report_traced(name, seconds, peak):
+    print(f'{name:<40} {seconds * 1e3:>10.1f} ms {peak / 2 ** 20:>10.1f} MiB peak')
+
+
+def bench_builder():
+    """
+    Time and peak memory of the node list path versus the builder path
+    """
+    document = large_document()
+    for name, parser in (('node list', Parser()), ('builder', Parser(builder=True))):
+        report_traced(name, *traced(lambda: parser.parse(document)))
+
+
+def bench_loads():
+    """
+    In-process loading with loads() versus json.loads(Parser().parse())
+    """
+    document = large_document(2000)
+    report('json.loads(Parser().parse())', measure(lambda: json.loads(Parser().parse(document)), 3))
+    report('loads()', measure(lambda: loads(document), 3))
+
+
+def child_peak_rss(code):
+    """
+    Runs Python code in a fresh interpreter and returns its peak resident set size in bytes
+    """
+    script = code + '\nimport resource\nprint(resource.getrusage(resource.RUSAGE_SELF).ru_maxrss)'
+    output = subprocess.run([sys.executable, '-c', script], check=True, capture_output=True, text=True,
+                            cwd=os.path.dirname(os.path.abspath(__file__))).stdout
+    # ru_maxrss is in kilobytes on Linux
+    return int(output.split()[-1]) * 1024
+
+
+def bench_write():
+    """
+    Peak RSS of writing JSON with get_result versus the streaming write_result
+    """
+    with tempfile.TemporaryDirectory() as directory:
+        source = os.path.join(directory, 'large.toml')
+        with open(source, 'w') as f:
+            f.write(large_document(20000))
+        target = os.path.join(directory, 'output.json')
+        setup = (f'from parser_toml import Parser\n'
+                 f'parser = Parser(builder=True)\n'
+                 f'parser.translate(open({source!r}).read())\n')
+        modes = (
+            ('translate only', ''),
+            ('get_result', f'open({target!r}, "w").write(parser.translation_unit.get_result())'),
+            ('write_result', f'parser.translation_unit.write_result(open({target!r}, "w"))'),
+            ('write_result compact', f'parser.translation_unit.write_result(open({target!r}, "w"), '
+                                     f'indent=None, separators=(",", ":"))'),
+        )
+        for name, code in modes:
+            print(f'{name:<40} {child_peak_rss(setup + code) / 2 ** 20:>10.1f} MiB peak RSS')
+
+
+def bench_batch():
+    """
+    Files per second of the batch conversion for growing numbers of workers
+    """
+    with tempfile.TemporaryDirectory() as directory:
+        document = sample_document(5, 5)
+        for number in range(1000):
+            with open(os.path.join(directory, f'config{number}.toml'), 'w') as f:
+                f.write(document)
+        for workers in (1, 2, 4, 8):
+            converted, _, seconds = convert_batch([directory], 'json', workers=workers)
+            print(f'{workers} workers{"":<32} {converted / seconds:>14.0f} files/s')
+
+
+def count_tokens(lexer, document):
+    lexer.input(document)
+    count = 0
+    while lexer.token():
+        count += 1
+    return count
+
+
+def bench_lexer():
+    """
+    Tokens per second of the PLY lexer versus the hand-written FastLexer
+    """
+    document = large_document(5000)
+    for name, lexer, data in (('PLY Lexer', Lexer(), document), ('FastLexer', FastLexer(), document),
+                              ('BytesLexer', BytesLexer(), document.encode())):
+        count = count_tokens(lexer, data)
+        seconds = measure(lambda: count_tokens(lexer, data), 3)
+        print(f'{name:<40} {count / seconds:>14.0f} tokens/s')
+    for backend in ('ply', 'fast'):
+        parser = Parser(builder=True, lexer_backend=backend)
+        report(f'parse with {backend} lexer', measure(lambda: parser.parse(document), 3))
+
+
+class DictValue:
+    """
+    Value node with a per-instance __dict__, as the nodes were before using __slots__
+    """
+    def __init__(self, type_, value):
+        self.type = type_
+        self.value = value
+
+
+def allocated(function):
+    """
+    Returns the bytes still allocated after calling function, and its result
+    """
+    tracemalloc.start()
+    result = function()
+    size = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+    return size, result
+
+
+def bench_nodes():
+    """
+    Bytes per Value node with a per-instance __dict__ versus __slots__
+    """
+    count = 100000
+    texts = [str(number) for number in range(count)]
+    for name, node_class in (('__dict__ node', DictValue), ('__slots__ node', Value)):
+        size, _ = allocated(lambda: [node_class(INTEGER, text) for text in texts])
+        print(f'{name:<40} {size / count:>14.1f} bytes/node')
+
+    document = large_document(2000)
+    parser = Parser()
+    size, nodes = allocated(lambda: parser.parser.parse(document, lexer=parser.lexer))
+    print(f'{"node list of a 2000 record document":<40} {size / 2 ** 20:>14.1f} MiB')
+
+
+def bench_arrays():
+    """
+    Translation of numeric-array-heavy documents, converting element by element versus whole arrays
+    """
+    size = 200000
+    document = '\n'.join((
+        'integers = [' + ', '.join(str(number) for number in range(size)) + ']',
+        'floats = [' + ', '.join(f'{number}.5' for number in range(size)) + ']',
+        'strings = [' + ', '.join(f'"s{number}"' for number in range(size)) + ']',
+    ))
+    parser = Parser()
+    nodes = parser.parser.parse(document, lexer=parser.lexer)
+    translator = parser.translation_unit
+
+    for node in nodes:
+        array = node.value.value
+        report(f'{node.key_list[0].value.value} per element', measure(
+            lambda: [translator.translate_value(value) for value in array.value_list], 5))
+        report(f'{node.key_list[0].value.value} whole array', measure(lambda: translator.translate_array(array), 5))
+
+
+class WalkingTranslator(JSONTranslator):
+    """
+    JSONTranslator walking every dotted key prefix from the current table, as before resolve_prefix
+    """
+    def resolve_prefix(self, key_path, root):
+        return get_dict(key_path, root)
+
+
+def bench_paths():
+    """
+    Storing dotted keys sharing 1 to 5 key prefixes, walking every prefix versus resolve_prefix
+    """
+    for depth in (1, 2, 3, 5):
+        # 2000 tables of 10 dotted keys, as translated by the parser, e.g. level0.level1.key3 = 3
+        prefix = [f'level{level}' for level in range(depth)]
+        tables = [([f'table{number}'], [prefix + [f'key{key}'] for key in range(10)]) for number in range(2000)]
+        translators = (('walk', WalkingTranslator()), ('resolve_prefix', JSONTranslator()))
+        best = {name: float('inf') for name, _ in translators}
+        # best of interleaved runs, the noise of this machine is larger than the difference
+        for _ in range(25):
+            for name, translator in translators:
+                def store():
+                    translator.reset()
+                    for header, key_lists in tables:
+                        translator.open_table(header)
+                        for key_list in key_lists:
+                            translator.store(key_list, 1)
+                best[name] = min(best[name], measure(store))
+        for name, seconds in best.items():
+            report(f'{depth}-key prefixes ({name})', seconds)
+
+
+def bench_result_cache():
+    """
+    Loading an unchanged file through ResultCache versus parsing it every time
+    """
+    with tempfile.TemporaryDirectory() as directory:
+        path = os.path.join(directory, 'config.toml')
+        with open(path, 'w') as f:
+            f.write(sample_document())
+        parser = Parser(builder=True)
+
+        def parse():
+            with open(path) as f:
+                return parser.parse(f.read())
+        report('Parser.parse', measure(parse, 100))
+
+        cache = ResultCache(directory=os.path.join(directory, 'cache'))
+        cache.parse(path)
+        report('ResultCache.parse (memory hit)', measure(lambda: cache.parse(path), 10000))
+
+        def from_disk():
+            cache.clear()
+            cache.parse(path)
+        report('ResultCache.parse (disk hit)', measure(from_disk, 1000))
+        print(cache.stats())
+
+
+def bench_incremental():
+    """
+    Re-parsing a 20000-line document after a one-line edit, incrementally versus from scratch
+    """
+    document = sample_document(1600, 10)
+    lines = document.split('\n')
+    middle = len(lines) // 2 + 1
+    versions = []
+    for number in range(20):
+        edited = list(lines)
+        edited[middle] = f'key-0 = {number}'
+        versions.append('\n'.join(edited))
+
+    parser = Parser()
+    report('Parser.parse (full)', measure(lambda: parser.parse(versions[0]), 3))
+
+    incremental = IncrementalParser()
+    incremental.parse(document)
+    edits = iter(versions)
+    report('IncrementalParser.parse (edit)', measure(lambda: incremental.parse(next(edits)), len(versions)))
+    print(f'{"sections parsed per edit":<40} {incremental.parsed_sections:>14} of {len(incremental.sections)}')
+
+
+def bench_parallel():
+    """
+    Parse time of one large document split at its headers, for growing numbers of workers
+    """
+    document = large_document(10000)
+    report('Parser.parse', measure(lambda: Parser(builder=True).translate(document)))
+    for workers in (1, 2, 4, 8):
+        report(f'parse_parallel, {workers} workers', measure(lambda: parse_parallel(document, workers=workers)))
+
+
+def bench_mmap():
+    """
+    Peak RSS and time to the first tokens of a 100 MB+ file, read into a str versus memory-mapped
+    """
+    with tempfile.TemporaryDirectory() as directory:
+        source = os.path.join(directory, 'large.toml')
+        with open(source, 'w') as f:
+            for _ in range(100):
+                f.write(large_document(11000) + '\n')
+        print(f'{"input size":<40} {os.path.getsize(source) / 2 ** 20:>10.1f} MiB')
+
+        lex = ('count = 0\n'
+               'while count < 100000 and lexer.token():\n'
+               '    count += 1\n')
+        modes = (
+            ('f.read() + FastLexer', f'from lexer_fast import FastLexer\n'
+                                     f'lexer = FastLexer()\n'
+                                     f'lexer.input(open({source!r}, encoding="utf-8").read())\n' + lex),
+            ('mmap + BytesLexer', f'from lexer_bytes import BytesLexer, mapped\n'
+                                  f'lexer = BytesLexer()\n'
+                                  f'with mapped({source!r}) as data:\n'
+                                  f'    lexer.input(data)\n' + ''.join('    ' + line + '\n'
+                                                                   for line in lex.splitlines())),
+        )
+        for name, code in modes:
+            start = time.perf_counter()
+            rss = child_peak_rss(code)
+            seconds = time.perf_counter() - start
+            print(f'{name:<40} {rss / 2 ** 20:>10.1f} MiB peak RSS {seconds:>8.2f} s for 100000 tokens')
+
+
+def bench_events():
+    """
+    Peak memory of streaming the events of growing documents versus loading them
+    """
+    with tempfile.TemporaryDirectory() as directory:
+        for records in (1000, 4000, 16000):
+            path = os.path.join(directory, f'records{records}.toml')
+            with open(path, 'w') as f:
+                f.write(large_document(records))
+
+            def stream():
+                with open(path) as f:
+                    for _ in iter_events(f):
+                        pass
+            report_traced(f'{records:>6} records, iter_events', *traced(stream))
+            report_traced(f'{records:>6} records, load', *traced(lambda: load(path)))
+
+
+def bench_jsonl():
+    """
+    Time and peak memory of writing a large table array as JSON versus streaming it as JSON Lines
+    """
+    document = large_document(20000)
+    with tempfile.TemporaryDirectory() as directory:
+        target = os.path.join(directory, 'output')
+
+        def write_json():
+            parser = Parser(builder=True)
+            parser.translate(document)
+            with open(target, 'w') as f:
+                parser.translation_unit.write_result(f)
+
+        def write_json_lines():
+            with open(target, 'w') as f:
+                to_json_lines(document, f)
+
+        report_traced('JSON write_result', *traced(write_json))
+        report_traced('JSON Lines to_json_lines', *traced(write_json_lines))
+
+
+def bench_msgpack():
+    """
+    Output size, encoding and decoding time of JSON versus the MessagePack translator
+    """
+    document = large_document(5000)
+    outputs = (
+        ('JSON', 'json', io.StringIO, {}, json.loads),
+        ('JSON compact', 'json', io.StringIO, {'indent': None, 'separators': (',', ':')}, json.loads),
+        ('MessagePack', 'msgpack', io.BytesIO, {}, unpackb),
+    )
+    for name, language, file_class, options, decode in outputs:
+        parser = Parser(language, builder=True)
+        parser.translate(document)
+
+        def encode():
+            file = file_class()
+            parser.translation_unit.write_result(file, **options)
+            return file.getvalue()
+        result = encode()
+        size = len(result.encode('utf-8') if isinstance(result, str) else result)
+        print(f'{name:<40} {size / 2 ** 10:>10.1f} KiB')
+        report(f'{name} encode', measure(encode, 5))
+        report(f'{name} decode', measure(lambda: decode(result), 5))
+
+
+def bench_snapshot():
+    """
+    Boot time of reading three keys of a config: parsing the TOML versus loading JSON, MessagePack or a snapshot
+    """
+    document = large_document(10000)
+    with tempfile.TemporaryDirectory() as directory:
+        paths = {}
+        for language in ('json', 'msgpack', 'snapshot'):
+            paths[language] = os.path.join(directory, 'config.' + language)
+            parser = Parser(language, builder=True)
+            parser.translate(document)
+            with open(paths[language], 'wb' if parser.translation_unit.binary else 'w') as f:
+                parser.translation_unit.write_result(f)
+            print(f'{language + " size":<40} {os.path.getsize(paths[language]) / 2 ** 10:>10.1f} KiB')
+
+        def read_keys(config):
+            return config['server']['host'], config['server']['ports'][1], config['records'][5000]['point']['y']
+
+        def parse_toml():
+            return read_keys(Parser(builder=True).parse_dict(document))
+
+        def load_json():
+            with open(paths['json'], encoding='utf-8') as f:
+                return read_keys(json.load(f))
+
+        def load_msgpack():
+            with open(paths['msgpack'], 'rb') as f:
+                return read_keys(unpackb(f.read()))
+
+        def open_snapshot():
+            with Snapshot(paths['snapshot']) as snapshot:
+                return read_keys(snapshot.root())
+
+        def materialize_snapshot():
+            with Snapshot(paths['snapshot']) as snapshot:
+                return snapshot.root().to_dict()
+
+        assert parse_toml() == load_json() == load_msgpack() == open_snapshot()
+        report('parse TOML + 3 keys', measure(parse_toml))
+        report('json.load + 3 keys', measure(load_json, 5))
+        report('MessagePack unpackb + 3 keys', measure(load_msgpack, 5))
+        report('Snapshot open + 3 keys', measure(open_snapshot, 1000))
+        report('Snapshot full materialization', measure(materialize_snapshot, 5))
+
+
+def services_document(services):
+    """
+    Returns a config with one table per service, each holding a large array and inline table
+    """
+    lines = []
+    for service in range(services):
+        lines.append(f'[service{service}]')
+        lines.append(f'host = "host{service}"')
+        lines.append('weights = [' + ', '.join(str(weight) for weight in range(50)) + ']')
+        lines.append(f'limits = {{ cpu = {service}, memory = "{service}Mi", zones = ["a", "b", "c", "d", "e", "f"] }}')
+    return '\n'.join(lines)
+
+
+def bench_lazy():
+    """
+    Parsing a config then reading N of its keys, eagerly versus with LazyDocument
+    """
+    services = 2000
+    document = services_document(services)
+    print(f'{"input size":<40} {len(document) / 2 ** 20:>10.1f} MiB')
+
+    def read(config, count):
+        return [config[f'service{service}']['host'] for service in range(0, services, services // count)]
+
+    report('eager parse', measure(lambda: Parser(builder=True).parse_dict(document)))
+    report('lazy open', measure(lambda: LazyDocument(document)))
+    for count in (1, 10, 100, 1000):
+        report(f'lazy open + read {count} keys', measure(lambda: read(LazyDocument(document), count)))
+
+
+def bench_query():
+    """
+    Extracting a few paths with query versus a full parse and dictionary lookups
+    """
+    document = services_document(2000)
+    queries = (
+        ('1 path', ['service1000.host']),
+        ('3 paths', ['service1.host', 'service1000.limits.cpu', 'service1999.weights[*]']),
+        ('100 paths', [f'service{service}.host' for service in range(0, 2000, 20)]),
+    )
+    report('full parse', measure(lambda: Parser(builder=True).parse_dict(document)))
+    for name, paths in queries:
+        assert query(document, paths) == evaluate(Parser(builder=True).parse_dict(document), paths)
+        report(f'full parse + lookup {name}',
+               measure(lambda: evaluate(Parser(builder=True).parse_dict(document), paths)))
+        report(f'query {name}', measure(lambda: query(document, paths)))
+
+
+def deep_merge(target, source):
+    """
+    Merges source into target in place, copying its values: the usual hand-written layer merge,
+    folded over the layers after a deep copy of the base
+    """
+    for key, value in source.items():
+        if isinstance(value, dict) and isinstance(target.get(key), dict):
+            deep_merge(target[key], value)
+        else:
+            target[key] = copy.deepcopy(value)
+
+
+def bench_layers():
+    """
+    Merging 100 layers: a large base with small overrides, and 100 large layers
+    """
+    parser = Parser(builder=True)
+    base = parser.parse_dict(services_document(2000))
+    overrides = [f'[service{(layer * 20 + service) % 2000}]\nhost = "override{layer}"\n'
+                 f'limits.cpu = {layer}\n' for layer in range(99) for service in range(20)]
+    overrides = [''.join(overrides[layer * 20:(layer + 1) * 20]) for layer in range(99)]
+
+    with tempfile.TemporaryDirectory() as directory:
+        paths = []
+        for layer, document in enumerate(overrides):
+            paths.append(os.path.join(directory, f'layer{layer}.toml'))
+            with open(paths[-1], 'w') as f:
+                f.write(document)
+        report('parse 99 override files, 1 process', measure(lambda: load_layers(paths, workers=1)))
+        report(f'parse 99 override files, {os.cpu_count()} processes', measure(lambda: load_layers(paths)))
+        overrides = load_layers(paths, workers=1)
+
+    def fold(layers):
+        result = copy.deepcopy(layers[0])
+        for layer in layers[1:]:
+            deep_merge(result, layer)
+        return result
+
+    large = [copy.deepcopy(base) for _ in range(100)]
+    for name, layers in (('base + 99 overrides', [base] + overrides), ('100 large layers', large)):
+        assert fold(layers) == merge(layers)
+        for method, function in (('fold', fold), ('merge', merge)):
+            seconds, peak = traced(lambda: function(layers))
+            report_traced(f'{name}, {method}', seconds, peak)
+
+
+def bench_timestamps():
+    """
+    Converting 1M log timestamps with the typed converters versus re-parsing the strings
+    """
+    start = datetime.datetime(2024, 1, 1)
+
+    def reparse(text):
+        return datetime.datetime.fromisoformat(text.replace('Z', '+00:00'))
+
+    converters = (('re-parse with fromisoformat', reparse), ('generic to_datetime', to_datetime),
+                  ('to_offset_date_time', to_offset_date_time))
+    for offset in ('Z', '+05:30'):
+        timestamps = [(start + datetime.timedelta(seconds=second)).isoformat() + offset for second in range(1000000)]
+        for name, converter in converters:
+            seconds, peak = traced(lambda: list(map(converter, timestamps)))
+            report_traced(f'1M {offset}, {name}', seconds, peak)
+
+        document = 'at = [' + ',\n'.join(timestamps[:100000]) + ']'
+        report(f'100k {offset}, untyped parse + re-parse',
+               measure(lambda: list(map(reparse, Parser(builder=True).parse_dict(document)['at']))))
+        report(f'100k {offset}, typed parse', measure(lambda: Parser(builder=True, typed=True).parse_dict(document)))
+
+
+def bench_numeric():
+    """
+    Time and retained bytes per element of large numeric arrays, as lists versus typed buffers
+    """
+    count = 50000
+    document = ('ints = [' + ', '.join(str(value * 7) for value in range(count)) + ']\n'
+                'floats = [' + ', '.join(f'{value}.25' for value in range(count)) + ']\n')
+    for builder in (True, False):
+        mode = 'builder' if builder else 'AST'
+        for numeric_arrays in (None, 'array'):
+            parser = Parser(builder=builder, numeric_arrays=numeric_arrays)
+            seconds = measure(lambda: parser.parse_dict(document))
+            size, _ = allocated(lambda: parser.parse_dict(document))
+            print(f'{mode + ", " + (numeric_arrays or "lists"):<40} {seconds * 1e3:>10.1f} ms '
+                  f'{size / (2 * count):>10.1f} bytes per element')
+
+    samples = ''.join(f'[[samples]]\nt = {sample}\nv = {sample}.5\n' for sample in range(5000))
+    items = Parser(builder=True).parse_dict(samples)['samples']
+    size, _ = allocated(lambda: Parser(builder=True).parse_dict(samples))
+    print(f'{"[[samples]] as tables":<40} {size / len(items):>10.1f} bytes per sample')
+    size, _ = allocated(lambda: to_columns(items))
+    print(f'{"[[samples]] to_columns":<40} {size / len(items):>10.1f} bytes per sample')
+
+
+def bench_interning():
+    """
+    Time and retained bytes of a repetitive [[fruit]] array and of a batch of documents, with and without interning
+    """
+    fruits = ''.join(f'[[fruit]]\nname = "fruit{item % 50}"\ncolor = "{("red", "green", "yellow")[item % 3]}"\n'
+                     f'price = {item}\nstock = {{ store = "main", count = {item} }}\n' for item in range(20000))
+    documents = [sample_document() for _ in range(20)]
+    for name, intern in (('no interning', None), ('keys', True), ('keys and strings', InternPool(strings=True))):
+        parser = Parser(builder=True, intern=intern)
+        seconds = measure(lambda: parser.parse_dict(fruits))
+        size, _ = allocated(lambda: parser.parse_dict(fruits))
+        print(f'{"20000 [[fruit]], " + name:<40} {seconds * 1e3:>10.1f} ms {size / 2 ** 20:>10.1f} MiB')
+
+        if isinstance(intern, InternPool):
+            intern.clear()
+        # the documents of the batch stay alive together, sharing the pool of the parser
+        size, _ = allocated(lambda: [parser.parse_dict(document) for document in documents])
+        print(f'{"20 documents, " + name:<40} {size / 2 ** 20:>24.1f} MiB')
+
+
+BENCHMARKS = {
+    'startup': bench_startup,
+    'reuse': bench_reuse,
+    'scaling': bench_scaling,
+    'builder': bench_builder,
+    'loads': bench_loads,
+    'write': bench_write,
+    'batch': bench_batch,
+    'lexer': bench_lexer,
+    'nodes': bench_nodes,
+    'arrays': bench_arrays,
+    'paths': bench_paths,
+    'result_cache': bench_result_cache,
+    'incremental': bench_incremental,
+    'parallel': bench_parallel,
+    'mmap': bench_mmap,
+    'events': bench_events,
+    'jsonl': bench_jsonl,
+    'msgpack': bench_msgpack,
+    'snapshot': bench_snapshot,
+    'lazy': bench_lazy,
+    'query': bench_query,
+    'layers': bench_layers,
+    'timestamps': bench_timestamps,
+    'numeric': bench_numeric,
+    'interning': bench_interning,
+}
+
+
+def main():
+    names = sys.argv[1:] or list(BENCHMARKS)
+    for name in names:
+        print(f'== {name}: {BENCHMARKS[name].__doc__.strip().splitlines()[0]}')
+        BENCHMARKS[name]()
+
+
+if __name__ == '__main__':
+    main()
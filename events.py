@@ -0,0 +1,89 @@
+from lexer_stream import StreamLexer
+from parser_toml import Parser
+from sections import scan_tokens, Recorder, KEY_VAL, TABLE
+
+# Names of the events, which are also the names of the EventHandler methods
+START_TABLE = 'start_table'
+START_TABLE_ARRAY_ITEM = 'start_table_array_item'
+KEY_VALUE = 'key_value'
+END_DOCUMENT = 'end_document'
+
+
+def iter_events(file, typed=False):
+    """
+    Reads a TOML document from a file object and yields its expressions one by one as
+    (event, keys, value) tuples:
+    (START_TABLE, keys, None) for [table], (START_TABLE_ARRAY_ITEM, keys, None) for [[table_array]],
+    (KEY_VALUE, keys, translated value) for key = value, then (END_DOCUMENT, None, None).
+    The document is lexed while it is read and parsed one section (header to header) at a time,
+    so memory depends on the largest section instead of the size of the document.
+    Tables are neither merged nor checked for duplicates, that is up to the consumer.
+    :param file: file object opened in text mode, or in binary mode for UTF-8 contents
+    :param typed: give dates and times as datetime, date and time objects instead of strings
+    """
+    lexer = StreamLexer()
+    lexer.input(file)
+    parser = Parser('json', builder=True, typed=typed)
+    recorder = Recorder(typed)
+    parser.translation_unit = recorder
+
+    tokens = []
+    for token, header in scan_tokens(lexer):
+        if header and tokens:
+            yield from parse_section(parser, recorder, tokens)
+            tokens = []
+        tokens.append(token)
+    if tokens:
+        yield from parse_section(parser, recorder, tokens)
+    yield END_DOCUMENT, None, None
+
+
+def parse_section(parser, recorder, tokens):
+    """
+    Parses the tokens of one section and yields its events
+    """
+    recorder.reset()
+    parser.parse_tokens(tokens)
+    for kind, keys, value in recorder.records:
+        if kind == KEY_VAL:
+            yield KEY_VALUE, keys, value
+        elif kind == TABLE:
+            yield START_TABLE, keys, None
+        else:
+            yield START_TABLE_ARRAY_ITEM, keys, None
+
+
+class EventHandler:
+    """
+    EventHandler class
+    Receives the events of parse_events; override the methods of the events to handle
+    """
+    def start_table(self, keys):
+        pass
+
+    def start_table_array_item(self, keys):
+        pass
+
+    def key_value(self, keys, value):
+        pass
+
+    def end_document(self):
+        pass
+
+
+def parse_events(file, handler, typed=False):
+    """
+    Reads a TOML document from a file object and calls the handler method of each event
+    :param file: file object opened in text mode, or in binary mode for UTF-8 contents
+    :param handler: EventHandler object
+    :param typed: give dates and times as datetime, date and time objects instead of strings
+    """
+    for event, keys, value in iter_events(file, typed):
+        if event == KEY_VALUE:
+            handler.key_value(keys, value)
+        elif event == START_TABLE:
+            handler.start_table(keys)
+        elif event == START_TABLE_ARRAY_ITEM:
+            handler.start_table_array_item(keys)
+        else:
+            handler.end_document()
@@ -0,0 +1,63 @@
+import io
+import unittest
+from events import iter_events, parse_events, EventHandler, START_TABLE, START_TABLE_ARRAY_ITEM, KEY_VALUE
+from parser_toml import Parser
+from translator_json import JSONTranslator
+
+# Test data
+toml_document = '\n'.join(
+    ['title = "events"', 'text = """', '[not.a.header]', '"""', '[server]', 'ports = [8000, 8001]'] +
+    [f'[[fruit]]\nname = "fruit {number}"\n[fruit.physical]\npoint = {{ x = {number} }}' for number in range(20)])
+events_expected = [
+    (KEY_VALUE, ['title'], 'events'),
+    (KEY_VALUE, ['text'], '\n[not.a.header]\n\n'),
+    (START_TABLE, ['server'], None),
+    (KEY_VALUE, ['ports'], [8000, 8001]),
+    (START_TABLE_ARRAY_ITEM, ['fruit'], None),
+    (KEY_VALUE, ['name'], 'fruit 0'),
+]
+
+
+class Counter(EventHandler):
+    def __init__(self):
+        self.items = 0
+        self.ended = False
+
+    def start_table_array_item(self, keys):
+        self.items += 1
+
+    def end_document(self):
+        self.ended = True
+
+
+class EventsTestCase(unittest.TestCase):
+
+    def test_events(self):
+        self.assertEqual(events_expected, list(iter_events(io.StringIO(toml_document)))[:len(events_expected)])
+
+    def test_same_document(self):
+        # applying the events in order gives the result of a full parse
+        translator = JSONTranslator()
+        for event, keys, value in iter_events(io.BytesIO(toml_document.encode())):
+            if event == KEY_VALUE:
+                translator.store(keys, value)
+            elif event == START_TABLE:
+                translator.open_table(keys)
+            elif event == START_TABLE_ARRAY_ITEM:
+                translator.open_table_array(keys)
+        self.assertEqual(Parser().parse_dict(toml_document), translator.get_dict())
+
+    def test_handler(self):
+        counter = Counter()
+        parse_events(io.StringIO(toml_document), counter)
+        self.assertEqual((20, True), (counter.items, counter.ended))
+
+    def test_syntax_error(self):
+        events = iter_events(io.StringIO('[a]\nx = 1\n[b]\ny = \n[c]'))
+        self.assertEqual((START_TABLE, ['a'], None), next(events))
+        with self.assertRaisesRegex(SyntaxError, 'line 5'):
+            list(events)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,126 @@
+from ply.lex import LexError
+from parser_toml import Parser
+from sections import split_sections
+
+# Size of the blocks compared at once when looking for the unchanged start and end of a document
+BLOCK_SIZE = 4096
+
+
+def common_prefix_length(old, new):
+    """
+    Returns the length of the longest common prefix of two strings
+    """
+    length = min(len(old), len(new))
+    position = 0
+    while position < length and old[position:position + BLOCK_SIZE] == new[position:position + BLOCK_SIZE]:
+        position += BLOCK_SIZE
+    position = min(position, length)
+    while position < length and old[position] == new[position]:
+        position += 1
+    return position
+
+
+def common_suffix_length(old, new, limit):
+    """
+    Returns the length of the longest common suffix of two strings, at most limit
+    """
+    length = 0
+    while length < limit and old[len(old) - length - BLOCK_SIZE:len(old) - length] == \
+            new[len(new) - length - BLOCK_SIZE:len(new) - length] and length + BLOCK_SIZE <= limit:
+        length += BLOCK_SIZE
+    while length < limit and old[len(old) - length - 1] == new[len(new) - length - 1]:
+        length += 1
+    return length
+
+
+class IncrementalParser:
+    """
+    Parser that keeps the sections of the last document it parsed
+    When it is given an edited version of that document, only the sections touched by the
+    edit are lexed and parsed again; the others keep their nodes, shifted if needed.
+    The node lists of all sections are then translated again, which is much cheaper than parsing.
+    """
+    def __init__(self, lang='json'):
+        self.parser = Parser(lang)
+        self.translation_unit = self.parser.translation_unit
+        self.text = None
+        self.sections = []
+        # number of sections parsed by the last call
+        self.parsed_sections = 0
+
+    def parse(self, text):
+        """
+        Parses a document, reusing what is unchanged since the previous call, and returns its translation
+        :param text: TOML document
+        """
+        self.update(text)
+        return self.translation_unit.get_result()
+
+    def parse_dict(self, text):
+        """
+        Same as parse, returning Python objects
+        """
+        self.update(text)
+        return self.translation_unit.get_dict()
+
+    def update(self, text):
+        sections = None
+        if self.text is not None:
+            try:
+                sections = self.splice(text)
+            except (SyntaxError, LexError):
+                # the edit changes the document beyond its sections (e.g. opens a multiline string)
+                sections = None
+        if sections is None:
+            sections = self.parse_sections(text, 0, len(text))
+
+        self.text = text
+        self.sections = sections
+
+        self.translation_unit.reset()
+        for section in sections:
+            self.translation_unit.translate(section.nodes)
+
+    def parse_sections(self, text, start, end):
+        """
+        Lexes and parses the sections of text[start:end]
+        """
+        sections = split_sections(text, start, end, text.count('\n', 0, start) + 1)
+        for section in sections:
+            section.nodes = self.parser.parse_tokens(section.tokens) if section.tokens else []
+            # only the positions are needed to splice the section later
+            section.tokens = None
+        self.parsed_sections = len(sections)
+        return sections
+
+    def splice(self, text):
+        """
+        Returns the sections of text, parsing only those that differ from the previous document
+        """
+        old = self.text
+        prefix = common_prefix_length(old, text)
+        suffix = common_suffix_length(old, text, min(len(old), len(text)) - prefix)
+        shift = len(text) - len(old)
+
+        # sections ending before the first change are unchanged, the same goes for
+        # those starting after the last change, which only move by shift
+        first = 0
+        while first < len(self.sections) - 1 and self.sections[first].end < prefix:
+            first += 1
+        last = len(self.sections) - 1
+        while last > first and self.sections[last].start >= len(old) - suffix:
+            last -= 1
+
+        # a comment at the end of the region would run into the next section unless a newline ends it
+        while last < len(self.sections) - 1 and text[self.sections[last].end + shift - 1] != '\n':
+            last += 1
+
+        start = self.sections[first].start
+        end = self.sections[last].end + shift
+        changed = self.parse_sections(text, start, end)
+
+        following = self.sections[last + 1:]
+        for section in following:
+            section.start += shift
+            section.end += shift
+        return self.sections[:first] + changed + following
@@ -0,0 +1,94 @@
+import contextlib
+import io
+import random
+import unittest
+from incremental import IncrementalParser
+from parser_toml import Parser
+from sections import split_sections
+
+# Test data
+toml_document = '''title = "sections"
+array = [ 1,
+  [2, 3],
+  { b = 4 } ]
+text = """
+[not.a.header]
+"""
+[first]
+key = 1
+# comment [not.a.header]
+[first.sub]
+brackets = [ "[", ']' ]
+[[items]]
+number = 1
+[[items]]
+number = 2
+[second]
+inline = { list = [1] }
+'''
+edits = ['\n[third]\n', '\nadded = 1\n', '"""', "'''", '[', ']', 'x', '\n', ' = 5', '[[items]]\n', '# c\n']
+
+
+class SectionsTestCase(unittest.TestCase):
+
+    def test_split(self):
+        sections = split_sections(toml_document)
+        headers = [toml_document[section.start:toml_document.index('\n', section.start)]
+                   for section in sections[1:]]
+        self.assertEqual(['[first]', '[first.sub]', '[[items]]', '[[items]]', '[second]'], headers)
+        self.assertEqual(0, sections[0].start)
+        self.assertEqual(len(toml_document), sections[-1].end)
+
+    def test_unbalanced(self):
+        with self.assertRaises(SyntaxError):
+            split_sections('a = [1, 2\n[table]\n')
+
+
+class IncrementalParserTestCase(unittest.TestCase):
+
+    def test_first_parse(self):
+        self.assertEqual(Parser().parse(toml_document), IncrementalParser().parse(toml_document))
+
+    def test_edit_one_section(self):
+        parser = IncrementalParser()
+        parser.parse(toml_document)
+        edited = toml_document.replace('number = 1', 'number = 10')
+        self.assertEqual(Parser().parse_dict(edited), parser.parse_dict(edited))
+        self.assertEqual(1, parser.parsed_sections)
+
+    def test_insert_header(self):
+        parser = IncrementalParser()
+        parser.parse(toml_document)
+        edited = toml_document.replace('key = 1\n', 'key = 1\n[inserted]\nkey = 2\n')
+        self.assertEqual(Parser().parse_dict(edited), parser.parse_dict(edited))
+        self.assertEqual(2, parser.parsed_sections)
+
+    def test_invalid_edit(self):
+        parser = IncrementalParser()
+        parser.parse(toml_document)
+        with self.assertRaises(SyntaxError):
+            parser.parse(toml_document.replace('key = 1', 'key = '))
+
+    def test_random_edits(self):
+        generator = random.Random(0)
+        full_parser = Parser()
+        parser = IncrementalParser()
+        parser.parse(toml_document)
+        text = toml_document
+        with contextlib.redirect_stdout(io.StringIO()):
+            for _ in range(500):
+                position = generator.randint(0, len(text))
+                if generator.random() < 0.5:
+                    edited = text[:position] + generator.choice(edits) + text[position:]
+                else:
+                    edited = text[:position] + text[position + generator.randint(1, 10):]
+                try:
+                    expected = full_parser.parse_dict(edited)
+                except Exception:
+                    continue
+                self.assertEqual(expected, parser.parse_dict(edited), edited)
+                text = edited
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -4,6 +4,8 @@ class InlineTable:
     Contains a list of expressions
     Example: InlineTable: [KeyVal(Key('string', "hello"), Value('integer', 1)), KeyVal(Key('string', "world"), Value('integer', 2))
     """
+    __slots__ = ('expression_list',)
+
     def __init__(self, expression_list):
         self.expression_list = expression_list
 
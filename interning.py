@@ -0,0 +1,66 @@
+# String values up to this many characters are interned by default: names, tags, enumerations,
+# while longer texts are rarely repeated and would only grow the pool
+INTERN_LENGTH = 32
+
+
+class InternPool:
+    """
+    InternPool class
+    Strings shared by the documents translated with the same pool: a key, or a short string value when
+    strings is set, equal to one already seen is replaced by the first one, so the 100000 tables of
+    a [[fruit]] array hold references to the same few key objects instead of 100000 copies of each.
+    The pool keeps its strings alive until it is cleared or dropped.
+    Example: InternPool: 12 strings, keys and string values up to 32 characters
+    """
+    def __init__(self, strings=False, max_length=INTERN_LENGTH):
+        """
+        :param strings: intern the string values too, not only the keys
+        :param max_length: longest string value interned, keys are interned whatever their length
+        """
+        self.strings = strings
+        self.max_length = max_length
+        self.pool = {}
+        self.setdefault = self.pool.setdefault
+
+    def __len__(self):
+        return len(self.pool)
+
+    def __repr__(self):
+        values = f'string values up to {self.max_length} characters' if self.strings else 'no string values'
+        return f'InternPool: {len(self.pool)} strings, keys and {values}'
+
+    def keys(self, keys):
+        """
+        Returns translated keys with the strings of the pool
+        :param keys: list of translated keys
+        """
+        setdefault = self.setdefault
+        return [setdefault(key, key) for key in keys]
+
+    def string(self, text):
+        """
+        Returns the string of the pool equal to text, if text is short enough
+        """
+        if len(text) > self.max_length:
+            return text
+        return self.setdefault(text, text)
+
+    def clear(self):
+        """
+        Forgets the strings of the pool, the translated documents keep theirs
+        """
+        self.pool.clear()
+
+
+def get_pool(intern):
+    """
+    Returns the pool selected by the intern argument of Parser
+    :param intern: None or False not to intern, True for a new pool of keys, or an InternPool to share
+    """
+    if intern is True:
+        return InternPool()
+    if intern is None or intern is False:
+        return None
+    if not isinstance(intern, InternPool):
+        raise TypeError(f'intern must be a bool or an InternPool, not {type(intern).__name__}')
+    return intern
@@ -0,0 +1,92 @@
+import unittest
+from interning import InternPool, get_pool
+from lazy import DEFER_TOKENS
+from parser_toml import Parser
+from toml_loader import loads
+
+# Test data
+numbers = ', '.join(str(number) for number in range(DEFER_TOKENS))
+toml_document = f'''title = "fruits"
+[[fruit]]
+name = "apple"
+color = "red"
+inline = {{ color = "red", sizes = [{numbers}] }}
+[[fruit]]
+name = "cherry"
+color = "red"
+tags = ["red", "sweet", "red"]
+[fruit.origin]
+"country code" = "fr"
+'''
+
+
+def make_key(name):
+    # a key string built at run time, which Python doesn't intern by itself
+    return ''.join(reversed(name[::-1]))
+
+
+class InternPoolTestCase(unittest.TestCase):
+
+    def test_keys(self):
+        pool = InternPool()
+        first = pool.keys([make_key('color'), make_key('name')])
+        second = pool.keys([make_key('color')])
+        self.assertEqual(['color', 'name'], first)
+        self.assertIs(first[0], second[0])
+        self.assertEqual(2, len(pool))
+
+    def test_strings(self):
+        pool = InternPool(strings=True, max_length=5)
+        self.assertIs(pool.string(make_key('red')), pool.string(make_key('red')))
+        self.assertIsNot(pool.string(make_key('crimson')), pool.string(make_key('crimson')))
+        pool.clear()
+        self.assertEqual(0, len(pool))
+
+    def test_get_pool(self):
+        self.assertIsNone(get_pool(None))
+        self.assertIsNone(get_pool(False))
+        self.assertIsInstance(get_pool(True), InternPool)
+        pool = InternPool()
+        self.assertIs(pool, get_pool(pool))
+        with self.assertRaises(TypeError):
+            get_pool('keys')
+
+
+class InterningTestCase(unittest.TestCase):
+
+    def test_keys_shared(self):
+        expected = Parser().parse_dict(toml_document)
+        for builder in (False, True):
+            result = Parser(builder=builder, intern=True).parse_dict(toml_document)
+            self.assertEqual(expected, result)
+            apple, cherry = result['fruit']
+            self.assertIs(list(apple)[1], list(cherry)[1])
+            self.assertIs(list(apple)[1], list(apple['inline'])[0])
+            # string values are left alone unless the pool interns them
+            self.assertIsNot(apple['color'], cherry['color'])
+
+    def test_strings_shared(self):
+        for builder in (False, True):
+            result = Parser(builder=builder, intern=InternPool(strings=True)).parse_dict(toml_document)
+            apple, cherry = result['fruit']
+            self.assertIs(apple['color'], cherry['color'])
+            self.assertIs(apple['color'], cherry['tags'][0])
+            self.assertIs(apple['color'], apple['inline']['color'])
+
+    def test_shared_pool(self):
+        pool = InternPool(strings=True)
+        first = Parser(builder=True, intern=pool).parse_dict(toml_document)
+        second = loads(toml_document.encode(), intern=pool)
+        self.assertIs(list(first['fruit'][0])[0], list(second['fruit'][0])[0])
+        self.assertIs(first['fruit'][0]['color'], second['fruit'][1]['color'])
+        lazy = loads(toml_document, lazy=True, intern=pool)
+        self.assertIs(first['fruit'][0]['color'], lazy['fruit'][1]['color'])
+
+    def test_outputs(self):
+        pool = InternPool(strings=True)
+        for language in ('json', 'msgpack'):
+            self.assertEqual(Parser(language).parse(toml_document), Parser(language, intern=pool).parse(toml_document))
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,74 @@
+import io
+import json
+import unittest
+from parser_toml import Parser
+from toml_loader import to_json_lines
+
+# Test data
+toml_document = '''title = "lines"
+[[records]]
+id = 1
+point = { x = 1, y = 2.5 }
+[[records]]
+id = 2
+[owner]
+name = "Tom"
+[[other]]
+z = 1979-05-27
+'''
+jsonl_expected = '''{"path":["records"],"item":{"id":1,"point":{"x":1,"y":2.5}}}
+{"path":["records"],"item":{"id":2}}
+{"path":["other"],"item":{"z":"1979-05-27"}}
+{"header":{"title":"lines","owner":{"name":"Tom"}}}
+'''
+
+
+class WriteLog(io.StringIO):
+    """
+    Text file remembering what had been written at each write
+    """
+    def __init__(self):
+        super().__init__()
+        self.writes = []
+
+    def write(self, text):
+        self.writes.append(text)
+        return super().write(text)
+
+
+class JSONLinesTestCase(unittest.TestCase):
+
+    def test_to_json_lines(self):
+        file = io.StringIO()
+        to_json_lines(toml_document, file)
+        self.assertEqual(jsonl_expected, file.getvalue())
+
+    def test_typed(self):
+        file = io.StringIO()
+        to_json_lines(toml_document.encode(), file, typed=True)
+        self.assertEqual(jsonl_expected, file.getvalue())
+
+    def test_items_written_while_parsing(self):
+        parser = Parser('jsonl', builder=True)
+        file = WriteLog()
+        parser.translation_unit.output = file
+        parser.translate(toml_document)
+        # the last item is only known to be complete at the end of the document
+        self.assertEqual(jsonl_expected.splitlines(True)[:2], file.writes)
+        self.assertEqual([], parser.translation_unit.table_arrays['records'])
+
+    def test_get_result(self):
+        parser = Parser('jsonl')
+        # without output, the items are kept until the end and grouped by table array
+        self.assertEqual(jsonl_expected, parser.parse(toml_document))
+
+    def test_same_document(self):
+        records = [json.loads(line) for line in jsonl_expected.splitlines()]
+        document = records[-1]['header']
+        for record in records[:-1]:
+            document.setdefault(record['path'][0], []).append(record['item'])
+        self.assertEqual(Parser().parse_dict(toml_document), document)
+
+
+if __name__ == '__main__':
+    unittest.main()
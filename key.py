@@ -1,11 +1,19 @@
 from value import Value
 
+
+# Key types
+BARE_KEY = 'bare_key'
+QUOTED_KEY = 'quoted_key'
+
+
 class Key:
     """
     Key class
     Contains a type and a value
     Example: Key: type:bare_key value:Value('string', "hello")
     """
+    __slots__ = ('type', 'value')
+
     def __init__(self, type_, value: Value):
         self.type = type_
         self.value = value
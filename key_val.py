@@ -7,6 +7,8 @@ class KeyVal:
     e.g.
         KeyVal(Key('string', "hello"), Value('integer', 1))
     """
+    __slots__ = ('key_list', 'value')
+
     def __init__(self, key_list, value):
         self.key_list = key_list
         self.value = value
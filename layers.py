@@ -0,0 +1,127 @@
+import os
+from concurrent.futures import ProcessPoolExecutor
+from functools import partial
+from lexer_bytes import mapped
+from parser_toml import Parser
+from worker import init_worker, worker_parser
+
+# Strategies for the arrays of tables found in several layers
+REPLACE = 'replace'
+APPEND = 'append'
+
+
+def is_table_array(value):
+    """
+    Tells if a translated value is an array of tables, from [[header]] sections or inline
+    """
+    return type(value) is list and bool(value) and all(type(item) is dict for item in value)
+
+
+def merge(layers, table_arrays=REPLACE):
+    """
+    Merges translated documents, each layer overriding the ones before it:
+    tables are merged key by key, recursively; arrays of tables are replaced by the last layer
+    defining them, or concatenated in layer order with table_arrays=APPEND; any other value,
+    or a value whose type differs from the one below it, replaces it.
+    Nothing is copied unless it has to be: a table or array found in a single layer is shared
+    with the result as it is, so the layers must not be modified while the result is in use.
+    :param layers: list of dictionaries, from the base to the last override
+    :param table_arrays: REPLACE or APPEND
+    :return: merged dictionary
+    """
+    if table_arrays not in (REPLACE, APPEND):
+        raise ValueError(f'Unknown table array strategy {table_arrays!r}')
+    if not layers:
+        return {}
+    return merge_values(list(layers), table_arrays)
+
+
+def merge_values(values, table_arrays):
+    """
+    Merges the values of the same key in several layers, in layer order
+    """
+    last = values[-1]
+    if type(last) is dict:
+        # only the tables after the last value of another type take part
+        tables = []
+        for value in reversed(values):
+            if type(value) is not dict:
+                break
+            tables.append(value)
+        if len(tables) == 1:
+            return last
+
+        collected = {}
+        for table in reversed(tables):
+            for key, value in table.items():
+                if key in collected:
+                    collected[key].append(value)
+                else:
+                    collected[key] = [value]
+        return {key: found[0] if len(found) == 1 else merge_values(found, table_arrays)
+                for key, found in collected.items()}
+
+    if table_arrays == APPEND and is_table_array(last):
+        arrays = []
+        for value in reversed(values):
+            if not is_table_array(value):
+                break
+            arrays.append(value)
+        if len(arrays) > 1:
+            return [item for array in reversed(arrays) for item in array]
+    return last
+
+
+def parse_layer(path, parser=None):
+    """
+    Parses one layer
+    :param path: path of the TOML file
+    :param parser: parser to use, defaults to the worker parser
+    :return: translated document
+    """
+    parser = parser or worker_parser()
+    with mapped(path) as data:
+        return parser.parse_dict(data)
+
+
+def load_layers(paths, typed=False, workers=None, intern=False):
+    """
+    Parses TOML files in a pool of processes
+    :param paths: paths of the files
+    :param typed: translate dates and times to datetime, date and time objects instead of strings
+    :param workers: number of processes, defaults to the number of CPUs; 1 parses in this process
+    :param intern: True or an interning.InternPool to intern the keys, as with Parser; the layers parsed
+                   in this process share one pool, those coming back from other processes only share
+                   the strings within each layer
+    :return: list of translated documents, in the order of paths
+    """
+    workers = min(workers or os.cpu_count() or 1, len(paths))
+    layer_parser = partial(Parser, 'json', builder=True, typed=typed, lexer_backend='bytes', intern=intern)
+    if workers <= 1:
+        parser = layer_parser()
+        return [parse_layer(path, parser) for path in paths]
+
+    with ProcessPoolExecutor(workers, initializer=init_worker, initargs=(layer_parser,)) as executor:
+        return list(executor.map(parse_layer, paths))
+
+
+def merge_files(paths, language='json', typed=False, table_arrays=REPLACE, workers=None, intern=False):
+    """
+    Parses layered TOML files and merges them, the first one being the base
+    :param paths: paths of the files, from the base to the last override
+    :param language: output language
+    :param typed: translate dates and times to datetime, date and time objects instead of strings
+    :param table_arrays: REPLACE or APPEND, see merge
+    :param workers: number of processes parsing the files, see load_layers
+    :param intern: intern the keys of the layers, see load_layers
+    :return: translation unit holding the merged document
+    """
+    translation_unit = Parser(language, typed=typed).translation_unit
+    for key, value in merge(load_layers(paths, typed, workers, intern), table_arrays).items():
+        # top-level arrays of tables go where the translator keeps its table arrays,
+        # for the outputs that write them apart, like JSON Lines
+        if is_table_array(value):
+            translation_unit.table_arrays[key] = value
+        else:
+            translation_unit.tables[key] = value
+    return translation_unit
@@ -0,0 +1,100 @@
+import os
+import tempfile
+import unittest
+from layers import load_layers, merge, merge_files, APPEND, REPLACE
+from parser_toml import Parser
+
+# Test data
+base = '''name = "service"
+ports = [80, 443]
+[server]
+host = "localhost"
+pool = { size = 4, timeout = 30 }
+[logging]
+level = "info"
+[[plugins]]
+name = "auth"
+'''
+environment = '''ports = [8080]
+[server.pool]
+size = 16
+[[plugins]]
+name = "metrics"
+'''
+host = '''[server]
+host = "prod-1"
+[logging]
+level = { default = "warn" }
+'''
+
+
+class MergeTestCase(unittest.TestCase):
+
+    def setUp(self):
+        parser = Parser(builder=True)
+        self.layers = [parser.parse_dict(document) for document in (base, environment, host)]
+
+    def test_merge(self):
+        self.assertEqual({
+            'name': 'service',
+            'ports': [8080],
+            'server': {'host': 'prod-1', 'pool': {'size': 16, 'timeout': 30}},
+            'logging': {'level': {'default': 'warn'}},
+            'plugins': [{'name': 'metrics'}],
+        }, merge(self.layers))
+
+    def test_append_table_arrays(self):
+        merged = merge(self.layers, table_arrays=APPEND)
+        self.assertEqual([{'name': 'auth'}, {'name': 'metrics'}], merged['plugins'])
+        # arrays of other values are still replaced
+        self.assertEqual([8080], merged['ports'])
+
+    def test_type_changes(self):
+        self.assertEqual({'a': {'y': 2}}, merge([{'a': {'x': 1}}, {'a': 1}, {'a': {'y': 2}}]))
+        self.assertEqual({'a': 'text'}, merge([{'a': {'x': 1}}, {'a': 'text'}]))
+        self.assertEqual({'a': [{'y': 2}]}, merge([{'a': [{'x': 1}]}, {'a': []}, {'a': [{'y': 2}]}], APPEND))
+
+    def test_structural_sharing(self):
+        merged = merge(self.layers)
+        # tables found in a single layer are shared, not copied
+        self.assertIs(self.layers[2]['logging']['level'], merged['logging']['level'])
+        self.assertIsNot(self.layers[0]['server'], merged['server'])
+        self.assertIs(self.layers[1]['plugins'], merged['plugins'])
+        single = merge([{'a': {'b': {}}}, {'c': 1}])
+        self.assertIs(single['a'], merge([single, {}])['a'])
+        # the layers are left untouched
+        self.assertEqual(Parser(builder=True).parse_dict(base), self.layers[0])
+
+    def test_edge_cases(self):
+        self.assertEqual({}, merge([]))
+        self.assertIs(self.layers[0], merge([self.layers[0]]))
+        with self.assertRaises(ValueError):
+            merge(self.layers, table_arrays='zip')
+
+
+class MergeFilesTestCase(unittest.TestCase):
+
+    def setUp(self):
+        directory = tempfile.TemporaryDirectory()
+        self.addCleanup(directory.cleanup)
+        self.paths = []
+        for name, document in (('base', base), ('environment', environment), ('host', host)):
+            path = os.path.join(directory.name, name + '.toml')
+            with open(path, 'w', encoding='utf-8') as f:
+                f.write(document)
+            self.paths.append(path)
+
+    def test_load_layers(self):
+        expected = [Parser().parse_dict(document) for document in (base, environment, host)]
+        self.assertEqual(expected, load_layers(self.paths, workers=1))
+        self.assertEqual(expected, load_layers(self.paths, workers=2))
+
+    def test_merge_files(self):
+        translation_unit = merge_files(self.paths, workers=1, table_arrays=REPLACE)
+        self.assertEqual(merge(load_layers(self.paths, workers=1)), translation_unit.get_dict())
+        self.assertEqual({'plugins': [{'name': 'metrics'}]}, translation_unit.table_arrays)
+        self.assertIn('"prod-1"', translation_unit.get_result())
+
+
+if __name__ == '__main__':
+    unittest.main()
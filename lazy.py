@@ -0,0 +1,323 @@
+from collections.abc import Mapping, Sequence
+from lexer_fast import Token
+from parser_toml import Parser
+from sections import scan
+from translator_json import JSONTranslator
+
+# Arrays and inline tables of at least this many tokens are kept as tokens until they are read;
+# smaller ones are cheaper to translate along with their section
+DEFER_TOKENS = 32
+
+# Token types of the first key of a header, and how its text is translated
+KEY_TOKENS = {
+    'IDENTIFIER': lambda text: text,
+    'INTEGER': lambda text: text,
+    'FLOAT': lambda text: text.split('.')[0],
+    'STRING': lambda text: text[1:-1],
+    'LITERAL_STRING': lambda text: text[1:-1],
+}
+
+
+class Deferred:
+    """
+    Deferred class
+    Array or inline table value whose tokens haven't been parsed yet
+    Example: Deferred: 1200 tokens at line 42
+    """
+    __slots__ = ('tokens',)
+
+    def __init__(self, tokens):
+        self.tokens = tokens
+
+    def __repr__(self):
+        return f'Deferred: {len(self.tokens)} tokens at line {self.tokens[0].lineno}'
+
+
+class LazyTranslator(JSONTranslator):
+    """
+    LazyTranslator class
+    Builder translation unit that stores Deferred values as they are instead of converting them.
+    A Deferred inline table on the path of a later dotted key or header is parsed when the path reaches it.
+    """
+    def __init__(self, typed=False):
+        # parses the Deferred values met while a document is being parsed, by its own parser
+        self.value_parser = None
+        super().__init__(typed)
+
+    def reset(self):
+        super().reset()
+        # True once a Deferred value has been stored, so a key path may lead through one
+        self.deferred = False
+
+    def convert(self, type_, value):
+        if type(value) is Deferred:
+            self.deferred = True
+            return value
+        return super().convert(type_, value)
+
+    def resolve_prefix(self, key_path, root):
+        last_root, last_path, _ = self.last_prefix
+        if self.deferred and not (root is last_root and key_path == last_path):
+            self.expand(key_path, root)
+        return super().resolve_prefix(key_path, root)
+
+    def open_table(self, translated_keys):
+        if self.deferred:
+            self.expand(translated_keys, self.tables)
+        super().open_table(translated_keys)
+
+    def open_table_array(self, translated_keys):
+        if self.deferred:
+            self.expand(translated_keys[:-1], self.table_arrays)
+        super().open_table_array(translated_keys)
+
+    def expand(self, key_path, root):
+        """
+        Replaces the Deferred values on a path of translated keys by their translation
+        :param key_path: list of keys
+        :param root: dictionary to start from
+        """
+        current_dict = root
+        for key in key_path:
+            value = current_dict.get(key)
+            if type(value) is Deferred:
+                if self.value_parser is None:
+                    self.value_parser = Parser('json', builder=True, typed=self.typed,
+                                               numeric_arrays=self.numeric_arrays, intern=self.intern_pool)
+                value = current_dict[key] = parse_value(self.value_parser, value)
+            if type(value) is not dict:
+                return
+            current_dict = value
+
+
+def parse_value(parser, deferred):
+    """
+    Parses the tokens of a Deferred value with a builder parser and returns its translation
+    """
+    parser.translation_unit.reset()
+    parser.parse_tokens([Token('IDENTIFIER', 'value', 0, 0), Token('EQUALS', '=', 0, 0), *deferred.tokens])
+    return parser.translation_unit.get_dict()['value']
+
+
+def defer_values(tokens):
+    """
+    Replaces the large arrays and inline tables assigned to keys by a single token holding a Deferred
+    The token has the INTEGER type so the grammar accepts it as a value; LazyTranslator passes it through.
+    :param tokens: tokens of whole sections
+    :return: list of tokens
+    """
+    result = []
+    position = 0
+    count = len(tokens)
+    while position < count:
+        token = tokens[position]
+        result.append(token)
+        position += 1
+        if token.type != 'EQUALS' or position == count or tokens[position].type not in ('LBRACKET', 'LBRACE'):
+            continue
+
+        end = position
+        depth = 0
+        while True:
+            type_ = tokens[end].type
+            if type_ == 'LBRACKET' or type_ == 'LBRACE':
+                depth += 1
+            elif type_ == 'RBRACKET' or type_ == 'RBRACE':
+                depth -= 1
+            end += 1
+            if depth == 0:
+                break
+        if end - position >= DEFER_TOKENS:
+            first = tokens[position]
+            result.append(Token('INTEGER', Deferred(tokens[position:end]), first.lineno, first.lexpos))
+            position = end
+    return result
+
+
+class LazyDocument(Mapping):
+    """
+    LazyDocument class
+    Read-only mapping over a TOML document that translates its parts when they are read.
+    Opening the document only lexes it to find its table and table array headers. The value of a
+    top-level key is parsed the first time it is read, from the sections whose header starts with
+    that key; large arrays and inline tables inside it stay as tokens until they are read in turn.
+    Syntax errors inside a section are raised when the section is read.
+    """
+    def __init__(self, text, typed=False, numeric_arrays=None, intern=None):
+        """
+        :param text: TOML document
+        :param typed: return dates and times as datetime, date and time objects instead of strings
+        :param numeric_arrays: None for lists, 'array' or 'numpy' for typed buffers, as with Parser
+        :param intern: True or an interning.InternPool to intern the keys, as with Parser
+        :raises SyntaxError: if the brackets and braces of the document aren't balanced
+        :raises LexError: if the document contains an invalid token
+        """
+        self.text = text
+        self.parser = Parser('json', builder=True, typed=typed, numeric_arrays=numeric_arrays, intern=intern)
+        self.translation_unit = LazyTranslator(typed)
+        self.translation_unit.numeric_arrays = numeric_arrays
+        self.translation_unit.set_intern_pool(self.parser.translation_unit.intern_pool)
+        self.parser.translation_unit = self.translation_unit
+
+        # first key -> [(start, end, line number)] of the sections whose header starts with it
+        self.sections = {}
+        root_end = len(text)
+        start = lineno = key = None
+        # tokens since the '[' of the last header while its first key hasn't been seen
+        pending = 0
+        for token, header in scan(text):
+            if header:
+                if key is not None:
+                    self.sections[key].append((start, token.lexpos, lineno))
+                else:
+                    root_end = token.lexpos
+                start = token.lexpos
+                lineno = token.lineno
+                pending = 1
+            elif pending == 1 and token.type == 'LBRACKET':
+                # second '[' of a table array header
+                pending = 2
+            elif pending:
+                pending = 0
+                convert = KEY_TOKENS.get(token.type)
+                if convert is None:
+                    raise SyntaxError(f'Syntax error at line {token.lineno}, token={token.value}, '
+                                      f'character={token.lexpos}, type={token.type}')
+                key = convert(token.value)
+                self.sections.setdefault(key, [])
+        if key is not None:
+            self.sections[key].append((start, len(text), lineno))
+
+        self.root_tokens = [token for token, _ in scan(text, 0, root_end)]
+        self.root = self.translate(self.root_tokens)
+        # top-level key -> translated value, filled as the keys are read
+        self.values = {}
+
+    def __repr__(self):
+        return f'LazyDocument: {len(self)} keys, {len(self.values)} translated'
+
+    def translate(self, tokens):
+        """
+        Parses tokens with their large values deferred and returns the resulting dictionary
+        """
+        self.translation_unit.reset()
+        if tokens:
+            self.parser.parse_tokens(defer_values(tokens))
+        return self.translation_unit.get_dict()
+
+    def materialize(self, deferred):
+        """
+        Parses the tokens of a Deferred value and returns its translation
+        """
+        return parse_value(self.parser, deferred)
+
+    def wrap(self, value):
+        """
+        Returns the value to give for a translated value: tables and table arrays are wrapped
+        in lazy views, Deferred values are parsed
+        """
+        type_ = type(value)
+        if type_ is dict:
+            return LazyTable(self, value)
+        if type_ is list and value and type(value[0]) is dict:
+            return LazyArray(self, value)
+        if type_ is Deferred:
+            return self.materialize(value)
+        return value
+
+    def __getitem__(self, key):
+        value = self.values.get(key)
+        if value is None:
+            sections = self.sections.get(key)
+            if sections is None:
+                value = self.root[key]
+            else:
+                # the sections of other keys can't change this one, but the root section can
+                tokens = list(self.root_tokens) if key in self.root else []
+                for start, end, lineno in sections:
+                    tokens.extend(token for token, _ in scan(self.text, start, end, lineno))
+                value = self.translate(tokens)[key]
+            if type(value) is Deferred:
+                value = self.materialize(value)
+            self.values[key] = value
+        return self.wrap(value)
+
+    def __iter__(self):
+        yield from self.root
+        for key in self.sections:
+            if key not in self.root:
+                yield key
+
+    def __len__(self):
+        return len(self.root) + sum(key not in self.root for key in self.sections)
+
+    def to_dict(self):
+        return materialize(self)
+
+
+class LazyTable(Mapping):
+    """
+    LazyTable class
+    Read-only mapping over a translated table whose Deferred values are parsed when they are read
+    """
+    __slots__ = ('document', 'table')
+
+    def __init__(self, document, table):
+        self.document = document
+        self.table = table
+
+    def __repr__(self):
+        return f'LazyTable: {len(self.table)} keys'
+
+    def __getitem__(self, key):
+        value = self.table[key]
+        if type(value) is Deferred:
+            # parsed once, then kept in place of its tokens
+            value = self.table[key] = self.document.materialize(value)
+        return self.document.wrap(value)
+
+    def __iter__(self):
+        return iter(self.table)
+
+    def __len__(self):
+        return len(self.table)
+
+    def to_dict(self):
+        return materialize(self)
+
+
+class LazyArray(Sequence):
+    """
+    LazyArray class
+    Read-only sequence over a table array whose tables are wrapped in LazyTable views
+    """
+    __slots__ = ('document', 'array')
+
+    def __init__(self, document, array):
+        self.document = document
+        self.array = array
+
+    def __repr__(self):
+        return f'LazyArray: {len(self.array)} tables'
+
+    def __getitem__(self, position):
+        if isinstance(position, slice):
+            return [self.document.wrap(value) for value in self.array[position]]
+        return self.document.wrap(self.array[position])
+
+    def __len__(self):
+        return len(self.array)
+
+    def to_list(self):
+        return materialize(self)
+
+
+def materialize(value):
+    """
+    Converts lazy views to dictionaries and lists, recursively
+    """
+    if isinstance(value, Mapping):
+        return {key: materialize(item) for key, item in value.items()}
+    if isinstance(value, (LazyArray, list)):
+        return [materialize(item) for item in value]
+    return value
@@ -0,0 +1,108 @@
+import datetime
+import random
+import unittest
+from lazy import Deferred, LazyArray, LazyDocument, LazyTable, DEFER_TOKENS
+from parser_toml import Parser
+from toml_loader import loads
+
+# Test data
+numbers = ', '.join(str(number) for number in range(DEFER_TOKENS))
+toml_document = f'''title = "lazy"
+server.host = "localhost"
+big = [{numbers}]
+when = 1979-05-27T07:32:00Z
+
+[server.pool]
+size = 8
+options = {{ sizes = [{numbers}], nested = {{ on = true }} }}
+
+[[fruit]]
+name = "apple"
+colors = ["red", "green"]
+
+[[fruit]]
+name = "banana"
+
+["quoted key".x]
+value = 1
+
+[[ 1.2 ]]
+z = 3
+'''
+pairs = ', '.join(f'k{number} = {number}' for number in range(12))
+toml_extended = [f'a = {{ {pairs} }}\na.extra = 1\n', f'a = {{ {pairs} }}\n[a.b]\nc = 1\n']
+
+
+class LazyDocumentTestCase(unittest.TestCase):
+
+    def test_equivalence(self):
+        for typed in (False, True):
+            document = LazyDocument(toml_document, typed)
+            self.assertEqual(Parser(typed=typed).parse_dict(toml_document), document.to_dict())
+
+    def test_nothing_translated_on_open(self):
+        document = LazyDocument(toml_document)
+        self.assertEqual(['title', 'server', 'big', 'when', 'fruit', 'quoted key', '1'], list(document))
+        self.assertEqual(7, len(document))
+        self.assertEqual({}, document.values)
+        self.assertIsInstance(document.root['big'], Deferred)
+
+    def test_on_demand(self):
+        document = LazyDocument(toml_document)
+        self.assertEqual(8, document['server']['pool']['size'])
+        self.assertEqual(['server'], list(document.values))
+        table = document['server']['pool']
+        self.assertIsInstance(table, LazyTable)
+        self.assertIsInstance(table.table['options'], Deferred)
+        self.assertEqual(31, table['options']['sizes'][-1])
+        # the deferred value is replaced by its translation once read
+        self.assertIsInstance(table.table['options'], dict)
+        self.assertEqual('localhost', document['server']['host'])
+
+        fruit = document['fruit']
+        self.assertIsInstance(fruit, LazyArray)
+        self.assertEqual(['apple', 'banana'], [item['name'] for item in fruit])
+        self.assertEqual(['red', 'green'], fruit[0]['colors'])
+        self.assertEqual(list(range(DEFER_TOKENS)), document['big'])
+        with self.assertRaises(KeyError):
+            document['missing']
+
+    def test_typed(self):
+        document = loads(toml_document, typed=True, lazy=True)
+        self.assertEqual(datetime.datetime(1979, 5, 27, 7, 32, tzinfo=datetime.timezone.utc), document['when'])
+
+    def test_errors(self):
+        with self.assertRaises(SyntaxError):
+            LazyDocument('a = [1, 2')
+        # a section is only parsed when it is read
+        document = LazyDocument('a = 1\n[b]\nc = = 2\n')
+        self.assertEqual(1, document['a'])
+        with self.assertRaises(SyntaxError):
+            document['b']
+
+    def test_extended_inline_table(self):
+        # a deferred inline table is parsed when a dotted key or a header adds to it
+        for text in toml_extended:
+            expected = Parser().parse_dict(text)
+            self.assertEqual(expected['a'], loads(text, lazy=True)['a'])
+            self.assertEqual(expected, LazyDocument(text).to_dict())
+
+    def test_random_documents(self):
+        generator = random.Random(0)
+        headers = ['[a]', '[a.b]', '[[c]]', '[c.d]', '[[c.e]]', '[f]', '[inline.t]']
+        expressions = ['x = 1', 'y.z = "s"', f'big = [{numbers}]', f'inline = {{ w = [{numbers}] }}', 'v = [[1], [2]]',
+                       'inline.u = 1']
+        for _ in range(200):
+            lines = []
+            for _ in range(generator.randint(0, 8)):
+                lines.append(generator.choice(headers + expressions))
+            text = '\n'.join(lines)
+            try:
+                expected = Parser().parse_dict(text)
+            except Exception:
+                continue
+            self.assertEqual(expected, LazyDocument(text).to_dict(), text)
+
+
+if __name__ == '__main__':
+    unittest.main()
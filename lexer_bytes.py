@@ -0,0 +1,145 @@
+import contextlib
+import mmap
+import re
+from ply.lex import LexError
+from lexer_fast import (FastLexer, Token, NUMBER_RULES, SIGN_RULES, BOOLEAN_RULES, IDENTIFIER_RULE, STRING_RULES,
+                        LITERAL_STRING_RULES, NEWLINE_RULE, COMMENT_RULE, PUNCTUATION, NUMBER_START, SIGN_START,
+                        BOOLEAN_START)
+
+
+def to_bytes(rule):
+    """
+    Compiles a FastLexer rule for bytes
+    On bytes, \\w, \\d and \\b only know ASCII characters, see BytesLexer.identifier for the others
+    """
+    return re.compile(rule.pattern.encode())
+
+
+NUMBER_BYTES = to_bytes(NUMBER_RULES)
+SIGN_BYTES = to_bytes(SIGN_RULES)
+BOOLEAN_BYTES = to_bytes(BOOLEAN_RULES)
+IDENTIFIER_BYTES = to_bytes(IDENTIFIER_RULE)
+STRING_BYTES = to_bytes(STRING_RULES)
+LITERAL_STRING_BYTES = to_bytes(LITERAL_STRING_RULES)
+NEWLINE_BYTES = to_bytes(NEWLINE_RULE)
+COMMENT_BYTES = to_bytes(COMMENT_RULE)
+# Bytes that may belong to an identifier made of non-ASCII characters
+WORD_BYTES = re.compile(rb'[\w\x80-\xff-]+')
+# Bytes after an ASCII identifier that mean it may continue with non-ASCII characters
+AMBIGUOUS = frozenset(bytes([byte]) for byte in range(0x80, 0x100)) | {b'-'}
+
+PUNCTUATION_BYTES = {ord(char): type_ for char, type_ in PUNCTUATION.items()}
+PUNCTUATION_CHARS = {ord(char): char for char in PUNCTUATION}
+NUMBER_START_BYTES = frozenset(map(ord, NUMBER_START))
+SIGN_START_BYTES = frozenset(map(ord, SIGN_START))
+BOOLEAN_START_BYTES = frozenset(map(ord, BOOLEAN_START))
+
+
+class BytesLexer(FastLexer):
+    """
+    FastLexer working on UTF-8 bytes, e.g. a memory-mapped file, instead of a str
+    The document is never decoded as a whole: only the text of each token is.
+    The lexpos of the tokens are byte offsets.
+    """
+    ignore = frozenset(map(ord, FastLexer.ignore))
+
+    def __init__(self, cache_key=None):
+        super().__init__(cache_key)
+        self.data = b''
+
+    def token(self):
+        data = self.data
+        pos = self.pos
+        length = len(data)
+        ignore = self.ignore
+        while pos < length:
+            byte = data[pos]
+
+            if byte in ignore:
+                pos += 1
+                continue
+
+            type_ = PUNCTUATION_BYTES.get(byte)
+            if type_ is not None:
+                self.pos = pos + 1
+                return Token(type_, PUNCTUATION_CHARS[byte], self.lineno, pos + self.offset)
+
+            if byte in NUMBER_START_BYTES:
+                match = NUMBER_BYTES.match(data, pos)
+            elif byte == 10 or byte == 13:
+                end = NEWLINE_BYTES.match(data, pos).end()
+                self.lineno += end - pos
+                pos = end
+                continue
+            elif byte == 35:
+                # Lexer.t_COMMENT skips one more character after the comment
+                pos = COMMENT_BYTES.match(data, pos).end() + 1
+                continue
+            elif byte == 34:
+                match = STRING_BYTES.match(data, pos)
+            elif byte == 39:
+                match = LITERAL_STRING_BYTES.match(data, pos)
+            elif byte in BOOLEAN_START_BYTES:
+                match = BOOLEAN_BYTES.match(data, pos)
+            elif byte in SIGN_START_BYTES:
+                match = SIGN_BYTES.match(data, pos)
+            else:
+                match = IDENTIFIER_BYTES.match(data, pos)
+
+            if match is None or match.lastgroup == 'IDENTIFIER' and data[match.end():match.end() + 1] in AMBIGUOUS:
+                # on bytes, \w and \b don't know the non-ASCII characters: match on the decoded text
+                type_ = 'IDENTIFIER'
+                end = self.identifier(pos)
+            else:
+                type_ = match.lastgroup
+                end = match.end()
+
+            if end is None:
+                char = data[pos:pos + 4].decode('utf-8', 'replace')[0]
+                print("Illegal character '%s'" % char)
+                raise LexError("Scanning error. Illegal character '%s'" % char, data[pos:])
+
+            self.pos = end
+            return Token(type_, data[pos:end].decode('utf-8'), self.lineno, pos + self.offset)
+
+        self.pos = pos
+        return None
+
+    def identifier(self, pos):
+        """
+        Matches an identifier containing non-ASCII characters on its decoded text
+        :return: end of the identifier, or None if there is none at pos
+        """
+        data = self.data
+        words = WORD_BYTES.match(data, pos)
+        if words is None:
+            return None
+        # the character before the identifier decides whether it starts at a word boundary
+        start = pos
+        while start > max(pos - 4, 0) and 0x80 <= data[start - 1] < 0xc0:
+            start -= 1
+        if start > 0:
+            start -= 1
+        text = data[start:words.end()].decode('utf-8', 'ignore')
+        before = len(data[start:pos].decode('utf-8', 'ignore'))
+        match = IDENTIFIER_RULE.match(text, before)
+        if match is None:
+            return None
+        return pos + len(match.group().encode('utf-8'))
+
+
+@contextlib.contextmanager
+def mapped(path):
+    """
+    Memory-maps a file for reading, for the whole with block
+    Empty files, which can't be mapped, are given as empty bytes
+    :param path: path of the file
+    """
+    with open(path, 'rb') as f:
+        try:
+            data = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        except ValueError:
+            yield b''
+            return
+        with data:
+            yield data
@@ -0,0 +1,133 @@
+import re
+from ply.lex import LexError
+from lexer_toml import Lexer
+
+
+class Token:
+    """
+    Token class
+    Lightweight replacement for PLY's LexToken, with the attributes the parser uses
+    Example: Token(INTEGER,'42',1,6)
+    """
+    __slots__ = ('type', 'value', 'lineno', 'lexpos', 'lexer')
+
+    def __init__(self, type_, value, lineno, lexpos):
+        self.type = type_
+        self.value = value
+        self.lineno = lineno
+        self.lexpos = lexpos
+
+    def __repr__(self):
+        return f'Token({self.type},{self.value!r},{self.lineno},{self.lexpos})'
+
+
+def rule_regex(name):
+    """
+    Returns the regex of a Lexer rule
+    """
+    return getattr(Lexer, 't_' + name).__doc__
+
+
+def combine(names):
+    """
+    Compiles the rules into a single regex that, like PLY's master regex,
+    matches the first rule in the given order that matches
+    """
+    return re.compile('|'.join(f'(?P<{name}>{rule_regex(name)})' for name in names))
+
+
+# Rules that can match a token starting with each kind of character, in the order PLY tries them
+NUMBER_RULES = combine(['OFFSET_DATE_TIME', 'LOCAL_DATE_TIME', 'LOCAL_DATE', 'LOCAL_TIME', 'FLOAT',
+                        'HEX_INTEGER', 'OCT_INTEGER', 'BIN_INTEGER', 'INTEGER', 'IDENTIFIER'])
+SIGN_RULES = combine(['FLOAT', 'INTEGER', 'IDENTIFIER'])
+BOOLEAN_RULES = combine(['BOOLEAN', 'IDENTIFIER'])
+IDENTIFIER_RULE = combine(['IDENTIFIER'])
+STRING_RULES = combine(['MULTILINE_STRING', 'STRING'])
+LITERAL_STRING_RULES = combine(['LITERAL_MULTILINE_STRING', 'LITERAL_STRING'])
+NEWLINE_RULE = re.compile(rule_regex('NEWLINE'))
+COMMENT_RULE = re.compile(rule_regex('COMMENT'))
+
+PUNCTUATION = {
+    '.': 'DOT',
+    '=': 'EQUALS',
+    ',': 'COMMA',
+    '[': 'LBRACKET',
+    ']': 'RBRACKET',
+    '{': 'LBRACE',
+    '}': 'RBRACE',
+}
+NUMBER_START = frozenset('0123456789')
+SIGN_START = frozenset('+-')
+BOOLEAN_START = frozenset('tf')
+
+
+class FastLexer:
+    """
+    Hand-written lexer producing the same tokens as Lexer
+    Instead of trying every rule through PLY's master regex, it dispatches on the
+    first character of the token and only tries the rules that can start with it
+    """
+    tokens = Lexer.tokens
+    ignore = frozenset(Lexer.t_ignore)
+
+    def __init__(self, cache_key=None):
+        self.data = ''
+        self.pos = 0
+        self.lineno = 1
+        # added to the lexpos of the tokens when data is a part of a larger document
+        self.offset = 0
+
+    def input(self, data):
+        self.data = data
+        self.pos = 0
+        self.lineno = 1
+        self.offset = 0
+
+    def token(self):
+        data = self.data
+        pos = self.pos
+        length = len(data)
+        ignore = self.ignore
+        while pos < length:
+            char = data[pos]
+
+            if char in ignore:
+                pos += 1
+                continue
+
+            type_ = PUNCTUATION.get(char)
+            if type_ is not None:
+                self.pos = pos + 1
+                return Token(type_, char, self.lineno, pos + self.offset)
+
+            if char in NUMBER_START:
+                match = NUMBER_RULES.match(data, pos)
+            elif char == '\n' or char == '\r':
+                end = NEWLINE_RULE.match(data, pos).end()
+                self.lineno += end - pos
+                pos = end
+                continue
+            elif char == '#':
+                # Lexer.t_COMMENT skips one more character after the comment
+                pos = COMMENT_RULE.match(data, pos).end() + 1
+                continue
+            elif char == '"':
+                match = STRING_RULES.match(data, pos)
+            elif char == "'":
+                match = LITERAL_STRING_RULES.match(data, pos)
+            elif char in BOOLEAN_START:
+                match = BOOLEAN_RULES.match(data, pos)
+            elif char in SIGN_START:
+                match = SIGN_RULES.match(data, pos)
+            else:
+                match = IDENTIFIER_RULE.match(data, pos)
+
+            if match is None:
+                print("Illegal character '%s'" % char)
+                raise LexError("Scanning error. Illegal character '%s'" % char, data[pos:])
+
+            self.pos = match.end()
+            return Token(match.lastgroup, match.group(), self.lineno, pos + self.offset)
+
+        self.pos = pos
+        return None
@@ -0,0 +1,69 @@
+import io
+from lexer_fast import FastLexer
+
+# Number of characters read from the file at a time
+CHUNK_SIZE = 65536
+
+
+class StreamLexer(FastLexer):
+    """
+    FastLexer reading its input from a file object chunk by chunk
+    Only whole lines are lexed, so no token but a multiline string can continue after the
+    lexed text; a multiline string whose end hasn't been read yet is lexed again once more
+    lines are read. The text already lexed is dropped, so memory doesn't grow with the file.
+    """
+    def __init__(self, cache_key=None, chunk_size=CHUNK_SIZE):
+        super().__init__(cache_key)
+        self.chunk_size = chunk_size
+        self.file = None
+        # text read after the last complete line, not lexed yet
+        self.pending = ''
+        self.eof = True
+
+    def input(self, file):
+        """
+        :param file: file object opened in text mode, or in binary mode for UTF-8 contents
+        """
+        super().input('')
+        if not isinstance(file, io.TextIOBase):
+            file = io.TextIOWrapper(file, encoding='utf-8')
+        self.file = file
+        self.pending = ''
+        self.eof = False
+
+    def refill(self):
+        """
+        Drops the lexed text and reads at least one more line, or the rest of the file
+        """
+        self.offset += self.pos
+        text = self.data[self.pos:] + self.pending
+        lexable = len(self.data) - self.pos
+        end = text.rfind('\n') + 1
+        while end <= lexable and not self.eof:
+            chunk = self.file.read(self.chunk_size)
+            if not chunk:
+                self.eof = True
+            text += chunk
+            end = text.rfind('\n') + 1
+        if self.eof:
+            end = len(text)
+        self.data = text[:end]
+        self.pending = text[end:]
+        self.pos = 0
+
+    def token(self):
+        while True:
+            token = super().token()
+            if token is None:
+                if self.eof:
+                    return None
+                self.refill()
+                continue
+
+            value = token.value
+            if not self.eof and (value == '""' or value == "''") and self.data[self.pos:self.pos + 1] == value[0]:
+                # the start of a multiline string whose end hasn't been read yet
+                self.pos = token.lexpos - self.offset
+                self.refill()
+                continue
+            return token
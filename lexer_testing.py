@@ -1,4 +1,11 @@
+import contextlib
+import io
+import random
 import unittest
+from ply.lex import LexError
+from lexer_bytes import BytesLexer
+from lexer_fast import FastLexer
+from lexer_stream import StreamLexer
 from lexer_toml import Lexer
 
 # Test data
@@ -264,5 +271,103 @@ class LexerTestCase(unittest.TestCase):
             self.assertEqual(expected, actual)
 
 
+class FastLexerTestCase(unittest.TestCase):
+
+    def test_equivalence(self):
+        documents = [full_line_comment, inline_comment, comment_in_string, valid_integers, valid_floats,
+                     valid_offsets, valid_local_date_time, valid_local_date, valid_local_time, valid_string,
+                     valid_multiline_string, 'a = 1 # comment\r\nb = true_ish\n[[t.u]]\nc = { d = -1e3 }']
+        # random documents exercise the order in which the rules are tried
+        alphabet = list('abtfrue019xo_-+.eE:TZ =,[]{}#"\'\n\r\t') + ['true', '1979-05-27', '07:32:00', "'''", '"""']
+        generator = random.Random(0)
+        for _ in range(2000):
+            documents.append(''.join(generator.choice(alphabet) for _ in range(generator.randint(1, 30))))
+
+        ply_lexer = Lexer()
+        fast_lexer = FastLexer()
+        with contextlib.redirect_stdout(io.StringIO()):
+            for document in documents:
+                self.assertEqual(self.tokens(ply_lexer, document), self.tokens(fast_lexer, document), document)
+
+    def test_illegal_character(self):
+        lexer = FastLexer()
+        lexer.input('key = @')
+        with contextlib.redirect_stdout(io.StringIO()):
+            with self.assertRaises(LexError):
+                while lexer.token():
+                    pass
+
+    @staticmethod
+    def tokens(lexer, document):
+        """
+        Returns the (type, value, lineno, lexpos) of every token, ending with the error message if any
+        """
+        lexer.input(document)
+        result = []
+        try:
+            token = lexer.token()
+            while token:
+                result.append((token.type, token.value, token.lineno, token.lexpos))
+                token = lexer.token()
+        except LexError as e:
+            result.append(str(e))
+        return result
+
+
+class StreamLexerTestCase(unittest.TestCase):
+
+    def test_equivalence(self):
+        # tiny chunks cut the multiline strings and comments everywhere
+        alphabet = list('abtfrue019_-.=,[]{}#"\'\n\n\n ') + ['true', '1979-05-27', "'''", '"""']
+        generator = random.Random(0)
+        fast_lexer = FastLexer()
+        with contextlib.redirect_stdout(io.StringIO()):
+            for _ in range(1000):
+                document = ''.join(generator.choice(alphabet) for _ in range(generator.randint(1, 100)))
+                stream_lexer = StreamLexer(chunk_size=generator.randint(1, 20))
+                # the error messages hold the rest of the input, which the stream lexer hasn't read
+                expected = [token[:3] for token in FastLexerTestCase.tokens(fast_lexer, document)]
+                actual = [token[:3] for token in FastLexerTestCase.tokens(stream_lexer, io.StringIO(document))]
+                self.assertEqual(expected, actual, document)
+
+
+class BytesLexerTestCase(unittest.TestCase):
+
+    def test_equivalence(self):
+        # non-ASCII characters are where matching on bytes differs from matching on str
+        alphabet = list('abtfrue019xo_-+.eE:TZ =,[]{}#"\'\n\r\t') + ['true', '1979-05-27', '07:32:00', "'''", '"""',
+                                                                   'é', 'ü', '→', '日本', '-é']
+        generator = random.Random(0)
+        fast_lexer = FastLexer()
+        bytes_lexer = BytesLexer()
+        with contextlib.redirect_stdout(io.StringIO()):
+            for _ in range(2000):
+                document = ''.join(generator.choice(alphabet) for _ in range(generator.randint(1, 30)))
+                self.assertEqual(self.tokens(fast_lexer, document), self.tokens(bytes_lexer, document.encode()),
+                                 document)
+
+    def test_byte_positions(self):
+        lexer = BytesLexer()
+        lexer.input('clé = "é"'.encode())
+        self.assertEqual([0, 5, 7], [token.lexpos for token in iter(lexer.token, None)])
+
+    @staticmethod
+    def tokens(lexer, document):
+        """
+        Returns the (type, value, lineno) of every token, ending with None if the lexer failed
+        (positions and error messages are in bytes for BytesLexer)
+        """
+        lexer.input(document)
+        result = []
+        try:
+            token = lexer.token()
+            while token:
+                result.append((token.type, token.value, token.lineno))
+                token = lexer.token()
+        except LexError:
+            result.append(None)
+        return result
+
+
 if __name__ == '__main__':
     unittest.main()
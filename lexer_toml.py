@@ -1,4 +1,5 @@
 import ply.lex as lex
+import parser_cache
 
 
 class Lexer:
@@ -144,8 +145,12 @@ class Lexer:
         r'\b[\w-]+\b'
         return t
 
-    def __init__(self):
-        self.lex = lex.lex(module=self)
+    def __init__(self, cache_key=None):
+        if cache_key is None:
+            self.lex = lex.lex(module=self)
+        else:
+            # Clone the lexer built for this grammar instead of rebuilding it
+            self.lex = parser_cache.build_lexer(self, cache_key)
 
     # Token rules
 
@@ -157,4 +162,5 @@ class Lexer:
         return self.lex.token()
 
     def input(self, data):
+        self.lex.lineno = 1
         self.lex.input(data)
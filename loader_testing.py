@@ -0,0 +1,92 @@
+import datetime
+import io
+import os
+import tempfile
+import unittest
+from toml_loader import load, loads
+
+# Test data
+toml_document = '''title = "TOML"
+1234 = "digits"
+dates = [ 1979-05-27T07:32:00Z, 1979-05-27T00:32:00-07:00, 1979-05-27 07:32:00, 1979-05-27, 07:32:00 ]
+
+[owner]
+name = "Tom"
+point = { x = 1, y = 2.5 }
+
+[[products]]
+name = "Hammer"
+
+[[products]]
+name = "Nail"
+'''
+dict_expected = {
+    'title': 'TOML',
+    '1234': 'digits',
+    'dates': ['1979-05-27T07:32:00Z', '1979-05-27T00:32:00-07:00', '1979-05-27 07:32:00', '1979-05-27', '07:32:00'],
+    'owner': {
+        'name': 'Tom',
+        'point': {'x': 1, 'y': 2.5},
+    },
+    'products': [
+        {'name': 'Hammer'},
+        {'name': 'Nail'},
+    ],
+}
+dates_typed_expected = [
+    datetime.datetime(1979, 5, 27, 7, 32, tzinfo=datetime.timezone.utc),
+    datetime.datetime(1979, 5, 27, 0, 32, tzinfo=datetime.timezone(datetime.timedelta(hours=-7))),
+    datetime.datetime(1979, 5, 27, 7, 32),
+    datetime.date(1979, 5, 27),
+    datetime.time(7, 32),
+]
+
+
+class LoaderTestCase(unittest.TestCase):
+
+    def test_loads(self):
+        self.assertEqual(dict_expected, loads(toml_document))
+
+    def test_loads_bytes(self):
+        self.assertEqual(dict_expected, loads(toml_document.encode('utf-8')))
+
+    def test_loads_typed(self):
+        actual = loads(toml_document, typed=True)
+        self.assertEqual(dates_typed_expected, actual['dates'])
+        self.assertEqual(dict_expected['owner'], actual['owner'])
+
+    def test_loads_typed_offsets(self):
+        actual = loads('a = [1979-05-27T07:32:00+05:30, 1980-01-01t00:00:00+05:30, 1979-05-27 07:32:00-00:00]\n'
+                       'b = [1979-05-27T07:32:00z, 1979-05-27, 07:32:00]', typed=True)
+        india = datetime.timezone(datetime.timedelta(hours=5, minutes=30))
+        self.assertEqual([datetime.datetime(1979, 5, 27, 7, 32, tzinfo=india),
+                          datetime.datetime(1980, 1, 1, tzinfo=india),
+                          datetime.datetime(1979, 5, 27, 7, 32, tzinfo=datetime.timezone.utc)], actual['a'])
+        # the values with the same offset share their time zone
+        self.assertIs(actual['a'][0].tzinfo, actual['a'][1].tzinfo)
+        self.assertIs(datetime.timezone.utc, actual['a'][2].tzinfo)
+        self.assertEqual([datetime.datetime(1979, 5, 27, 7, 32, tzinfo=datetime.timezone.utc),
+                          datetime.date(1979, 5, 27), datetime.time(7, 32)], actual['b'])
+
+    def test_load_path(self):
+        with tempfile.TemporaryDirectory() as directory:
+            path = os.path.join(directory, 'config.toml')
+            with open(path, 'w', encoding='utf-8') as f:
+                f.write(toml_document)
+            self.assertEqual(dict_expected, load(path))
+
+    def test_load_non_ascii(self):
+        document = 'clé = "café"\n[日本]\nnom = "ü"\n'
+        with tempfile.TemporaryDirectory() as directory:
+            path = os.path.join(directory, 'config.toml')
+            with open(path, 'w', encoding='utf-8') as f:
+                f.write(document)
+            self.assertEqual(loads(document), load(path))
+
+    def test_load_file_object(self):
+        self.assertEqual(dict_expected, load(io.StringIO(toml_document)))
+        self.assertEqual(dict_expected, load(io.BytesIO(toml_document.encode('utf-8'))))
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -1,18 +1,71 @@
+import argparse
 import sys
+from batch import convert_batch
+from layers import merge_files, APPEND, REPLACE
+from lexer_bytes import mapped
+from parallel import parse_parallel
 from parser_toml import Parser
+from translator_jsonl import JSONLinesTranslator
+from translator_tomml import TRANSLATORS
 
 
 def main():
-    language = sys.argv[1]
-    file_path = sys.argv[2]
+    arguments = argparse.ArgumentParser(description='Translate TOML files')
+    arguments.add_argument('language', type=str.lower, choices=sorted(TRANSLATORS),
+                           help='output language: json, jsonl for one line per table array item, '
+                                'msgpack for MessagePack, or snapshot to compile a binary snapshot '
+                                'loaded lazily with snapshot.Snapshot')
+    arguments.add_argument('file_path', nargs='+', help='TOML file (with --batch: files, directories or globs)')
+    arguments.add_argument('--batch', action='store_true',
+                           help='translate many files in a process pool, writing each output next to its input')
+    arguments.add_argument('--output-dir', help='with --batch, write the outputs into this directory tree')
+    arguments.add_argument('--parallel', action='store_true',
+                           help='split one large file at its table headers and parse the parts in a process pool')
+    arguments.add_argument('--merge', action='store_true',
+                           help='merge the files as layers, each overriding the ones before it, into one output')
+    arguments.add_argument('--table-arrays', choices=[REPLACE, APPEND], default=REPLACE,
+                           help='with --merge, replace or append the arrays of tables found in several layers')
+    arguments.add_argument('--workers', type=int,
+                           help='with --batch, --parallel or --merge, number of processes (default: CPU count)')
+    args = arguments.parse_args()
 
-    parser = Parser(language)
-    with open(file_path, 'r') as f:
-        toml = f.read()
-    output = parser.parse(toml)
+    if args.batch:
+        converted, failures, seconds = convert_batch(args.file_path, args.language, args.output_dir, args.workers)
+        for path, error in failures:
+            print(f'{path}: {error}', file=sys.stderr)
+        rate = (converted + len(failures)) / seconds if seconds else 0
+        print(f'Converted {converted} files, {len(failures)} failed, in {seconds:.2f}s ({rate:.1f} files/s)')
+        sys.exit(1 if failures else 0)
 
-    with open('output.' + language.lower(), 'w') as f:
-        f.write(output)
+    if len(args.file_path) != 1 and not args.merge:
+        arguments.error('translating several files requires --batch or --merge')
+
+    language = args.language
+    file_path = args.file_path[0]
+
+    output_path = 'output.' + language.lower()
+    if args.merge:
+        translation_unit = merge_files(args.file_path, language, table_arrays=args.table_arrays,
+                                       workers=args.workers)
+    elif args.parallel:
+        with open(file_path, 'r', encoding='utf-8') as f:
+            translation_unit = parse_parallel(f.read(), language, args.workers)
+    else:
+        # the file is lexed where it is mapped, without reading it into a str
+        parser = Parser(language, builder=True, lexer_backend='bytes')
+        translation_unit = parser.translation_unit
+        with mapped(file_path) as toml:
+            if isinstance(translation_unit, JSONLinesTranslator):
+                # table array items are written as soon as they are complete
+                with open(output_path, 'w') as f:
+                    translation_unit.output = f
+                    parser.translate(toml)
+                    translation_unit.write_result(f)
+                return
+            parser.translate(toml)
+
+    with open(output_path, 'wb' if translation_unit.binary else 'w') as f:
+        translation_unit.write_result(f)
 
 if __name__ == '__main__':
     main()
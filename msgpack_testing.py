@@ -0,0 +1,98 @@
+import datetime
+import io
+import unittest
+from key_val import KeyVal
+from parser_toml import Parser
+from translator_json import JSONTranslator
+from translator_msgpack import packb, unpackb
+from translator_tomml import register_translator, TranslatorUnit, TRANSLATORS
+
+# Test data
+toml_document = '''title = "binary"
+numbers = [0, 127, 128, -32, -33, 65536, 9223372036854775807, -9223372036854775808]
+floats = [1.5, -0.0, 1e300]
+long = "a very long string that needs more than thirty-one bytes, é"
+flags = { on = true, off = false }
+[[items]]
+id = 1
+'''
+values = [0, 127, 128, -1, -32, -33, -129, 255, 256, 65535, 65536, 2 ** 32, 2 ** 63 - 1, -2 ** 63, 1.5, '',
+          'x' * 31, 'x' * 32, 'é' * 200, 'y' * 70000, [], [1] * 15, [1] * 16, [1] * 70000, {},
+          {str(number): number for number in range(16)}, True, False, None, {'a': [{'b': 1.0}]}]
+
+
+class UpperTranslator(JSONTranslator):
+    def get_result(self):
+        return super().get_result().upper()
+
+
+class KeysTranslator(TranslatorUnit):
+    """
+    Translator implementing only the AST mode methods: lists the keys assigned by a document
+    """
+    def reset(self):
+        self.keys = []
+
+    def translate(self, list_):
+        for node in list_:
+            if isinstance(node, KeyVal):
+                self.keys.append('.'.join(key.value.value for key in node.key_list))
+
+    def get_result(self):
+        return ' '.join(self.keys)
+
+
+class MessagePackTestCase(unittest.TestCase):
+
+    def test_round_trip(self):
+        for value in values:
+            self.assertEqual(value, unpackb(packb(value)))
+
+    def test_known_encodings(self):
+        self.assertEqual(b'\x82\xa1a\x01\xa1b\x92\xc3\xcd\x01\x00', packb({'a': 1, 'b': [True, 256]}))
+
+    def test_overflow(self):
+        with self.assertRaises(OverflowError):
+            packb(2 ** 64)
+
+    def test_dates(self):
+        self.assertEqual('1979-05-27', unpackb(packb(datetime.date(1979, 5, 27))))
+
+    def test_parse(self):
+        result = Parser('msgpack').parse(toml_document)
+        self.assertIsInstance(result, bytes)
+        self.assertEqual(Parser().parse_dict(toml_document), unpackb(result))
+
+    def test_write_result(self):
+        parser = Parser('MSGPACK', builder=True)
+        parser.translate(toml_document)
+        file = io.BytesIO()
+        parser.translation_unit.write_result(file, chunk_size=16)
+        self.assertEqual(parser.translation_unit.get_result(), file.getvalue())
+
+
+class RegistryTestCase(unittest.TestCase):
+
+    def test_unknown_language(self):
+        with self.assertRaises(ValueError):
+            Parser('yaml')
+
+    def test_register(self):
+        register_translator('upper', UpperTranslator)
+        try:
+            self.assertEqual('{\n    "KEY": "VALUE"\n}', Parser('Upper').parse('key = "value"'))
+        finally:
+            del TRANSLATORS['upper']
+
+    def test_register_translator_unit(self):
+        register_translator('keys', KeysTranslator)
+        try:
+            for options in ({}, {'builder': True}, {'builder': True, 'numeric_arrays': 'array', 'intern': True}):
+                self.assertEqual('title numbers floats long flags id',
+                                 Parser('keys', **options).parse(toml_document), options)
+        finally:
+            del TRANSLATORS['keys']
+
+
+if __name__ == '__main__':
+    unittest.main()
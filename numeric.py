@@ -0,0 +1,127 @@
+import array
+
+try:
+    import numpy
+except ImportError:
+    numpy = None
+
+# Numeric array modes: homogeneous integer and float arrays become stdlib array.array('q' or 'd')
+# buffers or NumPy int64/float64 arrays instead of lists of Python objects
+STDLIB_ARRAY = 'array'
+NUMPY_ARRAY = 'numpy'
+NUMERIC_ARRAYS = (STDLIB_ARRAY, NUMPY_ARRAY)
+
+
+def check_mode(mode):
+    """
+    :raises ValueError: if mode isn't None or one of NUMERIC_ARRAYS
+    :raises ImportError: if mode is NUMPY_ARRAY and NumPy isn't installed
+    """
+    if mode is not None and mode not in NUMERIC_ARRAYS:
+        raise ValueError(f"Unknown numeric array mode '{mode}', expected one of: {', '.join(NUMERIC_ARRAYS)}")
+    if mode == NUMPY_ARRAY and numpy is None:
+        raise ImportError('numeric_arrays=numpy requires NumPy')
+
+
+def typed_buffer(values, typecode, mode):
+    """
+    Packs numbers into a typed buffer
+    :param values: iterable of int (typecode 'q') or float (typecode 'd')
+    :param mode: STDLIB_ARRAY or NUMPY_ARRAY
+    :raises OverflowError: if an integer doesn't fit in 64 bits
+    """
+    if mode == NUMPY_ARRAY:
+        dtype = numpy.int64 if typecode == 'q' else numpy.float64
+        if isinstance(values, list):
+            return numpy.array(values, dtype=dtype)
+        return numpy.fromiter(values, dtype=dtype)
+    return array.array(typecode, values)
+
+
+def pack_first(value):
+    """
+    Starts the values of an array as they are reduced: an int or a float starts a typed buffer
+    that the next values are packed into, anything else a list
+    :param value: first translated value of the array
+    """
+    type_ = type(value)
+    if type_ is int or type_ is float:
+        try:
+            return array.array('q' if type_ is int else 'd', (value,))
+        except OverflowError:
+            pass
+    return [value]
+
+
+def pack_next(values, value):
+    """
+    Adds the next value of an array to the values started by pack_first
+    A value of another type, or an integer that doesn't fit in 64 bits, turns the buffer into a list
+    :return: the buffer or list holding the values
+    """
+    if type(values) is list:
+        values.append(value)
+        return values
+    if type(value) is (int if values.typecode == 'q' else float):
+        try:
+            values.append(value)
+            return values
+        except OverflowError:
+            pass
+    values = values.tolist()
+    values.append(value)
+    return values
+
+
+def packed(values, mode):
+    """
+    Returns the values collected by pack_first and pack_next in the form of mode
+    :param values: typed buffer or list
+    :param mode: STDLIB_ARRAY or NUMPY_ARRAY
+    """
+    if mode == NUMPY_ARRAY and type(values) is array.array:
+        # the NumPy array uses the memory of the buffer, without copying it
+        return numpy.frombuffer(values, dtype=numpy.int64 if values.typecode == 'q' else numpy.float64)
+    return values
+
+
+def numeric_array(values, mode):
+    """
+    Returns translated values as a typed buffer when they are all int or all float
+    (booleans excluded), or the list itself otherwise
+    :param values: list of translated values
+    :param mode: STDLIB_ARRAY or NUMPY_ARRAY
+    """
+    if not values:
+        return values
+    type_ = type(values[0])
+    if type_ is not int and type_ is not float:
+        return values
+    for value in values:
+        if type(value) is not type_:
+            return values
+    try:
+        return typed_buffer(values, 'q' if type_ is int else 'd', mode)
+    except OverflowError:
+        return values
+
+
+def to_columns(items, mode=STDLIB_ARRAY):
+    """
+    Turns the tables of a table array into columns, e.g. [[samples]] records into one typed buffer per key
+    Keys missing from some tables, or whose values aren't all numbers of one type, give lists
+    :param items: list of dictionaries
+    :param mode: STDLIB_ARRAY or NUMPY_ARRAY
+    :return: dictionary of key -> typed buffer or list, in the order the keys first appear
+    """
+    check_mode(mode)
+    keys = {}
+    for item in items:
+        keys.update(dict.fromkeys(item))
+    columns = {}
+    for key in keys:
+        if all(key in item for item in items):
+            columns[key] = numeric_array([item[key] for item in items], mode)
+        else:
+            columns[key] = [item.get(key) for item in items]
+    return columns
@@ -0,0 +1,106 @@
+import array
+import io
+import json
+import unittest
+from numeric import numpy, pack_first, pack_next, to_columns, NUMPY_ARRAY, STDLIB_ARRAY
+from parser_toml import Parser
+from toml_loader import loads
+from translator_msgpack import unpackb
+
+# Test data
+toml_document = '''ints = [1, -2, 0x10, 1_000]
+floats = [1.5, -2e3, 1_0.5]
+mixed = [1, 1.5]
+bools = [true, false]
+big = [1, 9223372036854775808]
+nested = [[1, 2], [3.5]]
+empty = []
+[[samples]]
+t = 1
+v = 0.5
+[[samples]]
+t = 2
+v = 1.5
+tag = "x"
+'''
+
+
+class NumericArraysTestCase(unittest.TestCase):
+
+    def test_packing(self):
+        values = pack_first(1)
+        for value in (2, 3):
+            values = pack_next(values, value)
+        self.assertEqual(array.array('q', [1, 2, 3]), values)
+        # a value of another type, or too large, turns the buffer into a list
+        self.assertEqual([1, 2, 3, 4.5], pack_next(values, 4.5))
+        self.assertEqual([1.5, 2], pack_next(pack_first(1.5), 2))
+        self.assertEqual([1, 2 ** 63], pack_next(pack_first(1), 2 ** 63))
+        self.assertEqual([2 ** 63, 1], pack_next(pack_first(2 ** 63), 1))
+        self.assertEqual([True, 1], pack_next(pack_first(True), 1))
+
+    def test_builder_and_ast(self):
+        expected = Parser().parse_dict(toml_document)
+        for builder in (False, True):
+            result = Parser(builder=builder, numeric_arrays=STDLIB_ARRAY).parse_dict(toml_document)
+            self.assertEqual(array.array('q', [1, -2, 16, 1000]), result['ints'])
+            self.assertEqual(array.array('d', [1.5, -2000.0, 10.5]), result['floats'])
+            self.assertEqual([array.array('q', [1, 2]), array.array('d', [3.5])], result['nested'])
+            # mixed, non-numeric and overflowing arrays stay lists
+            for key in ('mixed', 'bools', 'big', 'empty'):
+                self.assertEqual(expected[key], result[key])
+                self.assertIs(list, type(result[key]))
+
+    def test_outputs(self):
+        expected = Parser().parse(toml_document)
+        self.assertEqual(json.loads(expected), json.loads(Parser(numeric_arrays=STDLIB_ARRAY).parse(toml_document)))
+        file = io.StringIO()
+        parser = Parser(builder=True, numeric_arrays=STDLIB_ARRAY)
+        parser.translate(toml_document)
+        parser.translation_unit.write_result(file)
+        self.assertEqual(json.loads(expected), json.loads(file.getvalue()))
+        self.assertEqual(Parser().parse_dict(toml_document),
+                         unpackb(Parser('msgpack', numeric_arrays=STDLIB_ARRAY).parse(toml_document)))
+
+    def test_loader(self):
+        ints = loads(toml_document, numeric_arrays='array')['ints']
+        self.assertEqual(array.array('q', [1, -2, 16, 1000]), ints)
+        document = loads(toml_document, lazy=True, numeric_arrays='array')
+        self.assertEqual(array.array('d', [1.5, -2000.0, 10.5]), document['floats'])
+
+    def test_columns(self):
+        columns = to_columns(Parser().parse_dict(toml_document)['samples'])
+        self.assertEqual(array.array('q', [1, 2]), columns['t'])
+        self.assertEqual(array.array('d', [0.5, 1.5]), columns['v'])
+        self.assertEqual([None, 'x'], columns['tag'])
+
+    def test_invalid_mode(self):
+        with self.assertRaises(ValueError):
+            Parser(numeric_arrays='list')
+
+    @unittest.skipIf(numpy is None, 'NumPy is not installed')
+    def test_numpy(self):
+        expected = Parser().parse_dict(toml_document)
+        for builder in (False, True):
+            result = Parser(builder=builder, numeric_arrays=NUMPY_ARRAY).parse_dict(toml_document)
+            self.assertEqual(numpy.int64, result['ints'].dtype)
+            self.assertEqual([1, -2, 16, 1000], result['ints'].tolist())
+            self.assertEqual(numpy.float64, result['floats'].dtype)
+            self.assertEqual([1.5, -2000.0, 10.5], result['floats'].tolist())
+            self.assertEqual([[1, 2], [3.5]], [value.tolist() for value in result['nested']])
+            for key in ('mixed', 'bools', 'big', 'empty'):
+                self.assertEqual(expected[key], result[key])
+        self.assertEqual(json.loads(Parser().parse(toml_document)),
+                         json.loads(Parser(numeric_arrays=NUMPY_ARRAY).parse(toml_document)))
+        columns = to_columns(expected['samples'], NUMPY_ARRAY)
+        self.assertEqual(numpy.int64, columns['t'].dtype)
+        self.assertEqual([0.5, 1.5], columns['v'].tolist())
+
+    @unittest.skipIf(numpy is not None, 'NumPy is installed')
+    def test_numpy_missing(self):
+        with self.assertRaises(ImportError):
+            Parser(numeric_arrays=NUMPY_ARRAY)
+
+
+if __name__ == '__main__':
+    unittest.main()
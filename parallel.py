@@ -0,0 +1,127 @@
+import os
+from concurrent.futures import ProcessPoolExecutor
+from functools import partial
+from parser_toml import Parser
+from sections import header_positions, Recorder, KEY_VAL, TABLE
+from translator_tomml import get_translator
+from worker import init_worker, worker_parser
+
+# Number of chunks given to each worker, so a slow chunk doesn't leave the other workers idle
+CHUNKS_PER_WORKER = 4
+
+
+def split_chunks(text, chunks):
+    """
+    Splits a document into about chunks parts of similar size, cutting only before table
+    and table array headers so every part can be parsed on its own
+    :param text: TOML document
+    :param chunks: wanted number of parts
+    :return: list of (start, end, line number at start)
+    """
+    size = len(text) / chunks
+    boundaries = [(0, 1)]
+    for position, lineno in header_positions(text):
+        if position >= size * len(boundaries):
+            boundaries.append((position, lineno))
+
+    ends = [position for position, _ in boundaries[1:]] + [len(text)]
+    return [(start, end, lineno) for (start, lineno), end in zip(boundaries, ends)]
+
+
+def chunk_parser(language):
+    """
+    Returns a parser with a FastLexer that records the expressions of the chunks
+    """
+    parser = Parser(language, builder=True, lexer_backend='fast')
+    parser.translation_unit = Recorder()
+    return parser
+
+
+def parse_chunk(chunk, parser=None):
+    """
+    Parses one part of a document
+    :param chunk: (text, position and line number of its start in the document)
+    :param parser: parser returned by chunk_parser, defaults to the worker parser
+    :return: list of recorded expressions
+    """
+    parser = parser or worker_parser()
+    lexer = parser.lexer
+    text, start, lineno = chunk
+    lexer.input(text)
+    lexer.offset = start
+    lexer.lineno = lineno
+    parser.translation_unit.reset()
+    parser.parser.parse(lexer=lexer)
+    return parser.translation_unit.records
+
+
+class Merger:
+    """
+    Merger class
+    Applies the recorded expressions of consecutive parts of a document in order, so table
+    arrays get their items appended in document order, and rejects tables defined twice.
+    A table nested in a table array may be defined again for every item of the array.
+    """
+    def __init__(self, translation_unit):
+        self.translation_unit = translation_unit
+        self.translation_unit.reset()
+        # table array path -> number of items
+        self.items = {}
+        # (table path, number of items of every table array enclosing it)
+        self.tables = set()
+
+    def __repr__(self):
+        return f'Merger: {len(self.tables)} tables, {len(self.items)} table arrays'
+
+    def merge(self, records):
+        """
+        Adds the recorded expressions of the next part of the document to the translation
+        :raises SyntaxError: if a table was already defined
+        """
+        translation_unit = self.translation_unit
+        store = translation_unit.store
+        for kind, keys, value in records:
+            if kind == KEY_VAL:
+                store(keys, value)
+            elif kind == TABLE:
+                path = tuple(keys)
+                table = (path, tuple(self.items.get(path[:length], 0) for length in range(1, len(path))))
+                if table in self.tables:
+                    raise SyntaxError(f'Duplicate table [{".".join(path)}]')
+                self.tables.add(table)
+                translation_unit.open_table(keys)
+            else:
+                path = tuple(keys)
+                self.items[path] = self.items.get(path, 0) + 1
+                translation_unit.open_table_array(keys)
+
+
+def parse_parallel(text, language='json', workers=None, chunks=None):
+    """
+    Parses one large document in a pool of processes
+    The document is split before table and table array headers, the parts are lexed and parsed
+    and translated by the workers and their expressions are applied in order as they come back
+    :param text: TOML document
+    :param language: output language
+    :param workers: number of processes, defaults to the number of CPUs; 1 parses in this process
+    :param chunks: number of parts, defaults to CHUNKS_PER_WORKER per worker
+    :return: translation unit holding the translated document
+    :raises SyntaxError: if the document is invalid or defines a table twice
+    """
+    workers = workers or os.cpu_count() or 1
+    parts = split_chunks(text, chunks or workers * CHUNKS_PER_WORKER)
+    jobs = [(text[start:end], start, lineno) for start, end, lineno in parts]
+    merger = Merger(get_translator(language))
+
+    if workers == 1 or len(jobs) == 1:
+        # a parser of its own, the worker parser of this process is left to its pools
+        parser = chunk_parser(language)
+        for job in jobs:
+            merger.merge(parse_chunk(job, parser))
+        return merger.translation_unit
+
+    factory = partial(chunk_parser, language)
+    with ProcessPoolExecutor(workers, initializer=init_worker, initargs=(factory,)) as executor:
+        for nodes in executor.map(parse_chunk, jobs):
+            merger.merge(nodes)
+    return merger.translation_unit
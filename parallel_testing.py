@@ -0,0 +1,79 @@
+import unittest
+from parallel import parse_parallel, split_chunks
+from parser_toml import Parser
+from sections import header_positions, scan
+from worker import worker_parser
+
+# Test data
+toml_document = '\n'.join(
+    ['title = "parallel"', 'text = """', '[not.a.header]', '"""', '[server]', 'ports = [8000, 8001]'] +
+    [f'[[records]]\nid = {number}\n[records.point]\nx = {number}\ntags = ["[a]", "b"]' for number in range(50)] +
+    ['[server.limits]', 'connections = 10', '[[records]]', 'id = 50'])
+toml_tricky = """# [comment]
+a = [
+  [1, 2], [
+[3]],
+  "[", '[' # ]
+]
+b = \"\"\"
+[x] ]
+\"\"\"
+c = '''
+[y]
+'''
+[ "quoted]key" . 'z' ] # [
+d = { e = "[" }
+  [[array]]
+[f]
+g = # [
+[1]\r
+[h]
+"""
+toml_duplicate = '[a]\nx = 1\n[b]\ny = 2\n[a]\nz = 3'
+toml_invalid = '[a]\nx = 1\n[b]\ny = 2\n[c]\nz = \n[d]\nw = 4'
+
+
+class ParallelTestCase(unittest.TestCase):
+
+    def test_split_chunks(self):
+        chunks = split_chunks(toml_document, 8)
+        self.assertEqual(0, chunks[0][0])
+        self.assertEqual(len(toml_document), chunks[-1][1])
+        for (_, end, _), (start, _, lineno) in zip(chunks, chunks[1:]):
+            self.assertEqual(end, start)
+            self.assertEqual('[', toml_document[start])
+
+    def test_header_positions(self):
+        # same headers and line numbers as the lexer-based scan
+        for document in (toml_document, toml_tricky):
+            expected = [(token.lexpos, token.lineno) for token, header in scan(document) if header]
+            self.assertEqual(expected, header_positions(document))
+        self.assertEqual(4, len(header_positions(toml_tricky)))
+
+    def test_in_process(self):
+        expected = Parser().parse_dict(toml_document)
+        for chunks in (1, 3, 100):
+            self.assertEqual(expected, parse_parallel(toml_document, workers=1, chunks=chunks).get_dict())
+        self.assertEqual(Parser().parse_dict(toml_tricky), parse_parallel(toml_tricky, workers=1).get_dict())
+        # the worker parser of this process is left alone
+        self.assertIsNone(worker_parser())
+
+    def test_process_pool(self):
+        translator = parse_parallel(toml_document, workers=2)
+        self.assertEqual(Parser().parse(toml_document), translator.get_result())
+
+    def test_duplicate_table(self):
+        with self.assertRaises(SyntaxError):
+            parse_parallel(toml_duplicate, workers=1, chunks=3)
+
+    def test_error_line(self):
+        # same line as a sequential parse
+        with self.assertRaises(SyntaxError) as expected:
+            Parser().parse(toml_invalid)
+        with self.assertRaisesRegex(SyntaxError, 'line 7') as actual:
+            parse_parallel(toml_invalid, workers=1, chunks=3)
+        self.assertEqual(str(expected.exception), str(actual.exception))
+
+
+if __name__ == '__main__':
+    unittest.main()
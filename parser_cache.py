@@ -0,0 +1,167 @@
+import copy
+import hashlib
+import importlib.util
+import os
+import pickle
+import ply
+import ply.lex as lex
+import ply.yacc as yacc
+
+# Environment variable that overrides the directory used for the table cache.
+# The cached lexer tables are Python modules that are executed, and the parse tables are unpickled,
+# so the directory must only be writable by the users trusted to run code in this process.
+CACHE_DIR_ENV = 'TOML_PARSER_CACHE_DIR'
+
+# Master lexers and parsers already built in this process, keyed by grammar hash
+_lexers = {}
+_parsers = {}
+# Grammar hashes already computed, keyed by (lexer class, parser class)
+_hashes = {}
+
+
+def grammar_hash(lexer_class, parser_class):
+    """
+    Returns a short hash identifying the grammar of a lexer/parser pair
+    The hash covers the PLY version, the token list, every lexer rule and
+    every grammar rule in definition order, so any change to them invalidates the cache
+    :param lexer_class: class holding the t_ rules and the tokens tuple
+    :param parser_class: class holding the p_ rules
+    :return: hexadecimal digest
+    """
+    key = (lexer_class, parser_class)
+    if key in _hashes:
+        return _hashes[key]
+
+    digest = hashlib.sha256(ply.__version__.encode())
+    digest.update(' '.join(lexer_class.tokens).encode())
+    for name, rule in _rules(lexer_class, 't_'):
+        digest.update(name.encode())
+        digest.update((rule if isinstance(rule, str) else rule.__doc__ or '').encode())
+    for name, rule in _rules(parser_class, 'p_'):
+        digest.update(name.encode())
+        digest.update((rule.__doc__ or '').encode())
+    _hashes[key] = digest.hexdigest()[:16]
+    return _hashes[key]
+
+
+def _rules(class_, prefix):
+    """
+    Returns the (name, rule) pairs of a class whose name starts with prefix,
+    functions in the order they are defined and strings after them
+    """
+    rules = [(name, getattr(class_, name)) for name in dir(class_) if name.startswith(prefix)]
+    functions = [rule for rule in rules if callable(rule[1])]
+    strings = [rule for rule in rules if isinstance(rule[1], str)]
+    functions.sort(key=lambda rule: rule[1].__code__.co_firstlineno)
+    return functions + strings
+
+
+def cache_dir():
+    """
+    Returns the directory holding the cached tables, or None if it can't be created
+    Its files are loaded as code, see CACHE_DIR_ENV
+    """
+    path = os.environ.get(CACHE_DIR_ENV) or os.path.join(os.path.expanduser('~'), '.cache', 'pl2023tp')
+    try:
+        os.makedirs(path, exist_ok=True)
+    except OSError:
+        return None
+    return path
+
+
+def clear():
+    """
+    Forgets the lexers and parsers built in this process (the disk cache is kept)
+    """
+    _lexers.clear()
+    _parsers.clear()
+
+
+def build_lexer(lexer, key):
+    """
+    Returns a PLY lexer bound to the given Lexer object
+    The first call for a grammar hash loads the lexer tables from the disk cache
+    (or builds and stores them), the following calls only clone the master lexer
+    :param lexer: Lexer object that receives the token callbacks
+    :param key: grammar hash
+    """
+    master = _lexers.get(key)
+    if master is None:
+        master = _load_lexer(lexer, key)
+        _lexers[key] = master
+    return master.clone(lexer)
+
+
+def build_parser(parser, key):
+    """
+    Returns a PLY LR parser whose grammar actions are bound to the given Parser object
+    The first call for a grammar hash loads the LALR tables from the disk cache
+    (or builds and stores them), the following calls only rebind the actions
+    :param parser: Parser object that holds the p_ rules
+    :param key: grammar hash
+    """
+    master = _parsers.get(key)
+    if master is None:
+        master = _load_parser(parser, key)
+        _parsers[key] = master
+
+    bound = copy.copy(master)
+    bound.productions = []
+    for production in master.productions:
+        production = yacc.MiniProduction(production.str, production.name, production.len,
+                                         production.func, production.file, production.line)
+        if production.func:
+            production.callable = getattr(parser, production.func)
+        bound.productions.append(production)
+    bound.errorfunc = parser.p_error
+    return bound
+
+
+def _load_lexer(lexer, key):
+    directory = cache_dir()
+    name = 'lextab_' + key
+
+    if directory is not None:
+        path = os.path.join(directory, name + '.py')
+        if os.path.exists(path):
+            try:
+                spec = importlib.util.spec_from_file_location(name, path)
+                module = importlib.util.module_from_spec(spec)
+                spec.loader.exec_module(module)
+                return lex.lex(module=lexer, optimize=True, lextab=module, errorlog=lex.NullLogger())
+            except (ImportError, OSError, SyntaxError, AttributeError):
+                pass
+
+    lexobj = lex.lex(module=lexer)
+
+    if directory is not None:
+        temporary = f'{name}_{os.getpid()}'
+        try:
+            lexobj.writetab(temporary, directory)
+            os.replace(os.path.join(directory, temporary + '.py'), path)
+        except OSError:
+            pass
+    return lexobj
+
+
+def _load_parser(parser, key):
+    directory = cache_dir()
+
+    if directory is None:
+        return yacc.yacc(module=parser, debug=False, write_tables=False, errorlog=yacc.NullLogger())
+
+    path = os.path.join(directory, f'parsetab_{key}.pickle')
+    if os.path.exists(path):
+        try:
+            return yacc.yacc(module=parser, debug=False, optimize=True, picklefile=path,
+                             errorlog=yacc.NullLogger())
+        except (OSError, EOFError, pickle.UnpicklingError, yacc.YaccError):
+            pass
+
+    temporary = f'{path}.{os.getpid()}'
+    lrparser = yacc.yacc(module=parser, debug=False, picklefile=temporary, errorlog=yacc.NullLogger())
+    try:
+        os.replace(temporary, path)
+    except OSError:
+        pass
+    return lrparser
@@ -1,5 +1,12 @@
+import io
+import json
+import os
+import tempfile
 import unittest
+import parser_cache
+from lexer_toml import Lexer
 from parser_toml import Parser
+from value import OFFSET_DATE_TIME, LOCAL_DATE_TIME, LOCAL_DATE, LOCAL_TIME
 
 # Test data
 toml_with_comments = '''
@@ -323,6 +330,204 @@ class ParserTestCase(unittest.TestCase):
         actual = parser.parse(toml_table_array)
         self.assertEqual(json_table_array_expected, actual)
 
+    def test_builder_matches_ast(self):
+        ast = Parser('JSON')
+        builder = Parser('JSON', builder=True)
+        for toml in (toml_with_comments, toml_bare_keys, toml_quoted_keys, toml_dot_keys, toml_integers,
+                     toml_floats, toml_arrays, toml_tables, toml_inline_tables, toml_table_array):
+            self.assertEqual(ast.parse(toml), builder.parse(toml))
+
+    def test_fast_lexer_matches_ply(self):
+        ply = Parser('JSON')
+        fast = Parser('JSON', lexer_backend='fast')
+        for toml in (toml_with_comments, toml_bare_keys, toml_quoted_keys, toml_dot_keys, toml_integers,
+                     toml_floats, toml_arrays, toml_tables, toml_inline_tables, toml_table_array):
+            self.assertEqual(ply.parse(toml), fast.parse(toml))
+        with self.assertRaisesRegex(SyntaxError, 'line 2'):
+            fast.parse('a = 1\nkey = = 2')
+
+    def test_builder_invalid_key_val(self):
+        parser = Parser('JSON', builder=True)
+        with self.assertRaises(SyntaxError):
+            parser.parse(toml_invalid_key_val)
+
+    def test_repeated_key_paths(self):
+        parser = Parser('JSON')
+        toml = '''a.b.c = 1
+a.b.d = 2
+x.y = 1
+x = { z = 2 }
+x.w = 3
+[t.u]
+v.w = 1
+[t.u.v]
+k = 2
+[[s.list]]
+p.q = 1
+[[s.list]]
+p.q = 2'''
+        expected = {
+            'a': {'b': {'c': 1, 'd': 2}},
+            'x': {'z': 2, 'w': 3},
+            't': {'u': {'v': {'w': 1, 'k': 2}}},
+            's': {'list': [{'p': {'q': 1}}, {'p': {'q': 2}}]},
+        }
+        self.assertEqual(expected, parser.parse_dict(toml))
+        self.assertEqual(expected, Parser('JSON', builder=True).parse_dict(toml))
+
+    def test_replaced_key_prefix(self):
+        # the table a.b that the dotted keys share is replaced, the next ones go into the new one
+        toml = '''a.b.c = 1
+a.b.d = 2
+a = { b = { x = 1 } }
+a.b.e = 3
+[t]
+a.b.c = 4
+[u]
+a.b.c = 5'''
+        expected = {'a': {'b': {'x': 1, 'e': 3}}, 't': {'a': {'b': {'c': 4}}}, 'u': {'a': {'b': {'c': 5}}}}
+        self.assertEqual(expected, Parser('JSON').parse_dict(toml))
+        self.assertEqual(expected, Parser('JSON', builder=True).parse_dict(toml))
+
+    def test_repeated_deep_key_paths(self):
+        parser = Parser('JSON')
+        deep = '.'.join('abcdefghi')
+        toml = f'''{deep}.x = 1
+{deep}.y = 2
+a.b.c.d.e.f.g.h = {{ z = 3 }}
+{deep}.w = 4
+[{deep}.t]
+k = 5
+[[j.b.c.d.e.f.g.h.i.list]]
+k = 6
+[[j.b.c.d.e.f.g.h.i.list]]
+k = 7'''
+        # the inline table replaces the table h built by the dotted keys before it
+        expected = {'a': {'z': 3, 'i': {'w': 4, 't': {'k': 5}}}, 'j': {'list': [{'k': 6}, {'k': 7}]}}
+        for key in 'hgfedcb':
+            expected['a'] = {key: expected['a']}
+        for key in 'ihgfedcb':
+            expected['j'] = {key: expected['j']}
+        self.assertEqual(expected, parser.parse_dict(toml))
+        self.assertEqual(expected, Parser('JSON', builder=True).parse_dict(toml))
+
+    def test_homogeneous_arrays(self):
+        parser = Parser('JSON')
+        toml = '''ints = [ 1, -2, 0x10, 0o10, 0b10, 1_000 ]
+floats = [ 1.5, -2e3, 1_0.5 ]
+bools = [ true, false ]
+strings = [ "a", 'b' ]
+ml_strings = [ """a
+b""", """c""" ]
+empty = []
+mixed = [ 1, 1.5, true, "a" ]'''
+        expected = {
+            'ints': [1, -2, 16, 8, 2, 1000],
+            'floats': [1.5, -2000.0, 10.5],
+            'bools': [True, False],
+            'strings': ['a', 'b'],
+            'ml_strings': ['a\nb\n', 'c'],
+            'empty': [],
+            'mixed': [1, 1.5, True, 'a'],
+        }
+        self.assertEqual(expected, parser.parse_dict(toml))
+        self.assertEqual(expected, Parser('JSON', builder=True).parse_dict(toml))
+
+    def test_date_time_kinds(self):
+        parser = Parser()
+        toml = 'a = 1979-05-27T07:32:00Z\nb = 1979-05-27 07:32:00\nc = 1979-05-27\nd = 07:32:00'
+        nodes = parser.parser.parse(toml, lexer=parser.lexer)
+        self.assertEqual([OFFSET_DATE_TIME, LOCAL_DATE_TIME, LOCAL_DATE, LOCAL_TIME],
+                         [node.value.type for node in nodes])
+        # untyped translations keep the text
+        self.assertEqual({'a': '1979-05-27T07:32:00Z', 'b': '1979-05-27 07:32:00', 'c': '1979-05-27', 'd': '07:32:00'},
+                         parser.parse_dict(toml))
+
+    def test_write_result(self):
+        parser = Parser('JSON')
+        for toml in (toml_with_comments, toml_dot_keys, toml_arrays, toml_tables, toml_table_array, '[[a]]\n[a.b]'):
+            expected = parser.parse(toml)
+            for chunk_size in (1, 65536):
+                output = io.StringIO()
+                parser.translation_unit.write_result(output, chunk_size=chunk_size)
+                self.assertEqual(expected, output.getvalue())
+
+    def test_write_result_compact(self):
+        parser = Parser('JSON')
+        parser.translate(toml_arrays)
+        output = io.StringIO()
+        parser.translation_unit.write_result(output, indent=None, separators=(',', ':'))
+        self.assertEqual(json.dumps(json.loads(parser.parse(toml_arrays)), separators=(',', ':'), ensure_ascii=False),
+                         output.getvalue())
+
+    def test_long_lists(self):
+        parser = Parser('JSON')
+        size = 5000
+        toml = '\n'.join(f'key{i} = {i}' for i in range(size))
+        toml += '\narray = [' + ', '.join(str(i) for i in range(size)) + ']'
+        toml += '\ninline = { ' + ', '.join(f'key{i} = {i}' for i in range(size)) + ' }'
+        actual = json.loads(parser.parse(toml))
+        expected = {f'key{i}': i for i in range(size)}
+        self.assertEqual(list(expected.items()) + [('array', list(range(size))), ('inline', expected)],
+                         list(actual.items()))
+
+    def test_parser_reuse(self):
+        parser = Parser('JSON')
+        parser.parse(toml_integers)
+        actual = parser.parse(toml_tables)
+        self.assertEqual(json_tables_expected, actual)
+
+        parser.parse(toml_table_array)
+        actual = parser.parse(toml_table_array)
+        self.assertEqual(json_table_array_expected, actual)
+
+    def test_parser_reuse_after_error(self):
+        parser = Parser('JSON')
+        with self.assertRaises(Exception):
+            parser.parse(toml_invalid_key_val)
+        actual = parser.parse(toml_bare_keys)
+        self.assertEqual(json_bare_keys_expected, actual)
+
+    def test_error_line_after_reuse(self):
+        parser = Parser('JSON')
+        parser.parse(toml_integers)
+        with self.assertRaisesRegex(SyntaxError, 'line 2'):
+            parser.parse('a = 1\nkey = = 2')
+
+    def test_cached_parser_matches_uncached(self):
+        cached = Parser('JSON')
+        uncached = Parser('JSON', cache=False)
+        self.assertEqual(uncached.parse(toml_arrays), cached.parse(toml_arrays))
+
+    def test_cache_dir_stores_tables(self):
+        with tempfile.TemporaryDirectory() as directory:
+            os.environ[parser_cache.CACHE_DIR_ENV] = directory
+            try:
+                parser_cache.clear()
+                Parser('JSON')
+                key = parser_cache.grammar_hash(Lexer, Parser)
+                self.assertEqual(sorted(os.listdir(directory)),
+                                 [f'lextab_{key}.py', f'parsetab_{key}.pickle'])
+
+                # tables are loaded back from the disk cache
+                parser_cache.clear()
+                actual = Parser('JSON').parse(toml_tables)
+                self.assertEqual(json_tables_expected, actual)
+            finally:
+                del os.environ[parser_cache.CACHE_DIR_ENV]
+                parser_cache.clear()
+
+    def test_unwritable_cache_dir(self):
+        with tempfile.NamedTemporaryFile() as file:
+            os.environ[parser_cache.CACHE_DIR_ENV] = os.path.join(file.name, 'cache')
+            try:
+                parser_cache.clear()
+                actual = Parser('JSON').parse(toml_tables)
+                self.assertEqual(json_tables_expected, actual)
+            finally:
+                del os.environ[parser_cache.CACHE_DIR_ENV]
+                parser_cache.clear()
+
 
 if __name__ == '__main__':
     unittest.main()
@@ -1,23 +1,80 @@
 import ply.yacc as yacc
 from lexer_toml import Lexer
-from array import Array
+from lexer_fast import FastLexer
+from lexer_bytes import BytesLexer
+from sections import TokenStream
+import parser_cache
+from parser_cache import grammar_hash
+from array_toml import Array
 from inline_table import InlineTable
-from key import Key
+from interning import get_pool
+from key import Key, BARE_KEY, QUOTED_KEY
 from key_val import KeyVal
+from numeric import check_mode
 from table import Table
-from value import Value
+from value import Value, STRING, ML_STRING, BOOLEAN, INTEGER, FLOAT, ARRAY, INLINE_TABLE, OFFSET_DATE_TIME, \
+    LOCAL_DATE_TIME, LOCAL_DATE, LOCAL_TIME
 from table_array import TableArray
-from translator_json import JSONTranslator
+from translator_tomml import get_translator
+# the translator modules register their output languages when imported
+import translator_json
+import translator_jsonl
+import translator_msgpack
+import translator_snapshot
+
+
+# Value types of the date and time tokens
+DATE_TIME_TYPES = {
+    'OFFSET_DATE_TIME': OFFSET_DATE_TIME,
+    'LOCAL_DATE_TIME': LOCAL_DATE_TIME,
+    'LOCAL_DATE': LOCAL_DATE,
+    'LOCAL_TIME': LOCAL_TIME,
+}
+
+# Lexer classes selectable with the lexer_backend argument of Parser
+LEXER_BACKENDS = {
+    'ply': Lexer,
+    'fast': FastLexer,
+    'bytes': BytesLexer,
+}
 
 
 class Parser:
-    def __init__(self, lang='json'):
+    def __init__(self, lang='json', cache=True, builder=False, typed=False, lexer_backend='ply', numeric_arrays=None,
+                 intern=None):
+        """
+        :param lang: output language
+        :param cache: reuse the lexer and LALR tables cached for this grammar instead of
+                      rebuilding them (and rewriting parsetab.py and parser.out) on every construction
+        :param builder: translate values and apply expressions to the translator as soon as they
+                        are reduced instead of building the whole node list first
+        :param typed: translate dates and times to Python objects
+        :param lexer_backend: 'ply' for the PLY lexer, 'fast' for the hand-written FastLexer,
+                              'bytes' for FastLexer over UTF-8 bytes or a memory-mapped file
+        :param numeric_arrays: None for lists, 'array' or 'numpy' to translate the arrays of integers
+                               or floats to array.array or NumPy arrays of 64-bit numbers
+        :param intern: True to intern the keys of the documents parsed by this parser, so equal keys are
+                       the same string object, or an interning.InternPool to share with other parsers,
+                       which can intern the short string values too
+        :raises ImportError: if numeric_arrays is 'numpy' and NumPy isn't installed
+        """
+        check_mode(numeric_arrays)
         self.tokens = Lexer.tokens
-        self.lexer = Lexer()  # Create a lexer object using lex.lex()
-        self.parser = yacc.yacc(module=self)
-
-        if lang.lower() == 'json':
-            self.translation_unit = JSONTranslator()
+        self.builder = builder
+        # in builder mode, numbers are packed into typed buffers as the arrays are reduced
+        self.pack_arrays = builder and numeric_arrays is not None
+        lexer_class = LEXER_BACKENDS[lexer_backend]
+        if cache:
+            key = grammar_hash(Lexer, type(self))
+            self.lexer = lexer_class(key)
+            self.parser = parser_cache.build_parser(self, key)
+        else:
+            self.lexer = lexer_class()  # Create a lexer object using lex.lex()
+            self.parser = yacc.yacc(module=self)
+
+        self.translation_unit = get_translator(lang, typed)
+        self.translation_unit.numeric_arrays = numeric_arrays
+        self.translation_unit.set_intern_pool(get_pool(intern))
 
     # Parsing rules
     def p_toml(self, p):
@@ -26,11 +83,21 @@ class Parser:
 
     def p_expression_list(self, p):
         """expression_list : expression"""
-        p[0] = [p[1]]
+        if self.builder:
+            self.translation_unit.build(p[1])
+            p[0] = []
+        else:
+            p[0] = [p[1]]
 
     def p_expression_list_2(self, p):
-        """expression_list : expression expression_list"""
-        p[0] = [p[1]] + p[2]
+        """expression_list : expression_list expression"""
+        # Left recursion reduces every expression as soon as it is read,
+        # so the list grows in place and the parser stack stays bounded
+        if self.builder:
+            self.translation_unit.build(p[2])
+        else:
+            p[1].append(p[2])
+        p[0] = p[1]
 
     def p_expression(self, p):
         """expression : key_val
@@ -53,24 +120,24 @@ class Parser:
 
     def p_simple_key(self, p):
         """simple_key : quoted_key"""
-        p[0] = Key('quoted_key', p[1])
+        p[0] = Key(QUOTED_KEY, p[1])
 
     def p_simple_key_2(self, p):
         """simple_key : bare_key"""
-        p[0] = Key('bare_key', p[1])
+        p[0] = Key(BARE_KEY, p[1])
 
     def p_quoted_key(self, p):
         """quoted_key : STRING
                         | LITERAL_STRING"""
-        p[0] = Value('string', p[1][1:-1])
+        p[0] = Value(STRING, p[1][1:-1])
 
     def p_bare_key(self, p):
         """bare_key : IDENTIFIER"""
-        p[0] = Value('string', p[1])
+        p[0] = Value(STRING, p[1])
 
     def p_bare_key_2(self, p):
         """bare_key : INTEGER"""
-        p[0] = Value('integer', p[1])
+        p[0] = Value(INTEGER, p[1])
 
     def p_dotted_key(self, p):
         """dotted_key : simple_key DOT key"""
@@ -79,51 +146,62 @@ class Parser:
     def p_dotted_key_2(self, p):
         """dotted_key : FLOAT"""
         keys = p[1].split('.')
-        p[0] = [Key('bare_key', Value('integer', key)) for key in keys]
+        p[0] = [Key(BARE_KEY, Value(INTEGER, key)) for key in keys]
+
+    def value(self, type_, value):
+        """
+        Returns a Value node, or its translation in builder mode
+        """
+        if self.builder:
+            return self.translation_unit.convert(type_, value)
+        return Value(type_, value)
 
     def p_value(self, p):
         """value : STRING
                 | LITERAL_STRING"""
-        p[0] = Value('string', p[1][1:-1])
+        p[0] = self.value(STRING, p[1][1:-1])
 
     def p_value_2(self, p):
         """value : MULTILINE_STRING
                 | LITERAL_MULTILINE_STRING"""
-        p[0] = Value('ml_string', p[1][3:-3])
+        p[0] = self.value(ML_STRING, p[1][3:-3])
 
     def p_value_3(self, p):
         """value : BOOLEAN"""
-        p[0] = Value("boolean", p[1])
+        p[0] = self.value(BOOLEAN, p[1])
 
     def p_value_4(self, p):
         """value : OFFSET_DATE_TIME
                 | LOCAL_DATE_TIME
                 | LOCAL_DATE
                 | LOCAL_TIME"""
-        p[0] = Value("datetime", p[1])
+        # one rule for the four kinds, which keep their own value type
+        p[0] = self.value(DATE_TIME_TYPES[p.slice[1].type], p[1])
 
     def p_value_5(self, p):
         """value : INTEGER
                 | HEX_INTEGER
                 | OCT_INTEGER
                 | BIN_INTEGER"""
-        p[0] = Value("integer", p[1])
+        p[0] = self.value(INTEGER, p[1])
 
     def p_value_6(self, p):
         """value : array"""
-        p[0] = Value("array", p[1])
+        # In builder mode the array is already a list of translated values
+        p[0] = p[1] if self.builder else Value(ARRAY, p[1])
 
     def p_value_7(self, p):
         """value : FLOAT"""
-        p[0] = Value("float", p[1])
+        p[0] = self.value(FLOAT, p[1])
 
     def p_value_8(self, p):
         """value : inline_table"""
-        p[0] = Value("inline_table", p[1])
+        # In builder mode the inline table is already a dictionary
+        p[0] = p[1] if self.builder else Value(INLINE_TABLE, p[1])
 
     def p_array(self, p):
         """array : LBRACKET array_content"""
-        p[0] = Array(p[2])
+        p[0] = self.translation_unit.build_array(p[2]) if self.builder else Array(p[2])
 
     def p_array_content(self, p):
         """array_content : RBRACKET"""
@@ -135,11 +213,18 @@ class Parser:
 
     def p_value_list(self, p):
         """value_list : value"""
-        p[0] = [p[1]]
+        if self.pack_arrays:
+            p[0] = self.translation_unit.start_array(p[1])
+        else:
+            p[0] = [p[1]]
 
     def p_value_list_2(self, p):
-        """value_list : value COMMA value_list"""
-        p[0] = [p[1]] + p[3]
+        """value_list : value_list COMMA value"""
+        if self.pack_arrays:
+            p[0] = self.translation_unit.extend_array(p[1], p[3])
+        else:
+            p[1].append(p[3])
+            p[0] = p[1]
 
     def p_table(self, p):
         """table : LBRACKET key RBRACKET"""
@@ -147,7 +232,10 @@ class Parser:
 
     def p_inline_table(self, p):
         """inline_table : LBRACE inline_content"""
-        p[0] = InlineTable(p[2])
+        if self.builder:
+            p[0] = self.translation_unit.build_inline_table(p[2])
+        else:
+            p[0] = InlineTable(p[2])
 
     def p_inline_content(self, p):
         """inline_content : RBRACE"""
@@ -162,8 +250,9 @@ class Parser:
         p[0] = [p[1]]
 
     def p_inline_list_2(self, p):
-        """inline_list : expression COMMA inline_list"""
-        p[0] = [p[1]] + p[3]
+        """inline_list : inline_list COMMA expression"""
+        p[1].append(p[3])
+        p[0] = p[1]
 
     def p_table_array(self, p):
         """table_array : LBRACKET LBRACKET key RBRACKET RBRACKET"""
@@ -172,9 +261,39 @@ class Parser:
     def p_error(self, p):
         if p:
             raise SyntaxError(f"Syntax error at line {p.lineno}, token={p.value}, character={p.lexpos}, type={p.type}")
+        raise SyntaxError("Syntax error at end of input")
+
+    def translate(self, data):
+        """
+        Parses a TOML document into the translation unit
+        Nothing is kept from previous calls, so one Parser can parse any number of documents
+        :param data: TOML document
+        """
+        self.translation_unit.reset()
+        node = self.parser.parse(data, lexer=self.lexer)
+        if not self.builder:
+            self.translation_unit.translate(node)
+
+    def parse_tokens(self, tokens):
+        """
+        Parses an already lexed document or section and returns its node list
+        In builder mode the nodes are applied to the translation unit instead
+        :param tokens: list of tokens with the types of Lexer.tokens
+        """
+        return self.parser.parse(lexer=TokenStream(tokens))
 
     def parse(self, data):
-        self.lexer.input(data)
-        node = self.parser.parse(data)
-        self.translation_unit.translate(node)
+        """
+        Parses a TOML document and returns its translation
+        :param data: TOML document
+        """
+        self.translate(data)
         return self.translation_unit.get_result()
+
+    def parse_dict(self, data):
+        """
+        Parses a TOML document and returns it as Python objects, without serializing it
+        :param data: TOML document
+        """
+        self.translate(data)
+        return self.translation_unit.get_dict()
@@ -0,0 +1,243 @@
+import re
+from lazy import Deferred, LazyTranslator, defer_values
+from lexer_fast import Token
+from parser_toml import Parser
+from sections import scan
+
+# Segment of a path that matches every element of an array
+WILDCARD = None
+
+PATH_SEGMENT = re.compile(r'"([^"]*)"|\'([^\']*)\'|([A-Za-z0-9_-]+)|(\[\*\])')
+
+
+def parse_path(path):
+    """
+    Splits a dotted path into its keys, with WILDCARD for each [*]
+    Example: parse_path('fruit[*]."quoted.key"') == ('fruit', WILDCARD, 'quoted.key')
+    :param path: keys separated by dots, quoted like TOML keys when needed, each optionally followed by [*]
+    :raises ValueError: if the path is invalid
+    """
+    segments = []
+    position = 0
+    expect_key = True
+    while position < len(path):
+        match = PATH_SEGMENT.match(path, position)
+        if match is None or (match.group(4) is None) != expect_key:
+            if path[position] == '.' and not expect_key:
+                expect_key = True
+                position += 1
+                continue
+            raise ValueError(f'Invalid path {path!r} at character {position}')
+        if match.group(4) is None:
+            segments.append(next(group for group in match.groups()[:3] if group is not None))
+            expect_key = False
+        else:
+            segments.append(WILDCARD)
+        position = match.end()
+    if expect_key:
+        raise ValueError(f'Invalid path {path!r}: missing key at the end')
+    return tuple(segments)
+
+
+def select(value, segments, materialize):
+    """
+    Returns the list of the values found at the end of the segments, starting from value
+    :param materialize: function translating a Deferred value, None if value contains none
+    """
+    values = [value]
+    for segment in segments:
+        found = []
+        for value in values:
+            if type(value) is Deferred:
+                value = materialize(value)
+            if segment is WILDCARD:
+                if isinstance(value, list):
+                    found.extend(value)
+            elif isinstance(value, dict) and segment in value:
+                found.append(value[segment])
+        values = found
+    if materialize is None:
+        return values
+    return [resolve(value, materialize) for value in values]
+
+
+def resolve(value, materialize):
+    """
+    Returns value with the Deferred values it contains translated, replacing them in place
+    """
+    type_ = type(value)
+    if type_ is Deferred:
+        return materialize(value)
+    if type_ is dict:
+        for key, item in value.items():
+            value[key] = resolve(item, materialize)
+    elif type_ is list:
+        for position, item in enumerate(value):
+            value[position] = resolve(item, materialize)
+    return value
+
+
+def evaluate(document, paths, materialize=None):
+    """
+    Looks paths up in an already translated document, with the results of query
+    :param document: dictionary, e.g. from Parser.parse_dict
+    :param paths: iterable of dotted paths
+    :param materialize: function translating the Deferred values of the document, if any
+    """
+    results = {}
+    for path in paths:
+        segments = parse_path(path)
+        found = select(document, segments, materialize)
+        if WILDCARD in segments:
+            results[path] = found
+        elif found:
+            results[path] = found[0]
+    return results
+
+
+class QueryTranslator(LazyTranslator):
+    """
+    QueryTranslator class
+    Builder translation unit that only stores the values on the way to or below one of the
+    key paths it is given; the others are dropped as soon as they are parsed
+    """
+    def __init__(self, key_paths, typed=False):
+        """
+        :param key_paths: paths of translated keys, without the wildcards
+        :param typed: translate dates and times to datetime, date and time objects instead of strings
+        """
+        self.key_paths = set(key_paths)
+        self.prefixes = {path[:length] for path in self.key_paths for length in range(len(path) + 1)}
+        self.roots = {path[0] for path in self.key_paths if path}
+        super().__init__(typed)
+
+    def reset(self):
+        super().reset()
+        # keys of the current table or table array
+        self.current_path = ()
+        # number of inline tables being built, whose contents are kept whole
+        self.inline_depth = 0
+
+    def __repr__(self):
+        return f'QueryTranslator: {len(self.key_paths)} paths'
+
+    def wanted(self, keys):
+        """
+        Tells if a key path leads to one of the queried paths or lies below one of them
+        """
+        keys = tuple(keys)
+        if keys in self.prefixes:
+            return True
+        return any(keys[:length] in self.key_paths for length in range(len(keys)))
+
+    def wanted_header(self, keys, table_array):
+        """
+        Tells if the section of a header can change the value of one of the queried paths
+        A table array replaces the tables under the same top-level key when the document is
+        merged, so every table array under the top-level key of a queried path matters.
+        """
+        return self.wanted(keys) or (table_array and keys[0] in self.roots)
+
+    def store(self, translated_keys, translated_value):
+        if self.inline_depth or self.wanted(self.current_path + tuple(translated_keys)):
+            super().store(translated_keys, translated_value)
+
+    def open_table(self, translated_keys):
+        self.current_path = tuple(translated_keys)
+        if self.wanted(translated_keys):
+            super().open_table(translated_keys)
+        else:
+            # nothing below this table is stored
+            self.current_dict = {}
+
+    def open_table_array(self, translated_keys):
+        self.current_path = tuple(translated_keys)
+        if self.wanted_header(translated_keys, True):
+            super().open_table_array(translated_keys)
+        else:
+            self.current_dict = {}
+
+    def build_inline_table(self, expression_list):
+        self.inline_depth += 1
+        try:
+            return super().build_inline_table(expression_list)
+        finally:
+            self.inline_depth -= 1
+
+
+def header_keys(tokens):
+    """
+    Returns the translated keys of a header from its tokens, brackets included
+    """
+    keys = []
+    for token in tokens:
+        type_ = token.type
+        if type_ == 'IDENTIFIER' or type_ == 'INTEGER':
+            keys.append(token.value)
+        elif type_ == 'STRING' or type_ == 'LITERAL_STRING':
+            keys.append(token.value[1:-1])
+        elif type_ == 'FLOAT':
+            keys.extend(token.value.split('.'))
+    return tuple(keys)
+
+
+def query(text, paths, typed=False):
+    """
+    Extracts the values of a few paths from a TOML document without translating the rest of it.
+    The document is lexed once to find its headers; only the sections whose header is on the way
+    to or below a queried path are parsed, their other values are dropped, and their large arrays
+    and inline tables are only parsed when they are queried.
+    The results are the same as evaluate(Parser(typed=typed).parse_dict(text), paths).
+    :param text: TOML document as str, or as UTF-8 bytes
+    :param paths: iterable of dotted paths, e.g. ['server.pool.size', 'fruit[*].name']
+    :param typed: return dates and times as datetime, date and time objects instead of strings
+    :return: dictionary of path -> value for the paths found; paths with [*] map to the list
+             of the values found, possibly empty
+    :raises ValueError: if a path is invalid
+    """
+    if not isinstance(text, str):
+        text = str(text, 'utf-8')
+    paths = list(paths)
+    key_paths = [tuple(key for key in parse_path(path) if key is not WILDCARD) for path in paths]
+    translator = QueryTranslator(key_paths, typed)
+    parser = Parser('json', builder=True, typed=typed)
+    parser.translation_unit = translator
+
+    tokens = []
+    # tokens of the current section while its header isn't complete, and the depth of its brackets
+    header = None
+    depth = 0
+    keep = True
+    for token, is_header in scan(text):
+        if is_header:
+            header = [token]
+            depth = 1
+            continue
+        if header is not None:
+            header.append(token)
+            if token.type == 'LBRACKET':
+                depth += 1
+            elif token.type == 'RBRACKET':
+                depth -= 1
+                if depth == 0:
+                    keep = translator.wanted_header(header_keys(header), header[1].type == 'LBRACKET')
+                    if keep:
+                        tokens.extend(header)
+                    header = None
+            continue
+        if keep:
+            tokens.append(token)
+
+    translator.reset()
+    if tokens:
+        parser.parse_tokens(defer_values(tokens))
+    document = translator.get_dict()
+
+    def materialize(deferred):
+        translator.reset()
+        # the value is kept whole, like the contents of an inline table
+        translator.inline_depth = 1
+        parser.parse_tokens([Token('IDENTIFIER', 'value', 0, 0), Token('EQUALS', '=', 0, 0), *deferred.tokens])
+        return translator.get_dict()['value']
+
+    return evaluate(document, paths, materialize)
@@ -0,0 +1,106 @@
+import datetime
+import random
+import unittest
+from lazy import DEFER_TOKENS
+from parser_toml import Parser
+from query import evaluate, parse_path, query, QueryTranslator, WILDCARD
+
+# Test data
+numbers = ', '.join(str(number) for number in range(DEFER_TOKENS))
+toml_document = f'''title = "query"
+server.host = "localhost"
+when = 1979-05-27T07:32:00Z
+
+[server.pool]
+size = 8
+sizes = [{numbers}]
+options = {{ timeout = 30, retries = [{numbers}] }}
+
+[client]
+size = 1
+
+[[fruit]]
+name = "apple"
+points = [{{ x = 1 }}, {{ x = 2 }}]
+
+[[fruit]]
+name = "banana"
+
+["dotted.key"]
+value = 1
+'''
+pairs = ', '.join(f'k{number} = {number}' for number in range(12))
+toml_extended = [f'a = {{ {pairs} }}\na.extra = 1\n', f'a = {{ {pairs} }}\n[a.b]\nc = 1\n']
+
+
+class ParsePathTestCase(unittest.TestCase):
+
+    def test_paths(self):
+        self.assertEqual(('server', 'pool', 'size'), parse_path('server.pool.size'))
+        self.assertEqual(('fruit', WILDCARD, 'name'), parse_path('fruit[*].name'))
+        self.assertEqual(('a', WILDCARD, WILDCARD), parse_path('a[*][*]'))
+        self.assertEqual(('dotted.key', 'value'), parse_path('"dotted.key".value'))
+        self.assertEqual(('1', 'x'), parse_path("'1'.x"))
+
+    def test_invalid_paths(self):
+        for path in ('', 'a.', '.a', 'a..b', '[*]', 'a b', 'a[0]'):
+            with self.assertRaises(ValueError, msg=path):
+                parse_path(path)
+
+
+class QueryTestCase(unittest.TestCase):
+
+    def test_query(self):
+        results = query(toml_document, ['server.pool.size', 'fruit[*].name', 'fruit[*].points[*].x',
+                                        'server.pool.options.retries[*]', '"dotted.key".value', 'missing'])
+        self.assertEqual({
+            'server.pool.size': 8,
+            'fruit[*].name': ['apple', 'banana'],
+            'fruit[*].points[*].x': [1, 2],
+            'server.pool.options.retries[*]': list(range(DEFER_TOKENS)),
+            '"dotted.key".value': 1,
+        }, results)
+
+    def test_subtree(self):
+        # deferred values below a queried table are translated too
+        expected = Parser().parse_dict(toml_document)['server']
+        self.assertEqual(expected, query(toml_document, ['server'])['server'])
+
+    def test_typed(self):
+        when = datetime.datetime(1979, 5, 27, 7, 32, tzinfo=datetime.timezone.utc)
+        self.assertEqual({'when': when}, query(toml_document.encode(), ['when'], typed=True))
+
+    def test_unwanted_values_dropped(self):
+        translator = QueryTranslator([('server', 'pool', 'size')])
+        parser = Parser(builder=True)
+        parser.translation_unit = translator
+        parser.translate(toml_document)
+        self.assertEqual({'server': {'pool': {'size': 8}}}, translator.get_dict())
+
+    def test_extended_inline_table(self):
+        # a deferred inline table extended by a dotted key or a header
+        for text in toml_extended:
+            document = Parser().parse_dict(text)
+            for paths in (['a'], ['a.extra'], ['a.b.c', 'a.k0']):
+                self.assertEqual(evaluate(document, paths), query(text, paths), (text, paths))
+
+    def test_equivalence(self):
+        generator = random.Random(0)
+        headers = ['[a]', '[a.b]', '[[c]]', '[c.d]', '[[c.e]]', '[f]', '[e.t]']
+        expressions = ['x = 1', 'b.y = "s"', f'd = [{numbers}]', f'e = {{ x = [{numbers}], y = 2 }}',
+                       'v = [{ x = 1 }, { x = 2 }]', 'e.z = 3']
+        paths = ['a', 'a.b', 'a.b.x', 'a.b.y', 'c[*].x', 'c[*].e[*].x', 'c.d', 'f.d[*]', 'f.e.x', 'x', 'v[*].x',
+                 'c[*].d', 'e.y', 'b', 'e', 'e.z', 'e.t.x', 'a.e.z']
+        for _ in range(500):
+            text = '\n'.join(generator.choice(headers + expressions) for _ in range(generator.randint(1, 8)))
+            try:
+                document = Parser().parse_dict(text)
+            except Exception:
+                # conflicting definitions, which the translator doesn't report consistently
+                continue
+            selected = generator.sample(paths, generator.randint(1, 4))
+            self.assertEqual(evaluate(document, selected), query(text, selected), (text, selected))
+
+
+if __name__ == '__main__':
+    unittest.main()
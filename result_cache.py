@@ -0,0 +1,172 @@
+import hashlib
+import os
+import sys
+from collections import OrderedDict
+from lexer_toml import Lexer
+from parser_cache import grammar_hash
+from parser_toml import Parser
+
+# Version of the translated results, to bump whenever a translator changes the result of the same
+# document, so the results stored on disk by a previous version are no longer served
+RESULT_FORMAT = 1
+
+
+class ResultCache:
+    """
+    Caches the translation of TOML files in front of Parser.parse
+    Files are looked up by path, size and modification time, then by the hash of their
+    contents, so an unchanged file is never parsed twice. Results are kept in memory in
+    LRU order, bounded by number of entries and bytes, and optionally stored on disk.
+    The hash also covers the grammar, RESULT_FORMAT and the output language.
+    Only the paths of the results kept in memory are indexed by size and modification time.
+    A file rewritten with the same size within the same mtime tick is not detected.
+    """
+    def __init__(self, lang='json', max_entries=256, max_bytes=64 * 2 ** 20, directory=None):
+        """
+        :param lang: output language
+        :param max_entries: maximum number of results kept in memory
+        :param max_bytes: maximum total size of the results kept in memory
+        :param directory: directory of the on-disk cache, None to keep results in memory only
+        """
+        self.lang = lang
+        self.max_entries = max_entries
+        self.max_bytes = max_bytes
+        self.directory = directory
+        self.parser = Parser(lang, builder=True)
+        self.salt = f'{RESULT_FORMAT}\0{grammar_hash(Lexer, Parser)}\0{lang.lower()}\0'.encode()
+
+        # content hash -> translated result, least recently used first
+        self.results = OrderedDict()
+        # path -> (size, mtime, content hash) of its last version, for the results kept in memory
+        self.stats_index = {}
+        # content hash -> paths whose last version has that hash
+        self.digest_paths = {}
+        self.size = 0
+
+        self.hits = 0
+        self.disk_hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    def parse(self, path):
+        """
+        Returns the translation of a TOML file, parsing it only if it isn't cached
+        :param path: path of the TOML file
+        """
+        path = os.path.abspath(path)
+        stat = os.stat(path)
+        version = (stat.st_size, stat.st_mtime_ns)
+
+        entry = self.stats_index.get(path)
+        if entry is not None and entry[:2] == version and entry[2] in self.results:
+            self.hits += 1
+            self.results.move_to_end(entry[2])
+            return self.results[entry[2]]
+
+        with open(path, 'rb') as f:
+            content = f.read()
+        digest = hashlib.sha256(self.salt + content).hexdigest()
+        if entry is not None:
+            self.forget_path(path, entry[2])
+        self.stats_index[path] = version + (digest,)
+        self.digest_paths.setdefault(digest, set()).add(path)
+
+        if digest in self.results:
+            self.hits += 1
+            self.results.move_to_end(digest)
+            return self.results[digest]
+
+        result = self.read_disk(digest)
+        if result is None:
+            self.misses += 1
+            result = self.parser.parse(content.decode('utf-8'))
+            self.write_disk(digest, result)
+        else:
+            self.disk_hits += 1
+
+        self.store(digest, result)
+        return result
+
+    def store(self, digest, result):
+        """
+        Keeps a result in memory, evicting the least recently used ones beyond the limits
+        """
+        self.results[digest] = result
+        self.size += sys.getsizeof(result)
+        while len(self.results) > self.max_entries or (self.size > self.max_bytes and len(self.results) > 1):
+            evicted_digest, evicted = self.results.popitem(last=False)
+            self.size -= sys.getsizeof(evicted)
+            self.evictions += 1
+            # the paths of an evicted result are looked up again by content hash
+            for evicted_path in self.digest_paths.pop(evicted_digest, ()):
+                del self.stats_index[evicted_path]
+
+    def forget_path(self, path, digest):
+        """
+        Removes a path from the paths of a content hash, when it has a new version
+        """
+        paths = self.digest_paths.get(digest)
+        if paths is not None:
+            paths.discard(path)
+            if not paths:
+                del self.digest_paths[digest]
+
+    def disk_path(self, digest):
+        return os.path.join(self.directory, f'{digest}.{self.lang.lower()}')
+
+    def read_disk(self, digest):
+        """
+        Returns the result stored on disk for a content hash, or None
+        """
+        if self.directory is None:
+            return None
+        try:
+            if self.parser.translation_unit.binary:
+                with open(self.disk_path(digest), 'rb') as f:
+                    return f.read()
+            with open(self.disk_path(digest), 'r', encoding='utf-8') as f:
+                return f.read()
+        except OSError:
+            return None
+
+    def write_disk(self, digest, result):
+        """
+        Stores a result on disk, ignoring a directory that can't be written
+        """
+        if self.directory is None:
+            return
+        path = self.disk_path(digest)
+        temporary = f'{path}.{os.getpid()}'
+        try:
+            os.makedirs(self.directory, exist_ok=True)
+            if isinstance(result, bytes):
+                with open(temporary, 'wb') as f:
+                    f.write(result)
+            else:
+                with open(temporary, 'w', encoding='utf-8') as f:
+                    f.write(result)
+            os.replace(temporary, path)
+        except OSError:
+            pass
+
+    def clear(self):
+        """
+        Empties the in-memory cache (the disk cache and the counters are kept)
+        """
+        self.results.clear()
+        self.stats_index.clear()
+        self.digest_paths.clear()
+        self.size = 0
+
+    def stats(self):
+        """
+        Returns the hit, miss and eviction counters and the current memory usage
+        """
+        return {
+            'hits': self.hits,
+            'disk_hits': self.disk_hits,
+            'misses': self.misses,
+            'evictions': self.evictions,
+            'entries': len(self.results),
+            'bytes': self.size,
+        }
@@ -0,0 +1,107 @@
+import os
+import tempfile
+import unittest
+import result_cache
+from result_cache import ResultCache
+
+# Test data
+toml_first = 'key = "value"'
+json_first_expected = '''{
+    "key": "value"
+}'''
+toml_second = 'key = "another value"'
+json_second_expected = '''{
+    "key": "another value"
+}'''
+
+
+class ResultCacheTestCase(unittest.TestCase):
+
+    def setUp(self):
+        self.directory = tempfile.TemporaryDirectory()
+        self.path = self.file('config.toml', toml_first)
+
+    def tearDown(self):
+        self.directory.cleanup()
+
+    def file(self, name, content, mtime=None):
+        path = os.path.join(self.directory.name, name)
+        with open(path, 'w') as f:
+            f.write(content)
+        if mtime is not None:
+            os.utime(path, ns=(mtime, mtime))
+        return path
+
+    def test_hit(self):
+        cache = ResultCache()
+        self.assertEqual(json_first_expected, cache.parse(self.path))
+        self.assertEqual(json_first_expected, cache.parse(self.path))
+        self.assertEqual((1, 1), (cache.stats()['misses'], cache.stats()['hits']))
+
+    def test_modified_file(self):
+        cache = ResultCache()
+        cache.parse(self.path)
+        self.file('config.toml', toml_second)
+        self.assertEqual(json_second_expected, cache.parse(self.path))
+        self.assertEqual(2, cache.stats()['misses'])
+
+    def test_content_hash_fallback(self):
+        cache = ResultCache()
+        cache.parse(self.path)
+        # same contents with another mtime, and under another path
+        self.file('config.toml', toml_first, mtime=10 ** 18)
+        copy = self.file('copy.toml', toml_first)
+        self.assertEqual(json_first_expected, cache.parse(self.path))
+        self.assertEqual(json_first_expected, cache.parse(copy))
+        self.assertEqual((1, 2), (cache.stats()['misses'], cache.stats()['hits']))
+
+    def test_eviction_by_entries(self):
+        cache = ResultCache(max_entries=1)
+        other = self.file('other.toml', toml_second)
+        cache.parse(self.path)
+        cache.parse(other)
+        cache.parse(self.path)
+        self.assertEqual({'misses': 3, 'evictions': 2, 'entries': 1},
+                         {key: cache.stats()[key] for key in ('misses', 'evictions', 'entries')})
+
+    def test_index_pruned(self):
+        cache = ResultCache(max_entries=2)
+        paths = [self.file(f'config{number}.toml', f'key = {number}') for number in range(10)]
+        for path in paths:
+            cache.parse(path)
+        # only the paths of the results kept in memory are indexed
+        self.assertEqual(set(paths[-2:]), set(cache.stats_index))
+        # a new version evicts the result of config8, and its old version is no longer indexed
+        self.file('config9.toml', 'key = 10')
+        cache.parse(paths[-1])
+        self.assertEqual({paths[-1]}, set(cache.stats_index))
+        self.assertEqual(1, len(cache.digest_paths))
+
+    def test_eviction_by_bytes(self):
+        cache = ResultCache(max_bytes=1)
+        other = self.file('other.toml', toml_second)
+        cache.parse(self.path)
+        cache.parse(other)
+        self.assertEqual((1, 1), (cache.stats()['evictions'], cache.stats()['entries']))
+
+    def test_disk_cache(self):
+        directory = os.path.join(self.directory.name, 'cache')
+        ResultCache(directory=directory).parse(self.path)
+        cache = ResultCache(directory=directory)
+        self.assertEqual(json_first_expected, cache.parse(self.path))
+        self.assertEqual((0, 1), (cache.stats()['misses'], cache.stats()['disk_hits']))
+
+    def test_disk_cache_format(self):
+        directory = os.path.join(self.directory.name, 'cache')
+        ResultCache(directory=directory).parse(self.path)
+        # results stored by another version of the translators aren't served
+        format_ = result_cache.RESULT_FORMAT
+        result_cache.RESULT_FORMAT = format_ + 1
+        self.addCleanup(setattr, result_cache, 'RESULT_FORMAT', format_)
+        cache = ResultCache(directory=directory)
+        self.assertEqual(json_first_expected, cache.parse(self.path))
+        self.assertEqual((1, 0), (cache.stats()['misses'], cache.stats()['disk_hits']))
+
+
+if __name__ == '__main__':
+    unittest.main()
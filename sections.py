@@ -0,0 +1,243 @@
+import re
+from key_val import KeyVal
+from lexer_fast import FastLexer, rule_regex
+from table import Table
+from table_array import TableArray
+from translator_json import JSONTranslator
+
+# What header_positions has to see of a document, matched by the re module without lexing it, with
+# the rules of the lexer: strings and comments, skipped whole so their brackets don't count, brackets
+# and braces, and headers at the start of a line, with their quoted keys
+STRING_PATTERN = rule_regex('STRING') + '|' + rule_regex('LITERAL_STRING')
+HEADER_PATTERN = r'^[ \t]*(?P<header>\[\[?(?:' + STRING_PATTERN + r"""|[^\]\n"'#])*\]\]?)"""
+SKIP_PATTERN = '|'.join((
+    '(?P<multiline>' + rule_regex('MULTILINE_STRING') + '|' + rule_regex('LITERAL_MULTILINE_STRING') + ')',
+    STRING_PATTERN,
+    # Lexer.t_COMMENT skips the newline after the comment
+    r'(?P<comment>#.*\n?)',
+))
+BRACKET_PATTERN = r"(?P<open>[\[{])|(?P<close>[\]}])"
+HEADER_SCAN = re.compile('|'.join((HEADER_PATTERN, SKIP_PATTERN, BRACKET_PATTERN)), re.MULTILINE)
+BRACKET_SCAN = re.compile('|'.join((SKIP_PATTERN, BRACKET_PATTERN)))
+
+
+class Section:
+    """
+    Section class
+    Top-level part of a document: the expressions before the first header, or a [table] or
+    [[table array]] header with the expressions up to the next header.
+    Contains its position in the document, its tokens and, once parsed, its nodes
+    Example: Section: 120-245, 37 tokens
+    """
+    __slots__ = ('start', 'end', 'tokens', 'nodes')
+
+    def __init__(self, start, end, tokens):
+        self.start = start
+        self.end = end
+        self.tokens = tokens
+        self.nodes = None
+
+    def __repr__(self):
+        return f'Section: {self.start}-{self.end}, {len(self.tokens or ())} tokens'
+
+
+class TokenStream:
+    """
+    Lexer replaying already lexed tokens to the parser
+    """
+    def __init__(self, tokens):
+        self.iterator = iter(tokens)
+
+    def input(self, data):
+        pass
+
+    def token(self):
+        return next(self.iterator, None)
+
+
+def scan(text, start=0, end=None, lineno=1):
+    """
+    Lexes text[start:end] and yields (token, is_header) pairs, is_header being True for the
+    '[' opening a table or table array header
+    A '[' is a header when it is outside any array or inline table and doesn't follow '=',
+    so brackets inside values and inside strings (which are single tokens) never split
+    :param text: document
+    :param start: position where the lexing starts, at the beginning of a section
+    :param end: position where the lexing stops, None for the end of the text
+    :param lineno: line number at start
+    :raises SyntaxError: if the brackets and braces of text[start:end] aren't balanced
+    """
+    if end is None:
+        end = len(text)
+
+    lexer = FastLexer()
+    lexer.input(text[start:end] if start or end != len(text) else text)
+    lexer.offset = start
+    lexer.lineno = lineno
+    return scan_tokens(lexer)
+
+
+def scan_tokens(lexer):
+    """
+    Same as scan, for the tokens of a lexer that has already been given its input
+    :param lexer: lexer with the token method of FastLexer
+    """
+    depth = 0
+    header_depth = 0
+    previous = None
+
+    token = lexer.token()
+    while token:
+        type_ = token.type
+        header = False
+        if header_depth:
+            if type_ == 'LBRACKET':
+                header_depth += 1
+            elif type_ == 'RBRACKET':
+                header_depth -= 1
+        elif type_ == 'LBRACKET' and depth == 0 and previous != 'EQUALS':
+            header = True
+            header_depth = 1
+        elif type_ == 'LBRACKET' or type_ == 'LBRACE':
+            depth += 1
+        elif type_ == 'RBRACKET' or type_ == 'RBRACE':
+            depth -= 1
+            if depth < 0:
+                raise SyntaxError(f'Unbalanced {token.value!r} at line {token.lineno}')
+        yield token, header
+        previous = type_
+        token = lexer.token()
+
+    if depth or header_depth:
+        raise SyntaxError('Unclosed bracket or brace at end of input')
+
+
+def split_sections(text, start=0, end=None, lineno=1):
+    """
+    Lexes text[start:end] and splits it into sections at the table and table array headers
+    :param text: document
+    :param start: position where the lexing starts, at the beginning of a section
+    :param end: position where the lexing stops, None for the end of the text
+    :param lineno: line number at start
+    :return: list of sections with positions relative to text, only the first one may lack a header
+    :raises SyntaxError: if the brackets and braces of text[start:end] aren't balanced
+    """
+    if end is None:
+        end = len(text)
+
+    sections = []
+    tokens = []
+    section_start = start
+    for token, header in scan(text, start, end, lineno):
+        if header:
+            if token.lexpos > section_start:
+                sections.append(Section(section_start, token.lexpos, tokens))
+            section_start = token.lexpos
+            tokens = []
+        tokens.append(token)
+
+    sections.append(Section(section_start, end, tokens))
+    return sections
+
+
+def count_lines(text, start, end):
+    """
+    Returns the number of lines text[start:end] adds, counted like Lexer.t_NEWLINE does
+    """
+    return text.count('\n', start, end) + text.count('\r', start, end)
+
+
+def follows_equals(text, position, comment):
+    """
+    Returns True if the value of a key/value pair starts at position, on the line after its '='
+    :param text: document
+    :param position: position of a '[' starting a line
+    :param comment: last comment match before position, or None
+    """
+    position -= 1
+    while position >= 0 and text[position] in ' \t\n\r':
+        position -= 1
+    if comment is not None and comment.end() > position >= comment.start():
+        return follows_equals(text, comment.start(), None)
+    return position >= 0 and text[position] == '='
+
+
+def header_positions(text):
+    """
+    Returns the (position, line number) of every table and table array header of a document
+    A header is a '[' starting a line outside any multiline string, array or inline table, like the
+    '[' scan finds outside any array or inline table and after something else than '='.
+    The document isn't lexed: the re module finds the strings, comments, brackets and headers,
+    so only they cost a step in Python, and invalid tokens are left to the parser.
+    Line numbers are counted like the lexers do, without the newlines of multiline strings and comments.
+    :param text: document
+    """
+    positions = []
+    depth = 0
+    lineno = 1
+    counted = 0
+    comment = None
+    for match in HEADER_SCAN.finditer(text):
+        kind = match.lastgroup
+        if kind == 'header':
+            start = match.start(kind)
+            if depth == 0 and not follows_equals(text, start, comment):
+                lineno += count_lines(text, counted, start)
+                counted = start
+                positions.append((start, lineno))
+                continue
+            # a line of a multiline array starting with a nested array
+            for bracket in BRACKET_SCAN.finditer(match.group(kind)):
+                if bracket.lastgroup == 'open':
+                    depth += 1
+                elif bracket.lastgroup == 'close':
+                    depth -= 1
+        elif kind == 'open':
+            depth += 1
+        elif kind == 'close':
+            depth -= 1
+        elif kind == 'multiline' or kind == 'comment':
+            lineno -= count_lines(text, match.start(), match.end())
+            if kind == 'comment':
+                comment = match
+    return positions
+
+
+# Kinds of the expressions recorded by Recorder
+KEY_VAL = 0
+TABLE = 1
+TABLE_ARRAY = 2
+
+
+class Recorder(JSONTranslator):
+    """
+    Recorder class
+    Translation unit for the builder mode that records the top-level expressions of a document
+    as (kind, translated keys, translated value) tuples instead of applying them.
+    Plain tuples, lists and values are much cheaper to send between processes than node objects.
+    """
+    def reset(self):
+        super().reset()
+        self.records = []
+        # number of inline tables being built, whose expressions are applied as usual
+        self.inline_depth = 0
+
+    def __repr__(self):
+        return f'Recorder: {len(self.records)} expressions'
+
+    def build(self, node):
+        if self.inline_depth:
+            super().build(node)
+        elif isinstance(node, KeyVal):
+            self.records.append((KEY_VAL, self.translate_keys(node.key_list), node.value))
+        elif isinstance(node, Table):
+            self.records.append((TABLE, self.translate_keys(node.key_list), None))
+        elif isinstance(node, TableArray):
+            self.records.append((TABLE_ARRAY, self.translate_keys(node.key_list), None))
+
+    def build_inline_table(self, expression_list):
+        self.inline_depth += 1
+        try:
+            return super().build_inline_table(expression_list)
+        finally:
+            self.inline_depth -= 1
@@ -0,0 +1,298 @@
+import datetime
+import mmap
+import os
+import struct
+from collections.abc import Mapping, Sequence
+from translator_json import to_datetime
+
+# A snapshot file is made of a header followed by five sections:
+#   string offsets  (string count + 1) x uint32, offsets of the strings in the string data
+#   nodes           node count x 12 bytes: type byte, 3 padding bytes and an 8 byte payload
+#   children        child count x uint32, node indexes of the array elements
+#   entries         entry count x (uint32 key string index, uint32 node index), table contents
+#   string data     UTF-8 text of every distinct key and string
+# Tables and arrays point to a contiguous run of entries or children with (first, count),
+# so any value is reached without decoding the rest of the file.
+MAGIC = b'TOMLSNAP'
+VERSION = 1
+HEADER = struct.Struct('<8sHxxIIIII')
+
+# Node types
+FALSE = 0
+TRUE = 1
+INTEGER = 2
+FLOAT = 3
+STRING = 4
+DATETIME = 5
+ARRAY = 6
+TABLE = 7
+
+NODE = struct.Struct('<B3xq')
+FLOAT_NODE = struct.Struct('<B3xd')
+RANGE_NODE = struct.Struct('<B3xII')
+UINT32 = struct.Struct('<I')
+# Also used for the (start, end) pair of consecutive string offsets
+ENTRY = struct.Struct('<II')
+
+
+class SnapshotError(ValueError):
+    """
+    Raised when a file isn't a valid snapshot of a supported version
+    """
+
+
+class SnapshotWriter:
+    """
+    SnapshotWriter class
+    Converts a translated document (dictionaries, lists and scalars) to a snapshot
+    """
+    def __init__(self):
+        self.strings = {}
+        self.nodes = bytearray()
+        self.node_count = 0
+        self.children = []
+        self.entries = []
+
+    def __repr__(self):
+        return f'SnapshotWriter: {self.node_count} nodes, {len(self.strings)} strings'
+
+    def string(self, text):
+        index = self.strings.get(text)
+        if index is None:
+            index = self.strings[text] = len(self.strings)
+        return index
+
+    def node(self, record):
+        self.nodes += record
+        self.node_count += 1
+        return self.node_count - 1
+
+    def add(self, value):
+        """
+        Adds a value and everything below it, and returns the index of its node
+        """
+        type_ = type(value)
+        if type_ is dict:
+            items = [(self.string(key), self.add(item)) for key, item in value.items()]
+            first = len(self.entries)
+            self.entries.extend(items)
+            return self.node(RANGE_NODE.pack(TABLE, first, len(items)))
+        if type_ is list:
+            elements = [self.add(item) for item in value]
+            first = len(self.children)
+            self.children.extend(elements)
+            return self.node(RANGE_NODE.pack(ARRAY, first, len(elements)))
+        if type_ is str:
+            return self.node(NODE.pack(STRING, self.string(value)))
+        if type_ is bool:
+            return self.node(NODE.pack(TRUE if value else FALSE, 0))
+        if type_ is int:
+            if not -2 ** 63 <= value < 2 ** 63:
+                raise OverflowError(f'Integer {value} does not fit in 64 bits')
+            return self.node(NODE.pack(INTEGER, value))
+        if type_ is float:
+            return self.node(FLOAT_NODE.pack(FLOAT, value))
+        if isinstance(value, (datetime.datetime, datetime.date, datetime.time)):
+            return self.node(NODE.pack(DATETIME, self.string(value.isoformat())))
+        if hasattr(value, 'tolist'):
+            # typed buffer of a numeric array
+            return self.add(value.tolist())
+        raise TypeError(f'Object of type {type_.__name__} can not be stored in a snapshot')
+
+    def write(self, document, file):
+        """
+        Writes a translated document as a snapshot
+        :param document: dictionary of the document
+        :param file: binary file object
+        """
+        root = self.add(document)
+
+        offsets = [0]
+        data = bytearray()
+        for text in self.strings:
+            data += text.encode('utf-8')
+            offsets.append(len(data))
+
+        file.write(HEADER.pack(MAGIC, VERSION, root, len(self.strings), self.node_count, len(self.children),
+                               len(self.entries)))
+        file.write(struct.pack(f'<{len(offsets)}I', *offsets))
+        file.write(self.nodes)
+        file.write(struct.pack(f'<{len(self.children)}I', *self.children))
+        file.write(struct.pack(f'<{2 * len(self.entries)}I', *(index for entry in self.entries for index in entry)))
+        file.write(data)
+
+
+class Snapshot:
+    """
+    Snapshot class
+    Memory-mapped snapshot file. Nothing is decoded when it is opened: tables and arrays are
+    SnapshotTable and SnapshotArray views that decode their values when they are accessed.
+    """
+    def __init__(self, path):
+        """
+        :param path: path of the snapshot file
+        :raises SnapshotError: if the file isn't a snapshot of a supported version
+        """
+        with open(path, 'rb') as f:
+            if os.fstat(f.fileno()).st_size < HEADER.size:
+                raise SnapshotError('Truncated snapshot header')
+            self.data = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        try:
+            self.load(self.data)
+        except SnapshotError:
+            self.data.close()
+            raise
+
+    def load(self, data):
+        """
+        Reads the header and computes the offsets of the sections
+        :param data: contents of the snapshot, at least HEADER.size bytes
+        """
+        magic, version, self.root_index, strings, nodes, children, entries = HEADER.unpack_from(data, 0)
+        if magic != MAGIC:
+            raise SnapshotError('Not a TOML snapshot')
+        if version != VERSION:
+            raise SnapshotError(f'Unsupported snapshot version {version}, expected {VERSION}')
+
+        self.string_offsets = HEADER.size
+        self.nodes = self.string_offsets + UINT32.size * (strings + 1)
+        self.children = self.nodes + NODE.size * nodes
+        self.entries = self.children + UINT32.size * children
+        self.string_data = self.entries + ENTRY.size * entries
+        if len(data) < self.string_data:
+            raise SnapshotError('Truncated snapshot')
+        # decoded strings by index, filled on demand
+        self.string_cache = {}
+
+    def __repr__(self):
+        return f'Snapshot: {len(self.data)} bytes'
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
+
+    def close(self):
+        self.data.close()
+
+    def root(self):
+        """
+        Returns the document as a SnapshotTable
+        """
+        return self.value(self.root_index)
+
+    def string(self, index):
+        text = self.string_cache.get(index)
+        if text is None:
+            start, end = ENTRY.unpack_from(self.data, self.string_offsets + UINT32.size * index)
+            text = self.data[self.string_data + start:self.string_data + end].decode('utf-8')
+            self.string_cache[index] = text
+        return text
+
+    def value(self, index):
+        """
+        Decodes the node at index: scalars are returned as Python objects, tables and arrays as views
+        """
+        offset = self.nodes + NODE.size * index
+        type_ = self.data[offset]
+        if type_ == TABLE:
+            _, first, count = RANGE_NODE.unpack_from(self.data, offset)
+            return SnapshotTable(self, first, count)
+        if type_ == ARRAY:
+            _, first, count = RANGE_NODE.unpack_from(self.data, offset)
+            return SnapshotArray(self, first, count)
+        if type_ == FLOAT:
+            return FLOAT_NODE.unpack_from(self.data, offset)[1]
+        payload = NODE.unpack_from(self.data, offset)[1]
+        if type_ == STRING:
+            return self.string(payload)
+        if type_ == INTEGER:
+            return payload
+        if type_ == TRUE or type_ == FALSE:
+            return type_ == TRUE
+        if type_ == DATETIME:
+            return to_datetime(self.string(payload))
+        raise SnapshotError(f'Unknown node type {type_}')
+
+
+def materialize(value):
+    """
+    Converts snapshot views to dictionaries and lists, recursively
+    """
+    if isinstance(value, SnapshotTable):
+        return {key: materialize(item) for key, item in value.items()}
+    if isinstance(value, SnapshotArray):
+        return [materialize(item) for item in value]
+    return value
+
+
+class SnapshotTable(Mapping):
+    """
+    SnapshotTable class
+    Read-only mapping over a table of a snapshot; its key index is built on first lookup
+    """
+    __slots__ = ('snapshot', 'first', 'count', 'index')
+
+    def __init__(self, snapshot, first, count):
+        self.snapshot = snapshot
+        self.first = first
+        self.count = count
+        self.index = None
+
+    def __repr__(self):
+        return f'SnapshotTable: {self.count} keys'
+
+    def entry(self, position):
+        return ENTRY.unpack_from(self.snapshot.data, self.snapshot.entries + ENTRY.size * (self.first + position))
+
+    def __getitem__(self, key):
+        if self.index is None:
+            string = self.snapshot.string
+            self.index = {string(key_index): node for key_index, node in map(self.entry, range(self.count))}
+        return self.snapshot.value(self.index[key])
+
+    def __iter__(self):
+        string = self.snapshot.string
+        for position in range(self.count):
+            yield string(self.entry(position)[0])
+
+    def __len__(self):
+        return self.count
+
+    def to_dict(self):
+        return materialize(self)
+
+
+class SnapshotArray(Sequence):
+    """
+    SnapshotArray class
+    Read-only sequence over an array of a snapshot
+    """
+    __slots__ = ('snapshot', 'first', 'count')
+
+    def __init__(self, snapshot, first, count):
+        self.snapshot = snapshot
+        self.first = first
+        self.count = count
+
+    def __repr__(self):
+        return f'SnapshotArray: {self.count} elements'
+
+    def __getitem__(self, position):
+        if isinstance(position, slice):
+            return [self[index] for index in range(*position.indices(self.count))]
+        if position < 0:
+            position += self.count
+        if not 0 <= position < self.count:
+            raise IndexError('snapshot array index out of range')
+        snapshot = self.snapshot
+        offset = snapshot.children + UINT32.size * (self.first + position)
+        return snapshot.value(UINT32.unpack_from(snapshot.data, offset)[0])
+
+    def __len__(self):
+        return self.count
+
+    def to_list(self):
+        return materialize(self)
+
@@ -0,0 +1,90 @@
+import datetime
+import io
+import os
+import tempfile
+import unittest
+from parser_toml import Parser
+from snapshot import Snapshot, SnapshotArray, SnapshotError, SnapshotTable, SnapshotWriter, MAGIC
+
+# Test data
+toml_document = '''title = "snapshot"
+numbers = [0, -1, 9223372036854775807, -9223372036854775808]
+floats = [1.5, -0.0, 1e300]
+flags = { on = true, off = false }
+nested = [[1, "two"], [], { key = "value" }]
+when = 1979-05-27T07:32:00Z
+day = 1979-05-27
+[server]
+host = "é→日本"
+[[items]]
+id = 1
+[[items]]
+id = 2
+'''
+
+
+class SnapshotTestCase(unittest.TestCase):
+
+    def setUp(self):
+        directory = tempfile.TemporaryDirectory()
+        self.addCleanup(directory.cleanup)
+        self.directory = directory.name
+
+    def compile(self, document, typed=False):
+        """
+        Writes the snapshot of a TOML document and returns the opened Snapshot
+        """
+        path = os.path.join(self.directory, 'config.snapshot')
+        with open(path, 'wb') as f:
+            f.write(Parser('snapshot', typed=typed).parse(document))
+        snapshot = Snapshot(path)
+        self.addCleanup(snapshot.close)
+        return snapshot
+
+    def test_round_trip(self):
+        for typed in (False, True):
+            snapshot = self.compile(toml_document, typed)
+            self.assertEqual(Parser(typed=typed).parse_dict(toml_document), snapshot.root().to_dict())
+
+    def test_lazy_access(self):
+        root = self.compile(toml_document).root()
+        self.assertIsInstance(root, SnapshotTable)
+        self.assertIsInstance(root['items'], SnapshotArray)
+        self.assertEqual('é→日本', root['server']['host'])
+        self.assertEqual(2, root['items'][-1]['id'])
+        self.assertEqual([0, -1], root['numbers'][:2])
+        self.assertEqual('value', root['nested'][2]['key'])
+        self.assertEqual(['title', 'numbers', 'floats', 'flags', 'nested', 'when', 'day', 'server', 'items'],
+                         list(root))
+        self.assertNotIn('missing', root)
+        with self.assertRaises(IndexError):
+            root['items'][2]
+
+    def test_typed_dates(self):
+        root = self.compile(toml_document, typed=True).root()
+        self.assertEqual(datetime.datetime(1979, 5, 27, 7, 32, tzinfo=datetime.timezone.utc), root['when'])
+        self.assertEqual(datetime.date(1979, 5, 27), root['day'])
+
+    def test_invalid_files(self):
+        path = os.path.join(self.directory, 'invalid.snapshot')
+        valid = Parser('snapshot').parse(toml_document)
+        for data in (b'', b'not a snapshot' * 10, MAGIC + b'\xff\xff' + valid[10:], valid[:40]):
+            with open(path, 'wb') as f:
+                f.write(data)
+            with self.assertRaises(SnapshotError):
+                Snapshot(path).close()
+
+    def test_write_result(self):
+        parser = Parser('snapshot', builder=True)
+        parser.translate(toml_document)
+        file = io.BytesIO()
+        parser.translation_unit.write_result(file)
+        self.assertEqual(parser.translation_unit.get_result(), file.getvalue())
+
+    def test_overflow(self):
+        with self.assertRaises(OverflowError):
+            SnapshotWriter().write({'big': 2 ** 64}, io.BytesIO())
+
+
+if __name__ == '__main__':
+    unittest.main()
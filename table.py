@@ -6,6 +6,8 @@ class Table:
     Contains a list of keys
     Example: Table: [Key('string', "hello"), Key('string', "world")]
     """
+    __slots__ = ('key_list',)
+
     def __init__(self, table_key_list: [Key]):
         self.key_list = table_key_list
 
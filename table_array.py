@@ -7,6 +7,8 @@ class TableArray:
     Contains a list of keys
     Example: TableArray: [Key('string', "hello"), Key('string', "world")]
     """
+    __slots__ = ('key_list',)
+
     def __init__(self, key_list: [Key]):
         self.key_list = key_list
 
@@ -0,0 +1,55 @@
+import os
+from lazy import LazyDocument
+from lexer_bytes import mapped
+from parser_toml import Parser
+
+
+def loads(data, typed=False, lazy=False, numeric_arrays=None, intern=None):
+    """
+    Parses a TOML document into Python dictionaries and lists
+    :param data: TOML document as str, or as UTF-8 bytes or memory-mapped file (lexed without decoding it)
+    :param typed: return dates and times as datetime, date and time objects instead of strings
+    :param lazy: return a LazyDocument that translates the tables and arrays when they are read
+    :param numeric_arrays: None for lists, 'array' or 'numpy' to return the arrays of integers or floats
+                           as array.array or NumPy arrays
+    :param intern: True to intern the keys, so the tables of an array of tables share their key strings,
+                   or an interning.InternPool shared by the documents of a batch
+    :return: dictionary with the document contents
+    """
+    if lazy:
+        return LazyDocument(data if isinstance(data, str) else str(data, 'utf-8'), typed, numeric_arrays, intern)
+    lexer_backend = 'ply' if isinstance(data, str) else 'bytes'
+    parser = Parser('json', builder=True, typed=typed, lexer_backend=lexer_backend, numeric_arrays=numeric_arrays,
+                    intern=intern)
+    return parser.parse_dict(data)
+
+
+def load(file, typed=False, lazy=False, numeric_arrays=None, intern=None):
+    """
+    Parses a TOML file into Python dictionaries and lists
+    :param file: path of the file, which is memory-mapped, or file object opened in text or binary mode
+    :param typed: return dates and times as datetime, date and time objects instead of strings
+    :param lazy: return a LazyDocument that translates the tables and arrays when they are read
+    :param numeric_arrays: see loads
+    :param intern: see loads
+    :return: dictionary with the document contents
+    """
+    if isinstance(file, (str, bytes, os.PathLike)):
+        with mapped(file) as data:
+            return loads(data, typed, lazy, numeric_arrays, intern)
+    return loads(file.read(), typed, lazy, numeric_arrays, intern)
+
+
+def to_json_lines(data, file, typed=False):
+    """
+    Translates a TOML document to JSON Lines: one record per table array item, written as soon
+    as the item is complete, then a header record with the rest of the document
+    :param data: TOML document as str, or as UTF-8 bytes or memory-mapped file
+    :param file: text file object the records are written to
+    :param typed: translate dates and times as with loads (written in ISO format)
+    """
+    lexer_backend = 'ply' if isinstance(data, str) else 'bytes'
+    parser = Parser('jsonl', builder=True, typed=typed, lexer_backend=lexer_backend)
+    parser.translation_unit.output = file
+    parser.translate(data)
+    parser.translation_unit.write_result(file)
@@ -1,12 +1,17 @@
+import datetime
 import json
-from translator_tomml import TranslatorUnit
-from array import Array
+from itertools import repeat
+from operator import attrgetter
+from translator_tomml import TranslatorUnit, register_translator
+from array_toml import Array
 from key_val import KeyVal
 from inline_table import InlineTable
 from table import Table
 from table_array import TableArray
 from key import Key
-from value import Value
+from numeric import pack_first, pack_next, packed, typed_buffer
+from value import Value, STRING, BOOLEAN, INTEGER, FLOAT, ARRAY, ML_STRING, INLINE_TABLE, OFFSET_DATE_TIME, \
+    LOCAL_DATE_TIME, LOCAL_DATE, LOCAL_TIME
 
 
 def get_dict(key_list, dict):
@@ -25,17 +30,125 @@ def get_dict(key_list, dict):
     return current_dict
 
 
+def to_datetime(text):
+    """
+    Converts an offset date-time, local date-time, local date or local time to its Python object
+    :param text: date/time as written in the TOML document
+    :return: datetime, date or time object
+    """
+    if len(text) == 8:
+        return datetime.time.fromisoformat(text)
+    if len(text) == 10:
+        return datetime.date.fromisoformat(text)
+    # fromisoformat doesn't accept Z before Python 3.11
+    if text[-1] in 'zZ':
+        text = text[:-1] + '+00:00'
+    return datetime.datetime.fromisoformat(text)
+
+
+# Offsets of UTC, whose date-times get the timezone.utc singleton from fromisoformat
+UTC_OFFSETS = frozenset(('Z', 'z', '+00:00', '-00:00'))
+
+# Time zones of the other offsets, created once and shared by every date-time with the same offset
+TIMEZONES = {}
+
+parse_datetime = datetime.datetime.fromisoformat
+parse_date = datetime.date.fromisoformat
+parse_time = datetime.time.fromisoformat
+combine = datetime.datetime.combine
+
+
+def get_timezone(offset):
+    """
+    Returns the shared time zone of an offset
+    :param offset: [+-]HH:MM
+    """
+    timezone = TIMEZONES.get(offset)
+    if timezone is None:
+        delta = datetime.timedelta(hours=int(offset[1:3]), minutes=int(offset[4:6]))
+        timezone = TIMEZONES[offset] = datetime.timezone(-delta if offset[0] == '-' else delta)
+    return timezone
+
+
+def to_offset_date_time(text):
+    """
+    Converts an offset date-time token to an aware datetime
+    The lexer only accepts YYYY-MM-DD?HH:MM:SS followed by the offset, so the offset starts at 19.
+    UTC, the usual offset of logs, takes the fastest path; the other offsets get their shared
+    time zone instead of a new one per value, which halves the memory of the values.
+    """
+    offset = text[19:]
+    if offset in UTC_OFFSETS:
+        return parse_datetime(text[:19] + '+00:00')
+    return combine(parse_date(text[:10]), parse_time(text[11:19]), get_timezone(offset))
+
+
+def datetime_to_json(value):
+    """
+    Serializes the date/time objects of a typed translation back to their ISO format,
+    and the typed buffers of numeric arrays to lists
+    """
+    if isinstance(value, (datetime.datetime, datetime.date, datetime.time)):
+        return value.isoformat()
+    if hasattr(value, 'tolist'):
+        return value.tolist()
+    raise TypeError(f'Object of type {type(value).__name__} is not JSON serializable')
+
+
 def escape_newlines(ml_string):
-    chunks = ml_string.split('\n')
-    if len(chunks) > 1:
-        return ''.join([chunk + '\n' for chunk in chunks])
+    # Same result as appending a newline to every line, without splitting the string
+    if '\n' in ml_string:
+        return ml_string + '\n'
     return ml_string
 
 
+get_type = attrgetter('type')
+get_value = attrgetter('value')
+get_key_text = attrgetter('value.value')
+
+
+def to_integer(text):
+    return int(text, 0)
+
+
+# Converters from the text of a scalar value to its Python object, by value type
+# Types without a converter (strings, and dates unless typed) are kept as text
+CONVERTERS = {
+    BOOLEAN: 'true'.__eq__,
+    INTEGER: to_integer,
+    FLOAT: float,
+    ML_STRING: escape_newlines,
+}
+
+# Converters of the dates and times, used when the translation is typed
+TYPED_CONVERTERS = {
+    OFFSET_DATE_TIME: to_offset_date_time,
+    LOCAL_DATE_TIME: parse_datetime,
+    LOCAL_DATE: parse_date,
+    LOCAL_TIME: parse_time,
+}
+
+
 class JSONTranslator(TranslatorUnit):
-    def __init__(self):
+    def __init__(self, typed=False):
+        """
+        :param typed: translate dates and times to datetime, date and time objects instead of strings
+        """
         super().__init__()
+        self.typed = typed
 
+        self.converters = dict(CONVERTERS)
+        self.converters[ARRAY] = self.translate_array
+        self.converters[INLINE_TABLE] = self.inline_table
+        if typed:
+            self.converters.update(TYPED_CONVERTERS)
+
+        self.reset()
+
+    def reset(self):
+        """
+        Discards the result of the previous translation so the translator can be reused
+        """
         self.tables = {}
         self.current_dict = self.tables
 
@@ -43,6 +156,9 @@ class JSONTranslator(TranslatorUnit):
         self.current_table_array = self.table_arrays
         self.current_array = None
 
+        # (root dict, key path, dict at the end of the path) of the last dotted key prefix
+        self.last_prefix = (None, None, None)
+
     def translate(self, list_):
         for node in list_:
             if isinstance(node, KeyVal):
@@ -52,44 +168,157 @@ class JSONTranslator(TranslatorUnit):
             elif isinstance(node, TableArray):
                 self.table_array(node)
 
+    def build(self, node):
+        """
+        Applies a single node whose values are already translated
+        Used by the parser in builder mode, where nodes are applied as soon as they are reduced
+        :param node: KeyVal, Table or TableArray object
+        """
+        if isinstance(node, KeyVal):
+            self.set_value(node.key_list, node.value)
+        elif isinstance(node, Table):
+            self.table(node)
+        elif isinstance(node, TableArray):
+            self.table_array(node)
+
     def key_val(self, key_val: KeyVal):
         """
         Adds a key-value pair to the current dictionary
         :param key_val: KeyVal object that contains a list of keys and a value
         """
-        translated_keys = [self.translate_key(key) for key in key_val.key_list]
-        translated_value = self.translate_value(key_val.value)
-        last_key = translated_keys[-1]
-        key_path = translated_keys[:-1]
+        self.set_value(key_val.key_list, self.translate_value(key_val.value))
+
+    def set_value(self, key_list, translated_value):
+        """
+        Stores an already translated value in the current dictionary
+        :param key_list: list of keys, the last one names the value
+        :param translated_value: value to store
+        """
+        self.store(self.translate_keys(key_list), translated_value)
 
-        current_dict = get_dict(key_path, self.current_dict)
+    def store(self, translated_keys, translated_value):
+        """
+        Same as set_value, with the keys already translated
+        """
+        last_key = translated_keys[-1]
+        current_dict = self.current_dict
+        if len(translated_keys) > 1:
+            current_dict = self.resolve_prefix(translated_keys[:-1], current_dict)
+        if type(current_dict.get(last_key)) is dict:
+            # a table is replaced, the cached prefix may lead through it
+            self.last_prefix = (None, None, None)
         current_dict[last_key] = translated_value
 
+    def resolve_prefix(self, key_path, root):
+        """
+        Same as get_dict(key_path, root), but the dotted keys following each other under the same
+        prefix, like server.pool.size and server.pool.timeout, resolve it with a single comparison
+        :param key_path: list of keys
+        :param root: dictionary to start from
+        :return: dictionary at the end of the key_path
+        """
+        last_root, last_path, table = self.last_prefix
+        if root is last_root and key_path == last_path:
+            return table
+        table = get_dict(key_path, root)
+        self.last_prefix = (root, key_path, table)
+        return table
+
     def table(self, table: Table):
-        translated_keys = [self.translate_key(key) for key in table.key_list]
+        self.open_table(self.translate_keys(table.key_list))
+
+    def open_table(self, translated_keys):
+        """
+        Makes the table at the end of a path of translated keys the current dictionary
+        """
         self.current_dict = get_dict(translated_keys, self.tables)
 
     def translate_key(self, key: Key):
-        return self.translate_value(key.value)
+        # Keys are always strings, even bare keys made of digits
+        return key.value.value
 
-    def translate_value(self, value: Value):
-        if value.type == 'boolean':
-            return True if value.value == 'true' else False
-        elif value.type == 'integer':
-            return int(value.value, 0)
-        elif value.type == 'float':
-            return float(value.value)
-        elif value.type == 'array':
-            return self.translate_array(value.value)
-        elif value.type == 'ml_string':
-            return escape_newlines(value.value)
-        elif value.type == 'inline_table':
-            return self.inline_table(value.value)
+    def translate_keys(self, key_list):
+        keys = list(map(get_key_text, key_list))
+        if self.intern_pool is not None:
+            return self.intern_pool.keys(keys)
+        return keys
+
+    def set_intern_pool(self, pool):
+        """
+        Interns the keys, and the string values if the pool interns them, with pool
+        :param pool: InternPool, or None to stop interning
+        """
+        self.intern_pool = pool
+        if pool is not None and pool.strings:
+            self.converters[STRING] = pool.string
         else:
-            return value.value
+            self.converters.pop(STRING, None)
+
+    def translate_value(self, value: Value):
+        return self.convert(value.type, value.value)
+
+    def convert(self, type_, value):
+        """
+        Converts the contents of a value node, looking its converter up by type
+        :param type_: value type
+        :param value: text of a scalar, Array or InlineTable
+        """
+        converter = self.converters.get(type_)
+        if converter is None:
+            return value
+        return converter(value)
 
     def translate_array(self, array: Array):
-        return [self.translate_value(value) for value in array.value_list]
+        value_list = array.value_list
+        if not value_list:
+            return []
+
+        types = set(map(get_type, value_list))
+        if len(types) > 1:
+            return [self.translate_value(value) for value in value_list]
+
+        # Homogeneous array, converted in a single pass without a lookup per element
+        type_ = types.pop()
+        values = list(map(get_value, value_list))
+        if self.numeric_arrays is not None and (type_ == INTEGER or type_ == FLOAT):
+            # packed straight from the token texts, without a list of Python numbers
+            try:
+                if type_ == INTEGER:
+                    return typed_buffer(map(int, values, repeat(0, len(values))), 'q', self.numeric_arrays)
+                return typed_buffer(map(float, values), 'd', self.numeric_arrays)
+            except OverflowError:
+                pass
+        if type_ == INTEGER:
+            return list(map(int, values, repeat(0, len(values))))
+        converter = self.converters.get(type_)
+        if converter is None:
+            return values
+        return list(map(converter, values))
+
+    def build_array(self, values):
+        """
+        Returns the translation of an array whose values are already translated
+        :param values: list of translated values, or in numeric array mode the buffer or list
+                       collected by start_array and extend_array
+        """
+        if self.numeric_arrays is None:
+            return values
+        return packed(values, self.numeric_arrays)
+
+    def start_array(self, value):
+        """
+        Starts collecting the translated values of an array in numeric array mode,
+        where integers and floats are packed into a typed buffer as they are reduced
+        :param value: first translated value
+        """
+        return pack_first(value)
+
+    def extend_array(self, values, value):
+        """
+        Adds the next translated value of an array to the values started by start_array
+        :return: the buffer or list holding the values
+        """
+        return pack_next(values, value)
 
     def inline_table(self, table: InlineTable):
         # save current dict
@@ -107,9 +336,30 @@ class JSONTranslator(TranslatorUnit):
 
         return inline
 
+    def build_inline_table(self, expression_list):
+        """
+        Returns the dictionary of an inline table whose values are already translated
+        :param expression_list: expressions inside the inline table
+        """
+        old_dict = self.current_dict
+        self.current_dict = {}
+
+        for node in expression_list:
+            self.build(node)
+
+        inline = self.current_dict
+        self.current_dict = old_dict
+
+        return inline
+
     def table_array(self, table_array: TableArray):
-        translated_keys = [self.translate_key(key) for key in table_array.key_list]
+        self.open_table_array(self.translate_keys(table_array.key_list))
 
+    def open_table_array(self, translated_keys):
+        """
+        Appends a new table to the table array at the end of a path of translated keys
+        and makes it the current dictionary
+        """
         last_key = translated_keys[-1]
         key_path = translated_keys[:-1]
 
@@ -122,5 +372,70 @@ class JSONTranslator(TranslatorUnit):
         self.current_array = self.current_table_array[last_key]
         self.current_array.append(self.current_dict)
 
+    def get_dict(self):
+        """
+        Returns the translated document as nested Python dictionaries and lists
+        """
+        return {**self.tables, **self.table_arrays}
+
+    def items(self):
+        """
+        Yields the top-level items of the translated document in the same order as get_dict,
+        without merging the tables and table arrays into a new dictionary
+        """
+        for key, value in self.tables.items():
+            yield key, self.table_arrays.get(key, value)
+        for key, value in self.table_arrays.items():
+            if key not in self.tables:
+                yield key, value
+
+    def write_result(self, file, indent=4, separators=None, chunk_size=65536):
+        """
+        Writes the translated document as JSON to a file object, chunk by chunk
+        Neither the merged document nor the whole JSON string are built in memory
+        :param file: text file object
+        :param indent: indentation of nested values, None for a single line
+        :param separators: (item, key) separators, e.g. (',', ':') for compact output
+        :param chunk_size: number of characters buffered before each write
+        """
+        encoder = json.JSONEncoder(indent=indent, separators=separators, ensure_ascii=False,
+                                   default=datetime_to_json)
+        if indent is None:
+            newline = ''
+        else:
+            newline = '\n' + (' ' * indent if isinstance(indent, int) else indent)
+
+        buffer = []
+        buffered = 0
+
+        def write(chunk):
+            nonlocal buffered
+            buffer.append(chunk)
+            buffered += len(chunk)
+            if buffered >= chunk_size:
+                file.write(''.join(buffer))
+                buffer.clear()
+                buffered = 0
+
+        write('{')
+        empty = True
+        for key, value in self.items():
+            if not empty:
+                write(encoder.item_separator)
+            empty = False
+            write(newline)
+            write(encoder.encode(key))
+            write(encoder.key_separator)
+            for chunk in encoder.iterencode(value):
+                # JSON strings never contain raw newlines, so this only indents the nested lines
+                write(chunk.replace('\n', newline) if newline else chunk)
+        if not empty and indent is not None:
+            write('\n')
+        write('}')
+        file.write(''.join(buffer))
+
     def get_result(self):
-        return json.dumps({**self.tables, **self.table_arrays}, indent=4, ensure_ascii=False)
+        return json.dumps(self.get_dict(), indent=4, ensure_ascii=False, default=datetime_to_json)
+
+
+register_translator('json', JSONTranslator)
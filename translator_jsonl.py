@@ -0,0 +1,89 @@
+import io
+import json
+from translator_json import JSONTranslator, datetime_to_json
+from translator_tomml import register_translator
+
+# Key of the record holding everything but the table array items
+HEADER = 'header'
+
+
+class JSONLinesTranslator(JSONTranslator):
+    """
+    JSONLinesTranslator class
+    Translates a document to JSON Lines, one record per table array item:
+    {"path": ["records"], "item": {...}}
+    followed by a header record with the rest of the document (top-level keys and tables):
+    {"header": {...}}
+    The header comes last because tables may be defined after the table arrays.
+    When output is set, each item is written and forgotten as soon as the next header
+    shows it is complete, so the items are never all held in memory.
+    """
+    def __init__(self, typed=False, output=None):
+        """
+        :param typed: translate dates and times to datetime, date and time objects instead of strings
+        :param output: text file object the items are written to while the document is translated,
+                       None to keep them until write_result
+        """
+        self.output = output
+        self.encoder = json.JSONEncoder(ensure_ascii=False, separators=(',', ':'), default=datetime_to_json)
+        super().__init__(typed)
+
+    def reset(self):
+        super().reset()
+        # (path, table array) of the item being filled
+        self.open_item = None
+
+    def __repr__(self):
+        return f'JSONLinesTranslator: streaming to {self.output!r}'
+
+    def open_table(self, translated_keys):
+        self.flush()
+        super().open_table(translated_keys)
+
+    def open_table_array(self, translated_keys):
+        self.flush()
+        super().open_table_array(translated_keys)
+        self.open_item = (translated_keys, self.current_array)
+
+    def flush(self):
+        """
+        Writes the item being filled to output, if any, and removes it from its table array
+        """
+        if self.output is None or self.open_item is None:
+            return
+        path, table_array = self.open_item
+        self.output.write(self.record(path, table_array.pop()))
+        self.open_item = None
+
+    def record(self, path, item):
+        return '{"path":' + self.encoder.encode(path) + ',"item":' + self.encoder.encode(item) + '}\n'
+
+    def write_result(self, file):
+        """
+        Writes the items that haven't been written yet, then the header record
+        :param file: text file object
+        """
+        if file is self.output:
+            self.flush()
+        else:
+            self.write_items(file, [], self.table_arrays)
+        file.write('{"' + HEADER + '":' + self.encoder.encode(self.tables) + '}\n')
+
+    def write_items(self, file, path, node):
+        """
+        Writes the items of the table arrays found under node, depth first
+        """
+        for key, value in node.items():
+            if isinstance(value, dict):
+                self.write_items(file, path + [key], value)
+            elif isinstance(value, list):
+                for item in value:
+                    file.write(self.record(path + [key], item))
+
+    def get_result(self):
+        file = io.StringIO()
+        self.write_result(file)
+        return file.getvalue()
+
+
+register_translator('jsonl', JSONLinesTranslator)
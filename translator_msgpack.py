@@ -0,0 +1,210 @@
+import datetime
+import struct
+from translator_json import JSONTranslator
+from translator_tomml import register_translator
+
+# Number of bytes buffered before each write of write_result
+CHUNK_SIZE = 65536
+
+pack_float = struct.Struct('>Bd').pack
+unpack_float = struct.Struct('>d').unpack_from
+
+# (header byte, struct format, limit) of the unsigned and signed integer encodings, smallest first
+UNSIGNED_INTEGERS = ((0xcc, '>BB', 0xff), (0xcd, '>BH', 0xffff), (0xce, '>BI', 0xffffffff),
+                     (0xcf, '>BQ', 0xffffffffffffffff))
+SIGNED_INTEGERS = ((0xd0, '>Bb', -0x80), (0xd1, '>Bh', -0x8000), (0xd2, '>Bi', -0x80000000),
+                   (0xd3, '>Bq', -0x8000000000000000))
+# Integer encodings by header byte, for decoding
+INTEGER_STRUCTS = {header: struct.Struct('>' + format_[2])
+                   for header, format_, _ in UNSIGNED_INTEGERS + SIGNED_INTEGERS}
+
+
+def pack_integer(value, buffer):
+    if 0 <= value < 0x80:
+        buffer.append(value)
+    elif -0x20 <= value < 0:
+        buffer.append(value & 0xff)
+    elif value > 0:
+        for header, format_, maximum in UNSIGNED_INTEGERS:
+            if value <= maximum:
+                buffer += struct.pack(format_, header, value)
+                return
+        raise OverflowError(f'Integer {value} does not fit in 64 bits')
+    else:
+        for header, format_, minimum in SIGNED_INTEGERS:
+            if value >= minimum:
+                buffer += struct.pack(format_, header, value)
+                return
+        raise OverflowError(f'Integer {value} does not fit in 64 bits')
+
+
+def pack_length(length, fix, fix_limit, header16, buffer):
+    """
+    Writes the header of a string, array or map of the given length
+    """
+    if length < fix_limit:
+        buffer.append(fix | length)
+    elif length <= 0xffff:
+        buffer += struct.pack('>BH', header16, length)
+    else:
+        buffer += struct.pack('>BI', header16 + 1, length)
+
+
+def pack_string(value, buffer):
+    data = value.encode('utf-8')
+    length = len(data)
+    if length < 32:
+        buffer.append(0xa0 | length)
+    elif length <= 0xff:
+        buffer.append(0xd9)
+        buffer.append(length)
+    else:
+        pack_length(length, 0, 0, 0xda, buffer)
+    buffer += data
+
+
+def pack(value, buffer):
+    """
+    Appends the MessagePack encoding of a translated value to a bytearray
+    Dates and times are encoded as their ISO format strings, numeric typed buffers as arrays
+    :param value: None, bool, int, float, str, list, dict, date/time object, or array.array/NumPy array
+    :param buffer: bytearray
+    """
+    type_ = type(value)
+    if type_ is str:
+        pack_string(value, buffer)
+    elif type_ is int:
+        pack_integer(value, buffer)
+    elif type_ is dict:
+        pack_length(len(value), 0x80, 16, 0xde, buffer)
+        for key, item in value.items():
+            pack_string(key, buffer)
+            pack(item, buffer)
+    elif type_ is list:
+        pack_length(len(value), 0x90, 16, 0xdc, buffer)
+        for item in value:
+            pack(item, buffer)
+    elif type_ is bool:
+        buffer.append(0xc3 if value else 0xc2)
+    elif type_ is float:
+        buffer += pack_float(0xcb, value)
+    elif value is None:
+        buffer.append(0xc0)
+    elif isinstance(value, (datetime.datetime, datetime.date, datetime.time)):
+        pack_string(value.isoformat(), buffer)
+    elif hasattr(value, 'tolist'):
+        # typed buffer of a numeric array
+        pack(value.tolist(), buffer)
+    else:
+        raise TypeError(f'Object of type {type_.__name__} is not MessagePack serializable')
+
+
+def packb(value):
+    """
+    Returns the MessagePack encoding of a translated value
+    """
+    buffer = bytearray()
+    pack(value, buffer)
+    return bytes(buffer)
+
+
+def unpackb(data):
+    """
+    Decodes a MessagePack document made of the types written by pack
+    :param data: bytes
+    :return: decoded value
+    """
+    value, position = unpack(data, 0)
+    if position != len(data):
+        raise ValueError(f'Extra data after position {position}')
+    return value
+
+
+def unpack(data, position):
+    """
+    Decodes the value starting at position
+    :return: (value, position after the value)
+    """
+    byte = data[position]
+    position += 1
+    if byte < 0x80:
+        return byte, position
+    if byte >= 0xe0:
+        return byte - 0x100, position
+    if 0xa0 <= byte < 0xc0:
+        end = position + (byte & 0x1f)
+        return data[position:end].decode('utf-8'), end
+    if 0x90 <= byte < 0xa0:
+        return unpack_array(data, position, byte & 0x0f)
+    if 0x80 <= byte < 0x90:
+        return unpack_map(data, position, byte & 0x0f)
+    if byte == 0xc0:
+        return None, position
+    if byte == 0xc2 or byte == 0xc3:
+        return byte == 0xc3, position
+    if byte == 0xcb:
+        return unpack_float(data, position)[0], position + 8
+    if 0xcc <= byte <= 0xd3:
+        integer = INTEGER_STRUCTS[byte]
+        return integer.unpack_from(data, position)[0], position + integer.size
+    if byte == 0xd9 or byte == 0xda or byte == 0xdb:
+        size = (1, 2, 4)[byte - 0xd9]
+        length = int.from_bytes(data[position:position + size], 'big')
+        position += size
+        return data[position:position + length].decode('utf-8'), position + length
+    if byte == 0xdc or byte == 0xdd:
+        size = 2 if byte == 0xdc else 4
+        return unpack_array(data, position + size, int.from_bytes(data[position:position + size], 'big'))
+    if byte == 0xde or byte == 0xdf:
+        size = 2 if byte == 0xde else 4
+        return unpack_map(data, position + size, int.from_bytes(data[position:position + size], 'big'))
+    raise ValueError(f'Unsupported MessagePack type 0x{byte:02x} at position {position - 1}')
+
+
+def unpack_array(data, position, length):
+    array = []
+    for _ in range(length):
+        value, position = unpack(data, position)
+        array.append(value)
+    return array, position
+
+
+def unpack_map(data, position, length):
+    map_ = {}
+    for _ in range(length):
+        key, position = unpack(data, position)
+        map_[key], position = unpack(data, position)
+    return map_, position
+
+
+class MessagePackTranslator(JSONTranslator):
+    """
+    MessagePackTranslator class
+    Translates a document to MessagePack, a compact binary equivalent of JSON.
+    The tables are merged as by JSONTranslator, then encoded straight to bytes,
+    without building a JSON string.
+    """
+    binary = True
+
+    def write_result(self, file, chunk_size=CHUNK_SIZE):
+        """
+        Writes the translated document to a binary file object, top-level item by top-level item
+        :param file: binary file object
+        :param chunk_size: number of bytes buffered before each write
+        """
+        items = list(self.items())
+        buffer = bytearray()
+        pack_length(len(items), 0x80, 16, 0xde, buffer)
+        for key, value in items:
+            pack_string(key, buffer)
+            pack(value, buffer)
+            if len(buffer) >= chunk_size:
+                file.write(buffer)
+                buffer = bytearray()
+        file.write(buffer)
+
+    def get_result(self):
+        return packb(self.get_dict())
+
+
+register_translator('msgpack', MessagePackTranslator)
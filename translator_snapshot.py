@@ -0,0 +1,27 @@
+import io
+from snapshot import SnapshotWriter
+from translator_json import JSONTranslator
+from translator_tomml import register_translator
+
+
+class SnapshotTranslator(JSONTranslator):
+    """
+    SnapshotTranslator class
+    Compiles a document to a binary snapshot that snapshot.Snapshot loads lazily,
+    without lexing or parsing it again
+    """
+    binary = True
+
+    def write_result(self, file):
+        """
+        Writes the snapshot to a binary file object
+        """
+        SnapshotWriter().write(self.get_dict(), file)
+
+    def get_result(self):
+        file = io.BytesIO()
+        self.write_result(file)
+        return file.getvalue()
+
+
+register_translator('snapshot', SnapshotTranslator)
@@ -1,13 +1,59 @@
-from array import Array
+from array_toml import Array
 from key_val import KeyVal
 from inline_table import InlineTable
 from table import Table
 from table_array import TableArray
 from key import Key
-from value import Value
+from value import Value, ARRAY, INLINE_TABLE
+
+# Translation unit classes by output language, filled by register_translator
+TRANSLATORS = {}
+
+
+def register_translator(lang, translator_class):
+    """
+    Makes an output language available to Parser
+    :param lang: name of the output language, case insensitive
+    :param translator_class: TranslatorUnit subclass, called with the typed argument of Parser
+    """
+    TRANSLATORS[lang.lower()] = translator_class
+
+
+def get_translator(lang, typed=False):
+    """
+    Returns a new translation unit for an output language
+    :param lang: name of the output language, case insensitive
+    :param typed: translate dates and times to Python objects
+    :raises ValueError: if no translator is registered for the language
+    """
+    translator_class = TRANSLATORS.get(lang.lower())
+    if translator_class is None:
+        raise ValueError(f"Unsupported output language '{lang}', expected one of: {', '.join(sorted(TRANSLATORS))}")
+    return translator_class(typed)
 
 
 class TranslatorUnit:
+    # True if the result is bytes, to be written to a file opened in binary mode
+    binary = False
+    # Set by Parser, and left unused by the translators that don't support them:
+    # None for lists, or the numeric.NUMERIC_ARRAYS mode of the homogeneous integer and float arrays
+    numeric_arrays = None
+    # None, or the interning.InternPool of the keys and short string values
+    intern_pool = None
+
+    def __init__(self, typed=False):
+        """
+        :param typed: translate dates and times to Python objects
+        """
+        self.typed = typed
+
+    @classmethod
+    def reset(cls):
+        """
+        Discard the state left by a previous translation
+        """
+        pass
+
     @classmethod
     def translate(cls, list_):
         """
@@ -72,9 +118,77 @@ class TranslatorUnit:
         """
         pass
 
+    def set_intern_pool(self, pool):
+        """
+        Set the pool of interned strings, see interning.InternPool
+        :param pool: InternPool or None
+        """
+        self.intern_pool = pool
+
+    # Builder mode: the parser passes the values and expressions to these methods as soon as they
+    # are reduced. By default they make the same nodes as the AST mode and translate each
+    # expression on its own, so a translator implementing translate works in both modes.
+
+    def convert(self, type_, value):
+        """
+        Translate the contents of a value as soon as it is reduced
+        :param type_: value type
+        :param value: text of the value
+        """
+        return Value(type_, value)
+
+    def build_array(self, values):
+        """
+        Translate an array whose values were returned by convert, build_array and build_inline_table
+        :param values: list of values
+        """
+        return Value(ARRAY, Array(values))
+
+    def start_array(self, value):
+        """
+        Start collecting the values of an array, in numeric array mode
+        :param value: first value
+        """
+        return [value]
+
+    def extend_array(self, values, value):
+        """
+        Add the next value of an array to the values started by start_array
+        """
+        values.append(value)
+        return values
+
+    def build_inline_table(self, expression_list):
+        """
+        Translate an inline table whose expressions were built from translated values
+        :param expression_list: expressions inside the inline table
+        """
+        return Value(INLINE_TABLE, InlineTable(expression_list))
+
+    def build(self, node):
+        """
+        Apply a top-level expression as soon as it is reduced
+        :param node: KeyVal, Table or TableArray object
+        """
+        self.translate([node])
+
+    @classmethod
+    def get_dict(cls):
+        """
+        Get the result of the translation as Python objects
+        """
+        pass
+
     @classmethod
     def get_result(cls):
         """
         Get the result of the translation
         """
         pass
+
+    def write_result(self, file):
+        """
+        Write the result of the translation to a file object
+        :param file: text file object, or binary file object if binary is True
+        """
+        file.write(self.get_result())
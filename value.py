@@ -1,9 +1,26 @@
+# Value types
+# Every node refers to one of these shared strings instead of holding its own
+STRING = 'string'
+ML_STRING = 'ml_string'
+BOOLEAN = 'boolean'
+OFFSET_DATE_TIME = 'offset_date_time'
+LOCAL_DATE_TIME = 'local_date_time'
+LOCAL_DATE = 'local_date'
+LOCAL_TIME = 'local_time'
+INTEGER = 'integer'
+FLOAT = 'float'
+ARRAY = 'array'
+INLINE_TABLE = 'inline_table'
+
+
 class Value:
     """
     Value class
     Contains a type and a value
     Example: Value: type:integer value:1
     """
+    __slots__ = ('type', 'value')
+
     def __init__(self, type_, value):
         self.type = type_
         self.value = value
@@ -0,0 +1,19 @@
+# Parser of the current worker process, built once by init_worker
+_parser = None
+
+
+def init_worker(factory):
+    """
+    Builds the parser reused by every job run in this worker process
+    Given as the initializer of a ProcessPoolExecutor, with (factory,) as initargs
+    :param factory: picklable callable returning the parser, e.g. functools.partial(Parser, 'json', builder=True)
+    """
+    global _parser
+    _parser = factory()
+
+
+def worker_parser():
+    """
+    Returns the parser built by init_worker in this process, None outside of a worker
+    """
+    return _parser